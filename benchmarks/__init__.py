@@ -0,0 +1,19 @@
+""" Benchmarks for composable, see `python -m benchmarks --help`."""
+from importlib import import_module
+
+MODULES = ('bench_pipeable',
+           'bench_strict',
+           'bench_records',
+           'bench_origami',
+           'bench_string',
+           'bench_maybe',
+           'bench_glob',
+           'bench_object',
+           'bench_cache',
+          )
+
+
+def load_all():
+    """ Import every benchmark module so that its benchmarks are registered."""
+    for name in MODULES:
+        import_module(f'{__name__}.{name}')
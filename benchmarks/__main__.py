@@ -0,0 +1,52 @@
+""" Run the composable benchmark suite.
+
+Usage (from the repository root):
+
+    $ python -m benchmarks --sizes 1000 10000 100000 --output results.json
+    $ python -m benchmarks --filter records. --compare results.json --threshold 1.2
+
+The exit status is 1 when `--compare` finds a benchmark that is slower than the
+baseline by more than `--threshold`.
+"""
+import argparse
+import json
+import sys
+
+from .harness import run, to_json, compare, format_result
+from . import load_all
+
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(prog = 'python -m benchmarks', description = __doc__.splitlines()[1])
+    parser.add_argument('--sizes', type = lambda s: int(float(s)), nargs = '+', default = [1_000, 10_000, 100_000],
+                        help = 'Data sizes, e.g. 1e3 1e5 1e7 [default: 1e3 1e4 1e5]')
+    parser.add_argument('--repeat', type = int, default = 5, help = 'Timings per benchmark, the best is reported')
+    parser.add_argument('--filter', dest = 'pattern', default = None, help = 'Only run benchmarks whose name contains this')
+    parser.add_argument('--output', default = None, help = 'Write the results as JSON to this file')
+    parser.add_argument('--compare', default = None, help = 'Baseline JSON file to check for regressions')
+    parser.add_argument('--threshold', type = float, default = 1.25,
+                        help = 'Maximum allowed slowdown ratio against the baseline [default: 1.25]')
+    parser.add_argument('--quiet', action = 'store_true', help = 'Do not print results as they are measured')
+    args = parser.parse_args(argv)
+
+    load_all()
+    report = None if args.quiet else (lambda r: print(format_result(r), flush = True))
+    results = run(args.sizes, pattern = args.pattern, repeat = args.repeat, report = report)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(to_json(results), f, indent = 2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, threshold = args.threshold)
+        for name, size, ratio in regressions:
+            print(f"REGRESSION {name} n={size}: {ratio:.2f}x slower than baseline", file = sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,39 @@
+from composable.cache import memoize
+from composable import strict
+from random import Random
+from .harness import benchmark
+
+
+def _parse(s):
+    return tuple(int(part) for part in s.split('.'))
+
+
+def _repeated(n):
+    # Mostly repeated values, as in log processing
+    rng = Random(n)
+    return [f"{rng.randrange(50)}.{rng.randrange(10)}.{rng.randrange(10)}" for _ in range(n)]
+
+
+@benchmark('cache.memoize.hit_heavy', group = 'cache')
+def memoize_hits(n):
+    L = _repeated(n)
+    parse = memoize(_parse, maxsize = 10_000)
+    return lambda: L >> strict.map(parse)
+
+
+@benchmark('cache.uncached', group = 'cache')
+def uncached(n):
+    L = _repeated(n)
+    return lambda: L >> strict.map(_parse)
+
+
+@benchmark('cache.disk_memoize.rerun', group = 'cache', max_size = 100_000)
+def disk_memoize_rerun(n):
+    import atexit, shutil, tempfile
+    from composable.diskcache import disk_memoize
+    directory = tempfile.mkdtemp(prefix = 'composable-bench-cache-')
+    atexit.register(shutil.rmtree, directory, True)
+    L = sorted(set(_repeated(n)))
+    parse = disk_memoize(_parse, directory)
+    L >> strict.map(parse)
+    return lambda: L >> strict.map(parse)
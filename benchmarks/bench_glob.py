@@ -0,0 +1,57 @@
+from composable.glob import glob, iglob, iglob_info, cached_glob, GlobCache
+from composable import strict
+from composable.sequence import to_list
+from .harness import benchmark
+import atexit
+import os
+import shutil
+import tempfile
+
+
+_trees = {}
+
+
+def _tree(n):
+    """ A temporary directory with n empty files spread over about sqrt(n) sub-directories."""
+    if n not in _trees:
+        root = tempfile.mkdtemp(prefix = 'composable-bench-glob-')
+        atexit.register(shutil.rmtree, root, True)
+        width = max(1, int(n ** 0.5))
+        for i in range(n):
+            d = os.path.join(root, f'd{i % width}')
+            os.makedirs(d, exist_ok = True)
+            open(os.path.join(d, f'f{i}.txt'), 'w').close()
+        _trees[n] = root
+    return _trees[n]
+
+
+@benchmark('glob.glob.recursive', group = 'glob', max_size = 10_000)
+def glob_recursive(n):
+    pattern = os.path.join(_tree(n), '**', '*.txt')
+    return lambda: pattern >> glob(recursive = True)
+
+
+@benchmark('glob.iglob.recursive', group = 'glob', max_size = 10_000)
+def iglob_recursive(n):
+    pattern = os.path.join(_tree(n), '**', '*.txt')
+    return lambda: pattern >> iglob(recursive = True) >> to_list
+
+
+@benchmark('glob.iglob.workers', group = 'glob', max_size = 10_000)
+def iglob_workers(n):
+    pattern = os.path.join(_tree(n), '**', '*.txt')
+    return lambda: pattern >> iglob(recursive = True, workers = 4) >> to_list
+
+
+@benchmark('glob.iglob_info', group = 'glob', max_size = 10_000)
+def iglob_info_sizes(n):
+    pattern = os.path.join(_tree(n), '*', '*.txt')
+    return lambda: sum(pattern >> iglob_info() >> strict.map(lambda info: info.size))
+
+
+@benchmark('glob.cached_glob.hit', group = 'glob', max_size = 10_000)
+def cached_glob_hit(n):
+    pattern = os.path.join(_tree(n), '**', '*.txt')
+    cache = GlobCache()
+    pattern >> cached_glob(recursive = True, cache = cache)
+    return lambda: pattern >> cached_glob(recursive = True, cache = cache)
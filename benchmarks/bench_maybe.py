@@ -0,0 +1,71 @@
+from composable import maybe
+from composable import strict
+from .harness import benchmark
+
+
+def _optionals(n):
+    return [None if i % 3 == 0 else i for i in range(n)]
+
+
+def _maybes(n):
+    return _optionals(n) >> strict.map(maybe.maybe)
+
+
+@benchmark('maybe.maybe', group = 'maybe')
+def maybe_(n):
+    L = _optionals(n)
+    return lambda: L >> strict.map(maybe.maybe)
+
+
+@benchmark('maybe.unmaybe', group = 'maybe')
+def unmaybe(n):
+    L = _maybes(n)
+    return lambda: L >> strict.map(maybe.unmaybe)
+
+
+@benchmark('maybe.map', group = 'maybe')
+def map_(n):
+    L = _maybes(n)
+    return lambda: L >> strict.map(maybe.map(lambda x: x + 1))
+
+
+@benchmark('maybe.just_if', group = 'maybe')
+def just_if(n):
+    L = _maybes(n)
+    return lambda: L >> strict.map(maybe.just_if(lambda x: x % 2 == 0))
+
+
+@benchmark('maybe.try_', group = 'maybe')
+def try_(n):
+    L = _maybes(n)
+    return lambda: L >> strict.map(maybe.try_(lambda x: 1 / (x % 2)))
+
+
+@benchmark('maybe.is_just', group = 'maybe')
+def is_just(n):
+    L = _maybes(n)
+    return lambda: L >> strict.filter(maybe.is_just)
+
+
+@benchmark('maybe.is_nothing', group = 'maybe')
+def is_nothing(n):
+    L = _maybes(n)
+    return lambda: L >> strict.filter(maybe.is_nothing)
+
+
+@benchmark('maybe.map_many', group = 'maybe')
+def map_many(n):
+    L = _maybes(n)
+    return lambda: L >> maybe.map_many(lambda x: x + 1)
+
+
+@benchmark('maybe.filter_just', group = 'maybe')
+def filter_just(n):
+    L = _maybes(n)
+    return lambda: L >> maybe.filter_just
+
+
+@benchmark('maybe.unmaybe_many', group = 'maybe')
+def unmaybe_many(n):
+    L = _maybes(n)
+    return lambda: L >> maybe.unmaybe_many
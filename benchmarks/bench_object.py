@@ -0,0 +1,25 @@
+from composable.object import obj, attr
+from composable import strict
+from .harness import benchmark
+
+
+def _lines(n):
+    return [f"  Row {i},{i * 2}  " for i in range(n)]
+
+
+@benchmark('object.obj.chain', group = 'object')
+def obj_chain(n):
+    L = _lines(n)
+    return lambda: L >> strict.map(obj.strip().lower().split(','))
+
+
+@benchmark('object.obj.chain.lambda', group = 'object')
+def obj_chain_lambda(n):
+    L = _lines(n)
+    return lambda: L >> strict.map(lambda s: s.strip().lower().split(','))
+
+
+@benchmark('object.attr', group = 'object')
+def attr_(n):
+    L = [complex(i, 1) for i in range(n)]
+    return lambda: L >> strict.map(attr.imag)
@@ -0,0 +1,58 @@
+from composable import origami
+from operator import add
+from .harness import benchmark
+
+_empty = lambda s: s == 0
+_step = lambda s: (s, s - 1)
+_cumsum = lambda acc, x: (acc + x, acc + x)
+
+
+@benchmark('origami.fold', group = 'origami')
+def fold(n):
+    L = list(range(n))
+    return lambda: L >> origami.fold(add, 0)
+
+
+@benchmark('origami.reduce', group = 'origami')
+def reduce(n):
+    L = list(range(n))
+    return lambda: L >> origami.reduce(add)
+
+
+@benchmark('origami.unfoldl', group = 'origami')
+def unfoldl(n):
+    return lambda: n >> origami.unfoldl(_empty, _step)
+
+
+@benchmark('origami.unfoldr', group = 'origami')
+def unfoldr(n):
+    return lambda: n >> origami.unfoldr(_empty, _step)
+
+
+@benchmark('origami.unfoldl_iter', group = 'origami')
+def unfoldl_iter(n):
+    L = list(range(n))
+    return lambda: L >> origami.unfoldl_iter(_cumsum, 0)
+
+
+@benchmark('origami.unfoldr_iter', group = 'origami')
+def unfoldr_iter(n):
+    L = list(range(n))
+    return lambda: L >> origami.unfoldr_iter(_cumsum, 0)
+
+
+@benchmark('origami.iunfoldr', group = 'origami')
+def iunfoldr(n):
+    return lambda: list(n >> origami.iunfoldr(_empty, _step))
+
+
+@benchmark('origami.iunfoldr_iter', group = 'origami')
+def iunfoldr_iter(n):
+    L = list(range(n))
+    return lambda: list(L >> origami.iunfoldr_iter(_cumsum, 0))
+
+
+@benchmark('origami.scan', group = 'origami')
+def scan(n):
+    L = list(range(n))
+    return lambda: list(L >> origami.scan(add, 0))
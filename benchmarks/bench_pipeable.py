@@ -0,0 +1,50 @@
+""" Cost of `x >> f` compared with calling `f(x)` directly."""
+from composable.pipeable import pipeable, fast_pipeable
+from .harness import benchmark
+
+
+def _add(b, a):
+    return a + b
+
+
+curried = pipeable(_add)
+fast = fast_pipeable(_add)
+
+
+@benchmark('pipeable.direct_call', group = 'pipeable')
+def direct_call(n):
+    return lambda: [_add(1, x) for x in range(n)]
+
+
+@benchmark('pipeable.call', group = 'pipeable')
+def pipeable_call(n):
+    f = curried(1)
+    return lambda: [f(x) for x in range(n)]
+
+
+@benchmark('pipeable.pipe', group = 'pipeable')
+def pipeable_pipe(n):
+    f = curried(1)
+    return lambda: [x >> f for x in range(n)]
+
+
+@benchmark('pipeable.bind_and_pipe', group = 'pipeable')
+def pipeable_bind_and_pipe(n):
+    return lambda: [x >> curried(1) for x in range(n)]
+
+
+@benchmark('fast_pipeable.call', group = 'pipeable')
+def fast_pipeable_call(n):
+    f = fast(1)
+    return lambda: [f(x) for x in range(n)]
+
+
+@benchmark('fast_pipeable.pipe', group = 'pipeable')
+def fast_pipeable_pipe(n):
+    f = fast(1)
+    return lambda: [x >> f for x in range(n)]
+
+
+@benchmark('fast_pipeable.bind_and_pipe', group = 'pipeable')
+def fast_pipeable_bind_and_pipe(n):
+    return lambda: [x >> fast(1) for x in range(n)]
@@ -0,0 +1,191 @@
+from composable import records
+from composable.records import Record
+from composable import strict
+from random import Random
+from .harness import benchmark
+
+FIELDS = ('a', 'b', 'c', 'd', 'e', 'f', 'g', 'h')
+
+
+def _dicts(n, *, groups = 100):
+    rng = Random(n)
+    return [{k: rng.randrange(groups) for k in FIELDS} for _ in range(n)]
+
+
+def _records(n, **kwargs):
+    return [Record(**d) for d in _dicts(n, **kwargs)]
+
+
+@benchmark('records.create', group = 'records')
+def create(n):
+    L = list(range(n))
+    return lambda: L >> strict.map(records.create(x = abs, y = str))
+
+
+@benchmark('records.apply', group = 'records')
+def apply(n):
+    L = _records(n)
+    return lambda: L >> strict.map(records.apply(a = abs, b = str))
+
+
+@benchmark('records.map', group = 'records')
+def map_(n):
+    L = _records(n)
+    return lambda: L >> strict.map(records.map(abs))
+
+
+@benchmark('records.update', group = 'records')
+def update(n):
+    L = _records(n)
+    return lambda: L >> strict.map(records.update(x = lambda r: r.a + r.b, y = lambda r: r.c * 2))
+
+
+@benchmark('records.update.sequential', group = 'records')
+def update_sequential(n):
+    L = _records(n)
+    return lambda: L >> strict.map(records.update(x = lambda r: r.a + r.b,
+                                                  y = lambda r: r.x * 2,
+                                                  z = lambda r: r.y - r.c,
+                                                  sequential = True))
+
+
+@benchmark('records.update.sequential_dict', group = 'records')
+def update_sequential_dict(n):
+    L = _dicts(n)
+    return lambda: L >> strict.map(records.update(x = lambda r: r['a'] + r['b'],
+                                                  y = lambda r: r['x'] * 2,
+                                                  sequential = True))
+
+
+@benchmark('records.get', group = 'records')
+def get(n):
+    L = _records(n)
+    return lambda: L >> strict.map(records.get(['a', 'c', 'e']))
+
+
+@benchmark('records.subset', group = 'records')
+def subset(n):
+    L = _records(n)
+    return lambda: L >> strict.map(records.subset(['a', 'c', 'e']))
+
+
+@benchmark('records.drop', group = 'records')
+def drop(n):
+    L = _records(n)
+    return lambda: L >> strict.map(records.drop(['a', 'c', 'e']))
+
+
+@benchmark('records.zip', group = 'records')
+def zip_(n):
+    L = _dicts(n)
+    return lambda: L >> records.zip()
+
+
+@benchmark('records.zip_at', group = 'records')
+def zip_at(n):
+    L = _dicts(n)
+    return lambda: L >> records.zip_at(['a', 'b'])
+
+
+@benchmark('records.heads', group = 'records')
+def heads(n):
+    rec = Record(x = list(range(n)), y = tuple(range(n)), z = 1)
+    return lambda: [rec >> records.heads(3) for _ in range(n)]
+
+
+@benchmark('records.group_by', group = 'records')
+def group_by(n):
+    L = _dicts(n)
+    return lambda: L >> records.group_by('a')
+
+
+@benchmark('records.group_agg', group = 'records')
+def group_agg(n):
+    L = _dicts(n)
+    return lambda: L >> records.group_agg('a',
+                                          n = records.agg_count(),
+                                          total = records.agg_sum('b'),
+                                          avg = records.agg_mean('c'),
+                                          hi = records.agg_max('d'))
+
+
+@benchmark('records.table.from_records', group = 'records')
+def table_from_records(n):
+    L = _dicts(n)
+    return lambda: L >> records.to_table
+
+
+@benchmark('records.table.update', group = 'records')
+def table_update(n):
+    t = records.Table.from_records(_dicts(n))
+    return lambda: t >> records.update(x = lambda t: t.a + t.b, y = lambda t: t.c * 2)
+
+
+@benchmark('records.table.group_by', group = 'records')
+def table_group_by(n):
+    t = records.Table.from_records(_dicts(n))
+    return lambda: t >> records.group_by('a')
+
+
+@benchmark('records.schema.map', group = 'records')
+def schema_map(n):
+    cls = records.schema(*FIELDS)
+    L = [cls(**d) for d in _dicts(n)]
+    return lambda: L >> strict.map(records.map(abs))
+
+
+@benchmark('records.schema.update.sequential', group = 'records')
+def schema_update_sequential(n):
+    cls = records.schema(*FIELDS)
+    L = [cls(**d) for d in _dicts(n)]
+    return lambda: L >> strict.map(records.update(x = lambda r: r.a + r.b,
+                                                  y = lambda r: r.x * 2,
+                                                  z = lambda r: r.y - r.c,
+                                                  sequential = True))
+
+
+@benchmark('records.update.transient', group = 'records')
+def update_transient(n):
+    L = _records(n)
+    return lambda: L >> strict.map(records.update(x = lambda r: r.a + r.b,
+                                                  y = lambda r: r.x * 2,
+                                                  z = lambda r: r.y - r.c,
+                                                  transient = True))
+
+
+@benchmark('records.update.plan', group = 'records')
+def update_plan(n):
+    L = _records(n)
+    plan = records.UpdatePlan(x = lambda r: r.a + r.b,
+                              y = lambda r: r.x * 2,
+                              z = lambda r: r.y - r.c)
+    return lambda: L >> strict.map(plan)
+
+
+WIDE = tuple(f'f{i}' for i in range(50))
+WIDE_KEYS = ['f3', 'f17', 'f25', 'f40', 'f49']
+
+
+def _wide_records(n):
+    return [Record(**{k: i for k in WIDE}) for i in range(n)]
+
+
+@benchmark('records.subset.wide', group = 'records')
+def subset_wide(n):
+    L = _wide_records(n)
+    return lambda: L >> strict.map(records.subset(WIDE_KEYS))
+
+
+@benchmark('records.subset.wide_precompiled', group = 'records')
+def subset_wide_precompiled(n):
+    L = _wide_records(n)
+    keys = records.compile_keys(WIDE_KEYS)
+    return lambda: L >> strict.map(records.subset(keys))
+
+
+@benchmark('records.subset.wide_list_scan', group = 'records')
+def subset_wide_list_scan(n):
+    # The previous implementation, kept as a reference point for the selectors
+    L = _wide_records(n)
+    scan = lambda r: Record(**{k: v for k, v in r.items() if k in WIDE_KEYS})
+    return lambda: L >> strict.map(scan)
@@ -0,0 +1,104 @@
+from composable import strict
+from operator import add
+from random import Random
+from composable._numpy import np
+from .harness import benchmark
+
+
+def _ints(n):
+    rng = Random(n)
+    return [rng.randrange(n) for _ in range(n)]
+
+
+@benchmark('strict.map', group = 'strict')
+def map_(n):
+    L = _ints(n)
+    return lambda: L >> strict.map(abs)
+
+
+@benchmark('strict.sorted', group = 'strict')
+def sorted_(n):
+    L = _ints(n)
+    return lambda: L >> strict.sorted(reverse = True)
+
+
+@benchmark('strict.star_map', group = 'strict')
+def star_map(n):
+    L = list(zip(_ints(n), _ints(n)))
+    return lambda: L >> strict.star_map(add)
+
+
+@benchmark('strict.filter', group = 'strict')
+def filter_(n):
+    L = _ints(n)
+    return lambda: L >> strict.filter(lambda x: x % 2 == 1)
+
+
+@benchmark('strict.zipWith', group = 'strict')
+def zip_with(n):
+    L, M = _ints(n), _ints(n)
+    return lambda: L >> strict.zipWith(M)
+
+
+@benchmark('strict.zipOnto', group = 'strict')
+def zip_onto(n):
+    L, M = _ints(n), _ints(n)
+    return lambda: L >> strict.zipOnto(M)
+
+
+@benchmark('strict.enumerate', group = 'strict')
+def enumerate_(n):
+    L = _ints(n)
+    return lambda: L >> strict.enumerate
+
+
+@benchmark('strict.split_by', group = 'strict')
+def split_by(n):
+    L = _ints(n)
+    funcs = [abs, str, float]
+    return lambda: L >> strict.map(strict.split_by(funcs))
+
+
+@benchmark('strict.filter.predicate_range', group = 'strict')
+def filter_predicate_range(n):
+    from composable.operator import is_gt, is_lt
+    L = _ints(n)
+    p = is_gt(n // 4) & is_lt(n // 2)
+    return lambda: L >> strict.filter(p)
+
+
+@benchmark('strict.filter.lambda_range', group = 'strict')
+def filter_lambda_range(n):
+    L = _ints(n)
+    lo, hi = n // 4, n // 2
+    return lambda: L >> strict.filter(lambda x: lo < x < hi)
+
+
+if np is not None:
+    from composable.operator import is_gt, is_lt
+
+    @benchmark('strict.numpy.map_ufunc', group = 'strict')
+    def map_numpy_ufunc(n):
+        arr = np.arange(n, dtype = float)
+        return lambda: arr >> strict.map(np.sqrt)
+
+    @benchmark('strict.numpy.map_elementwise', group = 'strict')
+    def map_numpy_elementwise(n):
+        arr = np.arange(n, dtype = float)
+        return lambda: arr >> strict.map(lambda x: np.sqrt(x))
+
+    @benchmark('strict.numpy.filter_mask', group = 'strict')
+    def filter_numpy_mask(n):
+        arr = np.arange(n) - n // 2
+        return lambda: arr >> strict.filter(is_gt(0))
+
+    @benchmark('strict.numpy.filter_elementwise', group = 'strict')
+    def filter_numpy_elementwise(n):
+        arr = np.arange(n) - n // 2
+        return lambda: arr >> strict.filter(lambda x: x > 0)
+
+    @benchmark('strict.numpy.filter_predicate_range', group = 'strict')
+    def filter_numpy_predicate_range(n):
+        arr = np.arange(n)
+        p = is_gt(n // 4) & is_lt(n // 2)
+        return lambda: arr >> strict.filter(p)
@@ -0,0 +1,55 @@
+from composable import string
+from composable import strict
+from .harness import benchmark
+
+
+def _lines(n):
+    return [f"{i},{i * 2}\t{i % 7}, tail" for i in range(n)]
+
+
+@benchmark('string.split', group = 'string')
+def split(n):
+    L = _lines(n)
+    return lambda: L >> strict.map(string.split(','))
+
+
+@benchmark('string.split_re', group = 'string')
+def split_re(n):
+    L = _lines(n)
+    return lambda: L >> strict.map(string.split_re('(,|\t)'))
+
+
+@benchmark('string.replace', group = 'string')
+def replace(n):
+    L = _lines(n)
+    return lambda: L >> strict.map(string.replace(',', ';'))
+
+
+@benchmark('string.startswith', group = 'string')
+def startswith(n):
+    L = _lines(n)
+    return lambda: L >> strict.map(string.startswith('1'))
+
+
+@benchmark('string.join', group = 'string')
+def join(n):
+    L = _lines(n)
+    return lambda: L >> string.join('\n')
+
+
+@benchmark('string.sub_re', group = 'string')
+def sub_re(n):
+    L = _lines(n)
+    return lambda: L >> strict.map(string.sub_re('[0-9]+', '#'))
+
+
+@benchmark('string.sub_re_many', group = 'string')
+def sub_re_many(n):
+    L = _lines(n)
+    return lambda: L >> string.sub_re_many('[0-9]+', '#')
+
+
+@benchmark('string.findall_re_many', group = 'string')
+def findall_re_many(n):
+    L = _lines(n)
+    return lambda: L >> string.findall_re_many('[0-9]+')
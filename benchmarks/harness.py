@@ -0,0 +1,102 @@
+""" Registry, timing and reporting for the composable benchmarks.
+
+Benchmarks are registered with the `benchmark` decorator.  The decorated function
+receives the data size `n` and returns a zero-argument callable that performs the
+work being measured; any setup (building the input data) happens before it returns.
+"""
+from dataclasses import dataclass, asdict
+from typing import Callable, Optional
+import platform
+import sys
+import timeit
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    name: str
+    group: str
+    setup: Callable[[int], Callable[[], object]]
+    max_size: Optional[int] = None
+
+
+@dataclass
+class Result:
+    name: str
+    group: str
+    size: int
+    best: float
+    mean: float
+    per_item: float
+
+
+BENCHMARKS: dict[str, Benchmark] = {}
+
+
+def benchmark(name, *, group, max_size = None):
+    """ Register a benchmark setup function under `name`.
+
+    Args.
+        - name: Unique name, by convention `<module>.<function>[.<variant>]`.
+        - group: The composable module (or area) being measured.
+        - max_size: Skip the benchmark for larger sizes, e.g. for quadratic algorithms.
+    """
+    def register(setup):
+        assert name not in BENCHMARKS, f"Duplicate benchmark name: {name}"
+        BENCHMARKS[name] = Benchmark(name, group, setup, max_size)
+        return setup
+    return register
+
+
+def run_one(bench, size, *, repeat = 5):
+    """ Time a single benchmark at one size, returning a `Result` (or None if skipped)."""
+    if bench.max_size is not None and size > bench.max_size:
+        return None
+    work = bench.setup(size)
+    times = timeit.Timer(work).repeat(repeat = repeat, number = 1)
+    best = min(times)
+    return Result(bench.name, bench.group, size, best, sum(times) / len(times), best / size)
+
+
+def run(sizes, *, pattern = None, repeat = 5, report = None):
+    """ Run every registered benchmark (optionally those whose name contains `pattern`)."""
+    results = []
+    for bench in BENCHMARKS.values():
+        if pattern and pattern not in bench.name:
+            continue
+        for size in sizes:
+            result = run_one(bench, size, repeat = repeat)
+            if result is not None:
+                results.append(result)
+                if report:
+                    report(result)
+    return results
+
+
+def to_json(results):
+    from composable import __version__
+    return {'python': sys.version.split()[0],
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine(),
+            'composable': __version__,
+            'results': [asdict(r) for r in results],
+           }
+
+
+def compare(results, baseline, *, threshold = 1.25):
+    """ Compare results against a baseline JSON document.
+
+    Returns a list of (name, size, ratio) for every benchmark whose best time
+    grew by more than `threshold` (new / old).
+    """
+    old = {(r['name'], r['size']): r['best'] for r in baseline['results']}
+    regressions = []
+    for r in results:
+        before = old.get((r.name, r.size))
+        if before and r.best / before > threshold:
+            regressions.append((r.name, r.size, r.best / before))
+    return regressions
+
+
+def format_result(result):
+    return (f"{result.name:<40} n={result.size:<10} "
+            f"best={result.best:.6f}s  per_item={result.per_item * 1e9:,.1f}ns")
@@ -0,0 +1,101 @@
+""" Import-time benchmark for composable.
+
+Each module is imported in a fresh interpreter with `-X importtime`, and the
+cumulative time reported for the module itself is kept (the best of `--repeat`
+runs), which excludes interpreter startup.
+
+Usage (from the repository root):
+
+    $ python -m benchmarks.import_time --output imports.json
+    $ python -m benchmarks.import_time --compare imports.json --threshold 1.5
+    $ python -m benchmarks.import_time --budget composable=10
+
+The exit status is 1 when a module is slower than the baseline by more than
+`--threshold`, or exceeds its `--budget` (in milliseconds).
+"""
+import argparse
+import json
+import subprocess
+import sys
+
+MODULES = ('composable',
+           'composable.strict',
+           'composable.lazy',
+           'composable.records',
+           'composable.string',
+           'composable.maybe',
+          )
+
+# Default budgets in milliseconds, generous enough for slow CI machines
+BUDGETS = {'composable': 15.0}
+
+
+def import_time(module, *, repeat = 5, python = sys.executable):
+    """ Best cumulative import time of module in milliseconds, over fresh interpreters."""
+    best = None
+    for _ in range(repeat):
+        out = subprocess.run([python, '-X', 'importtime', '-c', f'import {module}'],
+                             capture_output = True, text = True, check = True).stderr
+        for line in out.splitlines():
+            # import time: self [us] | cumulative | imported package
+            parts = line.split('|')
+            if len(parts) == 3 and parts[2].strip() == module:
+                ms = int(parts[1]) / 1000
+                best = ms if best is None else min(best, ms)
+    return best
+
+
+def loaded_modules(module, *, python = sys.executable):
+    """ The names in sys.modules after importing module in a fresh interpreter."""
+    code = f'import sys, {module}; print("\\n".join(sorted(sys.modules)))'
+    out = subprocess.run([python, '-c', code], capture_output = True, text = True, check = True).stdout
+    return set(out.split())
+
+
+def _budget(text):
+    module, _, ms = text.partition('=')
+    return module, float(ms)
+
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(prog = 'python -m benchmarks.import_time', description = __doc__.splitlines()[1])
+    parser.add_argument('modules', nargs = '*', default = list(MODULES), help = 'Modules to import [default: %(default)s]')
+    parser.add_argument('--repeat', type = int, default = 5, help = 'Fresh interpreters per module, the best is reported')
+    parser.add_argument('--output', default = None, help = 'Write the results as JSON to this file')
+    parser.add_argument('--compare', default = None, help = 'Baseline JSON file to check for regressions')
+    parser.add_argument('--threshold', type = float, default = 1.5,
+                        help = 'Maximum allowed slowdown ratio against the baseline [default: 1.5]')
+    parser.add_argument('--budget', type = _budget, action = 'append', default = [],
+                        help = 'MODULE=MS, fail when MODULE takes longer than MS to import [default: composable=15]')
+    parser.add_argument('--quiet', action = 'store_true', help = 'Do not print results as they are measured')
+    args = parser.parse_args(argv)
+
+    results = {}
+    for module in args.modules:
+        results[module] = import_time(module, repeat = args.repeat)
+        if not args.quiet:
+            print(f"{module:<40} {results[module]:8.2f}ms", flush = True)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'python': sys.version.split()[0], 'results': results}, f, indent = 2)
+
+    failed = False
+    budgets = dict(BUDGETS, **dict(args.budget))
+    for module, limit in budgets.items():
+        if module in results and results[module] > limit:
+            print(f"OVER BUDGET {module}: {results[module]:.2f}ms > {limit:.2f}ms", file = sys.stderr)
+            failed = True
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+        for module, ms in results.items():
+            before = baseline.get(module)
+            if before and ms / before > args.threshold:
+                print(f"REGRESSION {module}: {ms / before:.2f}x slower than baseline", file = sys.stderr)
+                failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
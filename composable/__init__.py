@@ -1,7 +1,35 @@
 __version__ = '0.1.0'
-from composable.pipeable import (
+from composable.pipeable import fast_pipeable
+from importlib import import_module
 
-    pipeable, 
-    )
+# Importing the submodule above bound `pipeable` to it, the toolz-based
+# `pipeable` is loaded from it on first use instead (see __getattr__)
+del pipeable
 
-import toolz.curried.operator as operator
\ No newline at end of file
+# Submodules are imported on first attribute access, e.g. `composable.strict`,
+# so `import composable` doesn't pay for the modules (and dependencies) a
+# short-lived process never uses.
+_SUBMODULES = frozenset({
+    'aio', 'cache', 'dict', 'diskcache', 'glob', 'instrument', 'lazy', 'maybe',
+    'object', 'origami', 'parallel', 'records', 'sequence', 'strict', 'string',
+    'tuple', 'tuples', 'utility',
+})
+
+
+def __getattr__(name):
+    if name == 'pipeable':
+        from composable.pipeable import pipeable
+        value = pipeable
+    elif name == 'operator':
+        # Note: importing the `composable.operator` submodule replaces this
+        value = import_module('toolz.curried.operator')
+    elif name in _SUBMODULES:
+        value = import_module(f'{__name__}.{name}')
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | _SUBMODULES | {'pipeable', 'operator'})
@@ -0,0 +1,32 @@
+""" The toolz-based `pipeable`, imported by composable.pipeable on first use."""
+from toolz import curry
+
+
+class pipeable(curry):
+    # Makes NumPy arrays defer `arr >> f` to `f.__rrshift__` instead of
+    # broadcasting the shift over the elements
+    __array_ufunc__ = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+
+    def __rrshift__(self, other):
+        """ Use rightshift to represent piping (i.e. `x >> f` is `f(x)`).
+
+        Note that this form of piping assumes a unary function call.
+        Use a curried/partial function to allow piping n-ary functions."""
+        return self.__call__(other)
+
+
+    def __rshift__(self, other):
+        """ Use rightshift to represent piping (i.e. `x >> f` is `f(x)`).
+
+        Note that this form of piping assumes a unary function call.
+        Use a curried/partial function to allow piping n-ary functions."""
+        assert callable(other), "All subsequent elements of a pipe must be callable"
+        return other.__call__(self)
+
+
+# Keep the public location for repr and pickling
+pipeable.__module__ = 'composable.pipeable'
@@ -0,0 +1,70 @@
+""" Optional NumPy support shared by the composable modules.
+
+NumPy is never required: when it cannot be imported `np` is None and every
+helper reports that nothing is an array, so the pure-Python code paths are used.
+
+NumPy is also never imported just to answer `is_array`: a value can only be an
+array once numpy has been imported by someone, so the helpers look it up in
+`sys.modules`, and `np` itself is imported on first access.
+"""
+import sys
+
+_modules = sys.modules
+
+
+def __getattr__(name):
+    if name == 'np':
+        global np
+        try:
+            import numpy as np
+        except ImportError:  # pragma: no cover - numpy is optional
+            np = None
+        return np
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+_MARKER = '__composable_vectorized__'
+
+
+def is_array(value):
+    """ Whether value is a NumPy array (always False without NumPy)."""
+    np = _modules.get('numpy')
+    return np is not None and isinstance(value, np.ndarray)
+
+
+def vectorized(func):
+    """ Mark an elementwise function as safe to call once on a whole NumPy array.
+
+    `strict.map` and `strict.filter` call marked functions (and NumPy ufuncs) with
+    the entire array instead of once per element.  The function must give the
+    same result elementwise, e.g. `vectorized(lambda x: 2 * x + 1)`.
+
+    Callables that don't accept attributes (e.g. builtins like `abs`) are returned
+    wrapped in a marked callable instead.
+    """
+    try:
+        setattr(func, _MARKER, True)
+    except (AttributeError, TypeError):
+        return _Vectorized(func)
+    return func
+
+
+class _Vectorized(object):
+    """ A marked wrapper for callables that don't accept attributes."""
+    __slots__ = ('func',)
+    __composable_vectorized__ = True
+
+    def __init__(self, func):
+        self.func = func
+
+    def __call__(self, *args, **kwargs):
+        return self.func(*args, **kwargs)
+
+    def __repr__(self):
+        return f"vectorized({self.func!r})"
+
+
+def is_vectorized(func):
+    """ Whether func can be applied to a whole array (a ufunc or marked `vectorized`)."""
+    np = _modules.get('numpy')
+    return (np is not None and isinstance(func, np.ufunc)) or getattr(func, _MARKER, False) is True
@@ -0,0 +1,201 @@
+""" The Predicate type behind the comparisons in composable.operator.
+
+It lives in its own module so that strict/lazy can recognise predicates without
+importing composable.operator (which would replace the `composable.operator` attribute).
+"""
+from ._numpy import is_array, is_vectorized
+from functools import lru_cache
+import operator as op
+
+
+class Predicate(object):
+    ''' A unary test that can be combined with `&`, `|` and `~`.
+
+    Combined predicates are flattened into a single generated function, with `and`/`or`
+    short-circuiting and a lower and upper bound fused into one comparison chain, e.g.
+    `is_gt(0) & is_lt(10)` runs as `lambda x: 0 < x < 10`.  When every part is vectorized
+    (comparisons, ufuncs or `vectorized` functions) a NumPy array gives a boolean mask,
+    so predicates can be used with `strict.filter` on arrays.
+
+    Predicates are made by `composable.operator.predicate` and the comparisons
+    (`is_gt(0)` etc.) in composable.operator.
+    '''
+    __slots__ = ('node', '_function', '_array_function', '_name')
+    # See pipeable: lets `arr >> p` reach __rrshift__ for NumPy arrays
+    __array_ufunc__ = None
+
+    def __init__(self, node):
+        self.node = node
+        self._function = None
+        self._array_function = None
+        self._name = None
+
+    @property
+    def function(self):
+        ''' The generated scalar function (without the array check done by calling the predicate).'''
+        if self._function is None:
+            shape, values = _shape(self.node)
+            self._function = _template(shape, False)(*values)
+        return self._function
+
+    @property
+    def name(self):
+        ''' A name for the predicate that is the same in every run (functions are named
+        by their module and qualified name), e.g. for instrumentation.  Computed once.'''
+        if self._name is None:
+            shape, values = _shape(self.node)
+            self._name = f"Predicate(lambda x: {_expression(shape, False, [_stable_name(v) for v in values])})"
+        return self._name
+
+    @property
+    def __composable_vectorized__(self):
+        return _is_vectorized_node(self.node)
+
+    def __call__(self, x):
+        if is_array(x) and _is_vectorized_node(self.node):
+            if self._array_function is None:
+                shape, values = _shape(self.node)
+                self._array_function = _template(shape, True)(*values)
+            return self._array_function(x)
+        return (self._function or self.function)(x)
+
+    def __rrshift__(self, other):
+        return self(other)
+
+    def __reduce__(self):
+        # The generated functions can't be pickled, they are rebuilt on first use
+        return (Predicate, (self.node,))
+
+    def __and__(self, other):
+        return Predicate(_combine('and', self.node, _as_node(other)))
+
+    def __rand__(self, other):
+        return Predicate(_combine('and', _as_node(other), self.node))
+
+    def __or__(self, other):
+        return Predicate(_combine('or', self.node, _as_node(other)))
+
+    def __ror__(self, other):
+        return Predicate(_combine('or', _as_node(other), self.node))
+
+    def __invert__(self):
+        node = self.node
+        return Predicate(node[1] if node[0] == 'not' else ('not', node))
+
+    def __repr__(self):
+        shape, values = _shape(self.node)
+        return f"Predicate(lambda x: {_expression(shape, False, [repr(v) for v in values])})"
+
+
+# Predicate trees are made of ('cmp', symbol, value), ('fn', func), ('not', node),
+# ('and', nodes) and ('or', nodes)
+_OPERATORS = {'<': op.lt, '<=': op.le, '==': op.eq, '!=': op.ne, '>=': op.ge, '>': op.gt}
+_LOWER = {'>': '<', '>=': '<='}
+_UPPER = ('<', '<=')
+
+
+def _stable_name(value):
+    qualname = getattr(value, '__qualname__', None)
+    if callable(value) and qualname:
+        module = getattr(value, '__module__', None)
+        return f"{module}.{qualname}" if module else qualname
+    return repr(value)
+
+
+def _as_node(p):
+    return p.node if isinstance(p, Predicate) else ('fn', p)
+
+
+def _combine(kind, left, right):
+    ''' Join two nodes, flattening nested and/or nodes of the same kind.'''
+    children = []
+    for node in (left, right):
+        children.extend(node[1] if node[0] == kind else (node,))
+    return (kind, tuple(children))
+
+
+def _is_vectorized_node(node):
+    kind = node[0]
+    if kind == 'cmp':
+        return True
+    if kind == 'fn':
+        return is_vectorized(node[1])
+    if kind == 'not':
+        return _is_vectorized_node(node[1])
+    return all(_is_vectorized_node(n) for n in node[1])
+
+
+def _shape(node):
+    ''' Splits a tree into its shape (values replaced by their position) and its values.'''
+    values = []
+    def walk(node):
+        kind = node[0]
+        if kind == 'cmp':
+            values.append(node[2])
+            return ('cmp', node[1], len(values) - 1)
+        if kind == 'fn':
+            values.append(node[1])
+            return ('fn', len(values) - 1)
+        if kind == 'not':
+            return ('not', walk(node[1]))
+        return (kind, tuple(walk(n) for n in node[1]))
+    return walk(node), values
+
+
+def _fuse_ranges(children):
+    ''' Fuse each lower bound of an "and" that is directly followed by an upper bound
+    into a ('range', lower, upper) node, e.g. `x > 0 and x < 10` into `0 < x < 10`.
+
+    The chained comparison tests the bounds in the same order, so every part is
+    still evaluated (and short-circuits) in the order it was written.
+    '''
+    fused, i, n = [], 0, len(children)
+    while i < n:
+        c = children[i]
+        if (c[0] == 'cmp' and c[1] in _LOWER and i + 1 < n
+                and children[i + 1][0] == 'cmp' and children[i + 1][1] in _UPPER):
+            fused.append(('range', c, children[i + 1]))
+            i += 2
+        else:
+            fused.append(c)
+            i += 1
+    return fused
+
+
+def _expression(shape, array, names):
+    kind = shape[0]
+    if kind == 'cmp':
+        return f"(x {shape[1]} {names[shape[2]]})"
+    if kind == 'range':
+        lower, upper = shape[1], shape[2]
+        if array:
+            return (f"((x {lower[1]} {names[lower[2]]}) & (x {upper[1]} {names[upper[2]]}))")
+        return f"({names[lower[2]]} {_LOWER[lower[1]]} x {upper[1]} {names[upper[2]]})"
+    if kind == 'fn':
+        return f"{names[shape[1]]}(x)"
+    if kind == 'not':
+        inner = _expression(shape[1], array, names)
+        return f"(~{inner})" if array else f"(not {inner})"
+    children = _fuse_ranges(shape[1]) if kind == 'and' else shape[1]
+    if len(children) == 1:
+        return _expression(children[0], array, names)
+    joiner = {('and', False): ' and ', ('or', False): ' or ', ('and', True): ' & ', ('or', True): ' | '}[kind, array]
+    return '(' + joiner.join(_expression(c, array, names) for c in children) + ')'
+
+
+@lru_cache(maxsize=1024)
+def _template(shape, array):
+    ''' Generates (once per predicate shape) a factory for the flattened predicate function.'''
+    names = [f"v{i}" for i in range(_count_values(shape))]
+    namespace = {}
+    exec(f"def factory({', '.join(names)}):\n    return lambda x: {_expression(shape, array, names)}", namespace)
+    return namespace['factory']
+
+
+def _count_values(shape):
+    kind = shape[0]
+    if kind in ('cmp', 'fn'):
+        return 1
+    if kind == 'not':
+        return _count_values(shape[1])
+    return sum(_count_values(c) for c in shape[1])
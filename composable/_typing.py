@@ -0,0 +1,8 @@
+""" Typing support shared by the composable modules.
+
+`typing` is only needed by type checkers and importing it at run time would
+double the import time of the package, so modules guard their typing imports
+with this `TYPE_CHECKING` instead of `typing.TYPE_CHECKING`.  Type checkers
+treat any `TYPE_CHECKING` constant as true.
+"""
+TYPE_CHECKING = False
@@ -0,0 +1,129 @@
+from .pipeable import fast_pipeable
+from inspect import isawaitable
+import asyncio
+
+
+async def _resolve(value):
+    """ Await value when it is awaitable, otherwise return it unchanged."""
+    return (await value) if isawaitable(value) else value
+
+
+async def _then(awaitable, func):
+    return await _resolve(func(await awaitable))
+
+
+class PendingPipe(object):
+    """ The awaitable result of piping into an async stage.
+
+    Piping a `PendingPipe` into another stage (`pending >> g`) chains `g` after the
+    pending result without blocking, so a whole pipe is awaited once:
+    `await (x >> f >> g)`.  Subsequent stages may be regular functions, coroutine
+    functions or pipeables.
+    """
+    __slots__ = ('_awaitable',)
+
+    def __init__(self, awaitable):
+        self._awaitable = awaitable
+
+    def __await__(self):
+        return self._awaitable.__await__()
+
+    def __rshift__(self, other):
+        assert callable(other), "All subsequent elements of a pipe must be callable"
+        return PendingPipe(_then(self._awaitable, other))
+
+    def __repr__(self):
+        return f"PendingPipe({self._awaitable!r})"
+
+
+class apipeable(fast_pipeable):
+    """ A pipeable for coroutine functions (`async def`).
+
+    Calling with all arguments returns a coroutine, as for the undecorated function.
+    Piping returns a `PendingPipe`, which can be piped further and awaited.  A stage
+    can also receive an awaitable (e.g. a `PendingPipe`), in which case it is
+    applied to the awaited value.
+
+    >>> import asyncio
+    >>> from composable.aio import apipeable
+    >>> @apipeable
+    ... async def add(x, y):
+    ...     await asyncio.sleep(0)
+    ...     return x + y
+    >>> async def main():
+    ...     return await (1 >> add(2) >> add(3) >> str)
+    >>> asyncio.run(main())
+    '6'
+    """
+    __slots__ = ()
+
+    def __rrshift__(self, other):
+        if isawaitable(other):
+            return PendingPipe(_then(other, self))
+        result = fast_pipeable.__rrshift__(self, other)
+        return PendingPipe(result) if isawaitable(result) else result
+
+
+async def _bounded(semaphore, func, *args):
+    if semaphore is None:
+        return await _resolve(func(*args))
+    async with semaphore:
+        return await _resolve(func(*args))
+
+
+@apipeable
+async def map(f, L, *, limit = None):
+    ''' concurrently applies f to all elements of L, returning a list of the resulting values.
+
+    An asynchronous version of composable.strict.map, where all calls are gathered
+    so their awaits overlap.
+
+    Args:
+        f: A unary coroutine function (or regular function)
+        L: A finite iterable of values
+        limit: Maximum number of calls that are awaited at the same time. [default = None, no limit]
+
+    Returns:
+        A list of the results of f applied to each element of L, in input order.
+    '''
+    semaphore = asyncio.Semaphore(limit) if limit else None
+    return list(await asyncio.gather(*(_bounded(semaphore, f, x) for x in L)))
+
+
+@apipeable
+async def star_map(f, L, *, limit = None):
+    ''' concurrently applies f after unpacking the elements of L as positional arguments.
+
+    An asynchronous version of composable.strict.star_map, see composable.aio.map.
+
+    Args:
+        f: A coroutine function (or regular function) taking one or more positional arguments
+        L: A finite iterable of tuples of values to be unpacked when calling f
+        limit: Maximum number of calls that are awaited at the same time. [default = None, no limit]
+
+    Returns:
+        A list of the results of f applied to each element of L, in input order.
+    '''
+    semaphore = asyncio.Semaphore(limit) if limit else None
+    return list(await asyncio.gather(*(_bounded(semaphore, f, *args) for args in L)))
+
+
+@apipeable
+async def filter(p, L, *, limit = None):
+    ''' Concurrently filters the elements of L, returning a list of all elements that pass the predicate p.
+
+    An asynchronous version of composable.strict.filter, see composable.aio.map.
+
+    Args:
+        p: a unary boolean coroutine function (or regular function)
+        L: A finite iterable of values
+        limit: Maximum number of predicate calls that are awaited at the same time.
+               [default = None, no limit]
+
+    Returns:
+        A list of the elements of L that satisfy p, in input order.
+    '''
+    L = list(L)
+    semaphore = asyncio.Semaphore(limit) if limit else None
+    keep = await asyncio.gather(*(_bounded(semaphore, p, x) for x in L))
+    return [x for x, k in zip(L, keep) if k]
@@ -0,0 +1,201 @@
+""" In-memory memoization for expensive, pure pipe stages.
+
+`memoize` wraps a function (or a `pipeable`/`fast_pipeable`, including partial
+applications) so that its results are kept in a bounded `Cache`, with least
+recently used and time-to-live eviction.  The result is a `fast_pipeable`, which
+works out from the signature when a call is complete (instead of trying the call
+like `toolz.curry`), so the cache only sees complete calls and currying works as before.
+
+>>> from composable import pipeable, strict
+>>> from composable.cache import memoize, cache_info
+>>> @memoize(maxsize = 100)
+... @pipeable
+... def scale(factor, x):
+...     return factor * x
+>>> [1, 2, 1, 1] >> strict.map(scale(10))
+[10, 20, 10, 10]
+>>> cache_info(scale)['hits']
+2
+"""
+from .pipeable import pipeable, fast_pipeable
+from collections import OrderedDict
+from functools import wraps
+from threading import Lock
+from time import monotonic
+
+DEFAULT_MAXSIZE = 1024
+
+_MISSING = object()
+_KWD_MARK = object()
+
+
+def make_key(args, kwargs):
+    """ The default cache key, the arguments themselves (which must be hashable)."""
+    if kwargs:
+        return args + (_KWD_MARK,) + tuple(sorted(kwargs.items()))
+    return args
+
+
+class Cache(object):
+    """ A thread-safe mapping with LRU and TTL eviction and hit/miss statistics.
+
+    Args.
+        - maxsize: Maximum number of entries, or None for no bound. [default = DEFAULT_MAXSIZE]
+        - ttl: Seconds an entry stays valid, or None to keep entries until evicted.
+    """
+    def __init__(self, maxsize = DEFAULT_MAXSIZE, ttl = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = Lock()
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def get(self, key, default = None):
+        """ Returns the value stored for key (counting a hit) or default (counting a miss)."""
+        # Lookups don't take the lock: the dict operations are atomic, and under
+        # concurrent use the counts are approximate rather than the cache corrupted.
+        entry = self._data.get(key, _MISSING)
+        if entry is not _MISSING:
+            value, expires = entry
+            if expires is None or monotonic() < expires:
+                try:
+                    self._data.move_to_end(key)
+                except KeyError:
+                    pass
+                self.hits += 1
+                return value
+            with self._lock:
+                if self._data.get(key) is entry:
+                    del self._data[key]
+                    self.expirations += 1
+        self.misses += 1
+        return default
+
+    def put(self, key, value):
+        with self._lock:
+            expires = None if self.ttl is None else monotonic() + self.ttl
+            self._data[key] = (value, expires)
+            self._data.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last = False)
+                    self.evictions += 1
+
+    def clear(self):
+        """ Remove every entry and reset the statistics."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def stats(self):
+        """ Returns a dict of hits, misses, evictions, expirations, hit_rate, currsize, maxsize and ttl."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {'hits': self.hits,
+                    'misses': self.misses,
+                    'evictions': self.evictions,
+                    'expirations': self.expirations,
+                    'hit_rate': self.hits / lookups if lookups else 0.0,
+                    'currsize': len(self._data),
+                    'maxsize': self.maxsize,
+                    'ttl': self.ttl,
+                   }
+
+
+def _unwrap(func):
+    """ Split a (partially applied) pipeable into its function and bound arguments."""
+    if isinstance(func, (pipeable, fast_pipeable)):
+        return func.func, func.args, func.keywords
+    return func, (), {}
+
+
+def memoize(func = None, *, maxsize = DEFAULT_MAXSIZE, ttl = None, key = None, cache = None):
+    """ Cache the results of func, returning a pipeable with the same arguments.
+
+    Can be used as `@memoize`, `@memoize(maxsize = ...)` or `memoize(func, ...)`.
+
+    Args.
+        - func: A function, pipeable or fast_pipeable (possibly partially applied).
+        - maxsize: Maximum number of cached results, None for no bound. [default = DEFAULT_MAXSIZE]
+        - ttl: Seconds a result stays valid, None for no expiry.
+        - key: A function of the call's arguments returning a hashable key, e.g. for
+               unhashable inputs `key = lambda d: tuple(sorted(d.items()))`.
+               Without it, calls with unhashable arguments are not cached.
+        - cache: An existing Cache to use instead of creating a new one.
+
+    Returns: A fast_pipeable with the same arguments as func, whose cache is
+             available from `cache_info`/`cache_clear`.
+    """
+    if func is None:
+        return lambda f: memoize(f, maxsize = maxsize, ttl = ttl, key = key, cache = cache)
+    inner, args, kwargs = _unwrap(func)
+    store = Cache(maxsize, ttl) if cache is None else cache
+    get = store.get
+
+    @wraps(inner)
+    def memoized(*a, **k):
+        # Errors from the key function are the caller's, only the lookup may fail
+        cache_key = (make_key(a, k) if k else a) if key is None else key(*a, **k)
+        try:
+            value = get(cache_key, _MISSING)
+        except TypeError:
+            # Unhashable arguments
+            return inner(*a, **k)
+        if value is _MISSING:
+            value = inner(*a, **k)
+            store.put(cache_key, value)
+        return value
+
+    memoized.cache = store
+    return fast_pipeable(memoized, *args, **kwargs)
+
+
+def _cache_of(func):
+    store = getattr(getattr(func, 'func', func), 'cache', None)
+    if not isinstance(store, Cache):
+        raise TypeError(f"{func!r} is not memoized")
+    return store
+
+
+def cache_info(func):
+    """ Returns the statistics of a memoized function's cache, see `Cache.stats`."""
+    return _cache_of(func).stats()
+
+
+def cache_clear(func):
+    """ Empty a memoized function's cache and reset its statistics."""
+    _cache_of(func).clear()
+
+
+# Stages made by `cached`, so that the same inline stage shares one cache
+_stages = Cache(maxsize = 128)
+
+
+def cached(func, *, maxsize = DEFAULT_MAXSIZE, ttl = None, key = None):
+    """ A memoized version of func for use inline in a pipe.
+
+    Unlike `memoize`, repeated calls with the same func and options return the same
+    stage, so a pipe that is rebuilt (e.g. in a loop) keeps its cache.
+
+    >>> from composable import strict
+    >>> stage = cached(len)
+    >>> ['a', 'bb', 'a'] >> strict.map(cached(len))
+    [1, 2, 1]
+    >>> cache_info(stage)['hits']
+    1
+
+    Args: see `memoize`.
+    """
+    try:
+        stage_key = (func, maxsize, ttl, key)
+        hash(stage_key)
+    except TypeError:
+        return memoize(func, maxsize = maxsize, ttl = ttl, key = key)
+    stage = _stages.get(stage_key, _MISSING)
+    if stage is _MISSING:
+        stage = memoize(func, maxsize = maxsize, ttl = ttl, key = key)
+        _stages.put(stage_key, stage)
+    return stage
@@ -0,0 +1,346 @@
+""" A persistent, on-disk result cache for expensive pipe stages.
+
+`disk_memoize` stores the results of a stage in a SQLite database in a local
+directory, keyed by a hash of the stage's identity, its version and the input.
+Reruns of a job then skip inputs that were already processed.  The database is
+shared safely between threads and processes (e.g. the workers of
+`composable.parallel.map`), and is kept below a size cap by evicting the least
+recently used results.
+
+>>> import tempfile
+>>> from composable import strict
+>>> from composable.diskcache import disk_memoize
+>>> directory = tempfile.mkdtemp()
+>>> square = disk_memoize(lambda x: x * x, directory, version = '1')
+>>> [1, 2, 1] >> strict.map(square)
+[1, 4, 1]
+>>> square.func.cache.stats()['hits']
+1
+"""
+from .pipeable import pipeable, fast_pipeable
+from functools import update_wrapper
+from threading import local, Lock
+from time import time
+from types import CodeType
+from weakref import finalize
+import hashlib
+import inspect
+import os
+import pickle
+import sqlite3
+
+DEFAULT_MAX_BYTES = 1 << 30
+DB_NAME = 'cache.sqlite3'
+# Seconds between updates of an entry's last access time, which would otherwise
+# make every hit a write
+ACCESS_RESOLUTION = 60
+# Number of least recently used entries read at a time when evicting
+EVICT_BATCH = 64
+
+_MISSING = object()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL);
+INSERT OR IGNORE INTO meta VALUES ('total_size', 0);
+"""
+
+
+class DiskCache(object):
+    """ A size-capped key/value store of pickled results in a SQLite database.
+
+    Connections are opened lazily, one per thread and per process, so a DiskCache
+    can be pickled and sent to pool workers.  Writes happen in short immediate
+    transactions and readers use write-ahead logging, so concurrent workers do not
+    block each other for long.
+
+    Args.
+        - directory: Directory holding the database (created if needed).
+        - max_bytes: Size cap for the stored (pickled) results, the least recently
+                     used are evicted beyond it. [default = DEFAULT_MAX_BYTES]
+        - timeout: Seconds to wait for another process holding the write lock. [default = 30]
+    """
+    def __init__(self, directory, *, max_bytes = DEFAULT_MAX_BYTES, timeout = 30):
+        self.directory = os.fspath(directory)
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self._local = local()
+        self._stats_lock = Lock()
+        # The connections opened by every thread, closed with the cache: a sqlite3
+        # connection is in a reference cycle, so it would otherwise stay open until
+        # a garbage collection
+        self._connections = []
+        finalize(self, _close_all, self._connections)
+        self.hits = self.misses = self.evictions = 0
+
+    def __getstate__(self):
+        return {'directory': self.directory, 'max_bytes': self.max_bytes, 'timeout': self.timeout}
+
+    def __setstate__(self, state):
+        self.__init__(state['directory'], max_bytes = state['max_bytes'], timeout = state['timeout'])
+
+    @property
+    def path(self):
+        return os.path.join(self.directory, DB_NAME)
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            os.makedirs(self.directory, exist_ok = True)
+            conn = sqlite3.connect(self.path, timeout = self.timeout, isolation_level = None,
+                                   check_same_thread = False)
+            conn.execute('PRAGMA journal_mode = WAL')
+            conn.execute('PRAGMA synchronous = NORMAL')
+            conn.executescript(_SCHEMA)
+            self._local.conn, self._local.pid = conn, os.getpid()
+            self._connections.append((os.getpid(), conn))
+        return conn
+
+    def _count(self, name, n = 1):
+        with self._stats_lock:
+            setattr(self, name, getattr(self, name) + n)
+
+    def get(self, key, default = None):
+        """ Returns the unpickled value stored for key, or default."""
+        conn = self._connection()
+        row = conn.execute('SELECT value, accessed FROM entries WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            self._count('misses')
+            return default
+        try:
+            value = pickle.loads(row[0])
+        except Exception:
+            self._count('misses')
+            return default
+        now = time()
+        if now - row[1] > ACCESS_RESOLUTION:
+            conn.execute('UPDATE entries SET accessed = ? WHERE key = ?', (now, key))
+        self._count('hits')
+        return value
+
+    def put(self, key, value):
+        """ Store value (which must be picklable) under key, evicting old entries beyond max_bytes."""
+        data = pickle.dumps(value, protocol = pickle.HIGHEST_PROTOCOL)
+        if len(data) > self.max_bytes:
+            return
+        conn = self._connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            old = conn.execute('SELECT size FROM entries WHERE key = ?', (key,)).fetchone()
+            conn.execute('INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)', (key, data, len(data), time()))
+            delta = len(data) - (old[0] if old else 0)
+            conn.execute("UPDATE meta SET value = value + ? WHERE name = 'total_size'", (delta,))
+            total, = conn.execute("SELECT value FROM meta WHERE name = 'total_size'").fetchone()
+            if total > self.max_bytes:
+                self._evict(conn, total)
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+
+    def _evict(self, conn, total):
+        # The oldest entries are read a batch at a time (through the index on
+        # accessed), so an eviction never scans or loads the whole table
+        freed = evicted = 0
+        while total - freed > self.max_bytes:
+            rows = conn.execute('SELECT key, size FROM entries ORDER BY accessed LIMIT ?',
+                                (EVICT_BATCH,)).fetchall()
+            if not rows:
+                break
+            for key, size in rows:
+                if total - freed <= self.max_bytes:
+                    break
+                conn.execute('DELETE FROM entries WHERE key = ?', (key,))
+                freed += size
+                evicted += 1
+        conn.execute("UPDATE meta SET value = value - ? WHERE name = 'total_size'", (freed,))
+        self._count('evictions', evicted)
+
+    def clear(self):
+        """ Remove every stored result (for all stages sharing the directory)."""
+        conn = self._connection()
+        conn.execute('BEGIN IMMEDIATE')
+        conn.execute('DELETE FROM entries')
+        conn.execute("UPDATE meta SET value = 0 WHERE name = 'total_size'")
+        conn.execute('COMMIT')
+
+    def __len__(self):
+        return self._connection().execute('SELECT COUNT(*) FROM entries').fetchone()[0]
+
+    def stats(self):
+        """ Returns a dict of this process's hits, misses and evictions, and the stored count and size."""
+        conn = self._connection()
+        count, = conn.execute('SELECT COUNT(*) FROM entries').fetchone()
+        size, = conn.execute("SELECT value FROM meta WHERE name = 'total_size'").fetchone()
+        lookups = self.hits + self.misses
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'currsize': count,
+                'bytes': size,
+                'max_bytes': self.max_bytes,
+               }
+
+
+def _close_all(connections):
+    # Connections inherited by a forked child belong to the parent, SQLite says
+    # they must not be closed there
+    pid = os.getpid()
+    while connections:
+        owner, conn = connections.pop()
+        if owner == pid:
+            conn.close()
+
+
+def stage_identity(func):
+    """ The module-qualified name of func, used to keep the results of different stages apart."""
+    module = getattr(func, '__module__', None)
+    name = getattr(func, '__qualname__', None) or getattr(func, '__name__', None) or type(func).__qualname__
+    return f"{module}.{name}" if module else name
+
+
+def _code_digest(code):
+    """ A digest of a code object that is stable between processes.
+
+    Nested code objects (comprehensions, lambdas, inner functions) are replaced by
+    their own digests, as their repr contains a memory address.
+    """
+    digest = hashlib.sha256(code.co_code)
+    for names in (code.co_names, code.co_varnames):
+        digest.update(repr(names).encode())
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            digest.update(_code_digest(const).encode())
+        else:
+            digest.update(repr(const).encode())
+    return digest.hexdigest()
+
+
+def _cell_value(cell):
+    try:
+        return cell.cell_contents
+    except ValueError:
+        # An empty cell (a variable assigned after the function was defined)
+        return None
+
+
+def _code_version(func):
+    """ A hash of func's compiled code and captured state, so that editing the stage, or
+    making it with other default or closure values, invalidates its results.
+
+    Globals used by func are not included.  Raises TypeError when the defaults or
+    closure values can't be pickled.
+    """
+    code = getattr(func, '__code__', None)
+    if code is None:
+        return None
+    cells = tuple(_cell_value(cell) for cell in getattr(func, '__closure__', None) or ())
+    state = (getattr(func, '__defaults__', None), getattr(func, '__kwdefaults__', None), cells)
+    try:
+        data = pickle.dumps(state, protocol = 4)
+    except (pickle.PicklingError, TypeError, AttributeError) as e:
+        raise TypeError(f"The defaults or closure of {stage_identity(func)} can't be pickled, "
+                        "pass an explicit version to disk_memoize") from e
+    digest = hashlib.sha256(_code_digest(code).encode())
+    digest.update(data)
+    return digest.hexdigest()[:16]
+
+
+def file_digest(path, *, chunk_size = 1 << 20):
+    """ The SHA-256 hex digest of a file's contents, e.g. as a `key` for stages taking paths.
+
+    >>> # Reprocess a file when its contents change, not just its name
+    >>> # parse = disk_memoize(parse_file, '.cache', key = file_digest)
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DiskMemoized(object):
+    """ The callable behind `disk_memoize`, picklable when the wrapped function is."""
+    def __init__(self, func, cache, version, key):
+        self.func = func
+        self.cache = cache
+        self.version = _code_version(func) if version is None else version
+        self.key = key
+        self.identity = stage_identity(func)
+        update_wrapper(self, func)
+        self.__signature__ = inspect.signature(func)
+
+    def __getstate__(self):
+        return {'func': self.func, 'cache': self.cache, 'version': self.version, 'key': self.key}
+
+    def __setstate__(self, state):
+        self.__init__(state['func'], state['cache'], state['version'], state['key'])
+
+    def hash_key(self, args, kwargs):
+        """ The hex digest identifying a call to this stage, or None if its key can't be pickled.
+
+        The digest is of the pickled arguments, which are not canonical: equal sets
+        can pickle in a different order in another process (string hashing is
+        randomized), and so can values that share references.  Pass a `key`
+        returning e.g. a sorted tuple for such arguments.
+        """
+        value = (args, sorted(kwargs.items())) if self.key is None else self.key(*args, **kwargs)
+        try:
+            data = pickle.dumps((self.identity, self.version, value), protocol = 4)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return None
+        return hashlib.sha256(data).hexdigest()
+
+    def __call__(self, *args, **kwargs):
+        key = self.hash_key(args, kwargs)
+        if key is None:
+            # Inputs that can't be hashed are computed without the cache
+            return self.func(*args, **kwargs)
+        value = self.cache.get(key, _MISSING)
+        if value is _MISSING:
+            value = self.func(*args, **kwargs)
+            try:
+                self.cache.put(key, value)
+            except (pickle.PicklingError, TypeError, AttributeError):
+                # Results that can't be pickled are not stored
+                pass
+        return value
+
+
+def disk_memoize(func = None, directory = '.composable-cache', *, version = None, key = None,
+                 max_bytes = DEFAULT_MAX_BYTES, cache = None):
+    """ Cache the results of func on disk, returning a pipeable with the same arguments.
+
+    Can be used as `@disk_memoize(directory = ...)` or `disk_memoize(func, directory, ...)`.
+
+    Args.
+        - func: A function, pipeable or fast_pipeable (possibly partially applied).
+                For process pools it must be picklable (e.g. defined at module level).
+        - directory: Directory of the cache database. [default = '.composable-cache']
+        - version: A string identifying the stage's behaviour, change it to invalidate
+                   old results.  By default a hash of func's code, defaults and closure
+                   values is used (which must then be picklable).  Globals used by func
+                   are not part of it.
+        - key: A function of the call's arguments returning the (picklable) value to hash
+               instead of the arguments, e.g. `file_digest` for stages taking file paths,
+               or a sorted tuple for sets, whose pickled order can change between processes.
+        - max_bytes: Size cap of the stored results. [default = DEFAULT_MAX_BYTES]
+        - cache: An existing DiskCache to use instead of directory and max_bytes.
+
+    Returns: A fast_pipeable; its `.func.cache` is the DiskCache.
+    """
+    if func is None:
+        return lambda f: disk_memoize(f, directory, version = version, key = key,
+                                      max_bytes = max_bytes, cache = cache)
+    args, kwargs = (), {}
+    if isinstance(func, (pipeable, fast_pipeable)):
+        func, args, kwargs = func.func, func.args, func.keywords
+    store = DiskCache(directory, max_bytes = max_bytes) if cache is None else cache
+    return fast_pipeable(DiskMemoized(func, store, version, key), *args, **kwargs)
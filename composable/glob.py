@@ -1,5 +1,15 @@
 from .pipeable import pipeable
+from collections import OrderedDict
+from fnmatch import translate
+from functools import lru_cache
+from threading import Lock
+from time import monotonic
+from typing import NamedTuple
 import glob as g
+import os
+import re
+
+GLOB_CACHE_SIZE = 128
 
 @pipeable
 def glob(pathname, *, recursive=False):
@@ -13,4 +23,353 @@ def glob(pathname, *, recursive=False):
 
     If include_hidden is true, “**” pattern will match hidden directories.
     '''
-    return g.glob(pathname, recursive=recursive)
\ No newline at end of file
+    return g.glob(pathname, recursive=recursive)
+
+
+class FileInfo(NamedTuple):
+    ''' A path found by `iglob_info`, with the metadata read while scanning.'''
+    path: str
+    size: int
+    mtime: float
+    is_dir: bool
+
+
+_magic_check = re.compile('[*?[]')
+
+
+def _has_magic(s):
+    return _magic_check.search(s) is not None
+
+
+@lru_cache(maxsize=256)
+def _compile_component(pattern):
+    return re.compile(translate(pattern)).match
+
+
+def _join(dirname, name):
+    return os.path.join(dirname, name) if dirname else name
+
+
+def _is_hidden(name):
+    return name[0] == '.'
+
+
+def _entry_is_dir(entry):
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+def _record_mtime(seen, dirname):
+    try:
+        seen[dirname] = os.stat(dirname or os.curdir).st_mtime_ns
+    except OSError:
+        seen[dirname] = None
+
+
+def _scandir(dirname, seen=None):
+    ''' List a directory with os.scandir, returning no entries when it can't be read.
+
+    When given, the directory's modification time is recorded in `seen` first.
+    '''
+    if seen is not None:
+        _record_mtime(seen, dirname)
+    try:
+        with os.scandir(dirname or os.curdir) as it:
+            return list(it)
+    except OSError:
+        return []
+
+
+def _match_component(dirname, pattern, dir_only, seen=None):
+    ''' Returns the (path, DirEntry or None) pairs in dirname that match one path component.'''
+    if not _has_magic(pattern):
+        if seen is not None:
+            _record_mtime(seen, dirname)
+        path = _join(dirname, pattern)
+        exists = os.path.isdir(path) if dir_only else os.path.lexists(path)
+        return [(path, None)] if exists else []
+    match = _compile_component(os.path.normcase(pattern))
+    include_hidden = _is_hidden(pattern)
+    return [(_join(dirname, e.name), e)
+            for e in _scandir(dirname, seen)
+            if (include_hidden or not _is_hidden(e.name))
+            and match(os.path.normcase(e.name))
+            and (not dir_only or _entry_is_dir(e))]
+
+
+def _walk(dirname, dir_only, seen=None):
+    ''' Depth-first (pre-order) listing of all non-hidden entries below dirname.'''
+    for e in _scandir(dirname, seen):
+        if _is_hidden(e.name):
+            continue
+        is_dir = _entry_is_dir(e)
+        if dir_only and not is_dir:
+            continue
+        path = _join(dirname, e.name)
+        yield path, e
+        if is_dir:
+            yield from _walk(path, dir_only, seen)
+
+
+def _walk_parallel(dirnames, dir_only, pool, seen=None):
+    ''' Level-by-level listing of all non-hidden entries below dirnames, scanning
+    the directories of each level concurrently.
+    '''
+    level = list(dirnames)
+    while level:
+        next_level = []
+        for dirname, entries in zip(level, pool.map(lambda d: _scandir(d, seen), level)):
+            for e in entries:
+                if _is_hidden(e.name):
+                    continue
+                is_dir = _entry_is_dir(e)
+                if dir_only and not is_dir:
+                    continue
+                path = _join(dirname, e.name)
+                yield path, e
+                if is_dir:
+                    next_level.append(path)
+        level = next_level
+
+
+def _split_pattern(pathname):
+    ''' Split pathname into the leading literal directory and the remaining components.'''
+    parts = pathname.split(os.sep)
+    i = 0
+    while i < len(parts) - 1 and not _has_magic(parts[i]):
+        i += 1
+    base = os.sep.join(parts[:i])
+    if i and not base:
+        base = os.sep
+    return base, parts[i:]
+
+
+def _iglob_entries(pathname, recursive, pool, seen=None):
+    ''' Yields (path, DirEntry or None) for every match, one path component at a time.
+
+    When `seen` is a dict, the modification time of every directory that was
+    consulted is recorded in it (None for a missing directory).
+    '''
+    pathname = os.fspath(pathname)
+    base, parts = _split_pattern(pathname)
+    trailing_sep = len(parts) > 1 and parts[-1] == ''
+    if trailing_sep:
+        parts = parts[:-1]
+    if base and not os.path.isdir(base):
+        if seen is not None:
+            _record_mtime(seen, base)
+        return
+    listing = (lambda f, dirs: pool.map(f, dirs)) if pool else map
+    is_recursive = lambda part: recursive and part == '**'
+
+    dirs = [base]
+    for part in parts[:-1]:
+        if is_recursive(part):
+            # "**" matches zero or more directories
+            if pool:
+                dirs = dirs + [path for path, _ in _walk_parallel(dirs, True, pool, seen)]
+            else:
+                dirs = [path for d in dirs for path in (d, *(p for p, _ in _walk(d, True, seen)))]
+        else:
+            matches = listing(lambda d: _match_component(d, part, True, seen), dirs)
+            dirs = [path for found in matches for path, _ in found]
+
+    last = parts[-1]
+    suffix = os.sep if trailing_sep else ''
+    if is_recursive(last):
+        for d in dirs:
+            if d:
+                yield _join(d, ''), None
+        walk = (_walk_parallel(dirs, trailing_sep, pool, seen) if pool
+                else (x for d in dirs for x in _walk(d, trailing_sep, seen)))
+        for path, entry in walk:
+            yield path + suffix, entry
+    else:
+        for found in listing(lambda d: _match_component(d, last, trailing_sep, seen), dirs):
+            for path, entry in found:
+                yield path + suffix, entry
+
+
+def _iglob(pathname, recursive, workers, seen=None):
+    if workers:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            yield from _iglob_entries(pathname, recursive, pool, seen)
+    else:
+        yield from _iglob_entries(pathname, recursive, None, seen)
+
+
+def _file_info(path, entry):
+    try:
+        st = entry.stat() if entry is not None else os.stat(path)
+    except OSError:
+        # Broken symlinks still match, as with glob
+        st = entry.stat(follow_symlinks=False) if entry is not None else os.lstat(path)
+    is_dir = _entry_is_dir(entry) if entry is not None else os.path.isdir(path)
+    return FileInfo(path, st.st_size, st.st_mtime, is_dir)
+
+
+@pipeable
+def iglob(pathname, *, recursive=False, workers=None):
+    '''Lazily yield the path names that match pathname, like glob but without building the full list.
+
+    Directories are listed with os.scandir and the file type information of each
+    DirEntry is reused, so matching does not stat every entry again.  Hidden names
+    (starting with a dot) only match patterns that start with a dot, and "**"
+    matches zero or more directories when recursive is True, as for glob.
+
+    Args:
+        - pathname: A path pattern with shell-style wildcards
+        - recursive: Whether "**" matches any files and zero or more directories [default = False]
+        - workers: If given, directories are scanned concurrently by this many threads,
+                   which helps for wide trees (or slow/network file systems).  Recursive
+                   matches are then produced level by level, rather than in glob's order.
+
+    Returns: An iterator of matching path names
+    '''
+    return (path for path, _ in _iglob(pathname, recursive, workers))
+
+
+@pipeable
+def iglob_info(pathname, *, recursive=False, workers=None):
+    '''Lazily yield a FileInfo(path, size, mtime, is_dir) for each path that matches pathname.
+
+    The metadata comes from the DirEntry found while scanning (which caches its stat
+    result), so downstream stages don't need to stat the files again.  See iglob for
+    a description of the arguments.
+
+    Returns: An iterator of FileInfo named tuples
+    '''
+    return (_file_info(path, entry) for path, entry in _iglob(pathname, recursive, workers))
+
+
+class GlobCache(object):
+    ''' A bounded cache of glob results, revalidated with directory modification times.
+
+    Results are keyed on (pattern, root, recursive), where root is the current working
+    directory for relative patterns.  Along with each result the modification time of
+    every directory that was listed is stored; a cache hit re-stats those directories
+    (one os.stat each, no listing) and rescans only if one of them has changed.  Adding,
+    removing or renaming an entry updates the mtime of its parent, but on file systems
+    with coarse timestamps a change made in the same tick as the scan may be missed,
+    so use `invalidate` after writing files that must be seen.
+
+    Args:
+        - maxsize: Maximum number of patterns kept, least recently used are evicted [default = GLOB_CACHE_SIZE]
+        - ttl: If given, entries at least ttl seconds old are rescanned regardless of mtimes,
+          so a ttl of 0 disables reuse
+    '''
+    def __init__(self, maxsize=GLOB_CACHE_SIZE, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = Lock()
+        self.hits = self.misses = 0
+
+    @staticmethod
+    def _key(pathname, recursive):
+        pathname = os.fspath(pathname)
+        root = None if os.path.isabs(pathname) else os.getcwd()
+        return (pathname, root, bool(recursive))
+
+    def _is_fresh(self, entry):
+        created, mtimes, _ = entry
+        if self.ttl is not None and monotonic() - created >= self.ttl:
+            return False
+        for dirname, mtime in mtimes.items():
+            try:
+                if os.stat(dirname or os.curdir).st_mtime_ns != mtime:
+                    return False
+            except OSError:
+                if mtime is not None:
+                    return False
+        return True
+
+    def glob(self, pathname, recursive=False):
+        ''' Returns the list of paths matching pathname, from the cache when it is still valid.'''
+        key = self._key(pathname, recursive)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and self._is_fresh(entry):
+            with self._lock:
+                self.hits += 1
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+            return list(entry[2])
+        seen = {}
+        created = monotonic()
+        paths = [path for path, _ in _iglob(key[0], recursive, None, seen)]
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = (created, seen, tuple(paths))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return paths
+
+    def invalidate(self, pathname=None):
+        ''' Drop the cached results for pathname (for either value of recursive), or all results.'''
+        with self._lock:
+            if pathname is None:
+                self._entries.clear()
+                return
+            pathname = os.fspath(pathname)
+            for key in [k for k in self._entries if k[0] == pathname]:
+                del self._entries[key]
+
+    def clear(self):
+        ''' Drop all cached results and reset the statistics.'''
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def info(self):
+        ''' Returns a dict with the keys hits, misses, maxsize, currsize and ttl.'''
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'maxsize': self.maxsize,
+                    'currsize': len(self._entries), 'ttl': self.ttl}
+
+
+# The cache shared by cached_glob when no cache is given
+_glob_cache = GlobCache()
+
+
+@pipeable
+def cached_glob(pathname, *, recursive=False, cache=None):
+    '''Return the list of path names that match pathname, like glob, caching the result.
+
+    Repeated calls with the same pattern (and working directory, for relative patterns)
+    only check the modification times of the directories that were listed, and rescan
+    when one of them changed.  See GlobCache for the details.
+
+    Args:
+        - pathname: A path pattern with shell-style wildcards
+        - recursive: Whether "**" matches any files and zero or more directories [default = False]
+        - cache: The GlobCache to use [default = the shared module cache]
+
+    Returns: A new list of matching path names
+    '''
+    return (_glob_cache if cache is None else cache).glob(pathname, recursive)
+
+
+def glob_cache_info():
+    ''' Returns the statistics of the shared glob cache, see GlobCache.info.'''
+    return _glob_cache.info()
+
+
+def invalidate_glob_cache(pathname=None):
+    ''' Drop the shared cache's results for pathname, or all results when no pathname is given.'''
+    _glob_cache.invalidate(pathname)
+
+
+def clear_glob_cache():
+    ''' Empty the shared glob cache and reset its statistics.'''
+    _glob_cache.clear()
+
+
+def configure_glob_cache(*, maxsize=GLOB_CACHE_SIZE, ttl=None):
+    ''' Replace the shared glob cache with an empty one using the given bounds.'''
+    global _glob_cache
+    _glob_cache = GlobCache(maxsize, ttl)
@@ -0,0 +1,181 @@
+""" Opt-in per-stage instrumentation for pipes.
+
+While enabled, every `x >> f` step through a `pipeable`, `fast_pipeable`,
+`apipeable` (see composable.aio) or predicate (e.g. `is_gt(0)`, see composable.operator) records
+its call count, cumulative and maximum wall time and, for sized inputs/outputs,
+the number of items going in and out.  Stages are keyed by the module-qualified
+name of the wrapped function (e.g. `composable.strict.map`), and predicates by their `name`.
+Async stages are recorded when they are piped into, so their time is that of
+scheduling the stage rather than awaiting it.
+
+Instrumentation works by swapping the `__rrshift__` method of the pipeable classes,
+so the disabled path is exactly the uninstrumented code.
+
+>>> from composable import instrument, strict
+>>> with instrument.instrumented() as stats:
+...     _ = range(5) >> strict.map(abs) >> strict.filter(bool)
+>>> stats.report()['composable.strict.map']['calls']
+1
+"""
+from .pipeable import pipeable, fast_pipeable
+from ._predicate import Predicate
+from .aio import apipeable
+from contextlib import contextmanager
+from threading import Lock
+from time import perf_counter
+
+
+class StageStats(object):
+    """ Accumulated measurements for a single pipe stage."""
+    __slots__ = ('calls', 'total', 'max', 'items_in', 'items_out')
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.items_in = 0
+        self.items_out = 0
+
+    def as_dict(self):
+        return {'calls': self.calls,
+                'total': self.total,
+                'max': self.max,
+                'mean': self.total / self.calls if self.calls else 0.0,
+                'items_in': self.items_in,
+                'items_out': self.items_out,
+               }
+
+
+class Recorder(object):
+    """ Thread-safe collection of `StageStats` keyed by stage name."""
+    def __init__(self):
+        self._lock = Lock()
+        self.stages = {}
+
+    def record(self, key, elapsed, value, result):
+        with self._lock:
+            stats = self.stages.get(key)
+            if stats is None:
+                stats = self.stages[key] = StageStats()
+            stats.calls += 1
+            stats.total += elapsed
+            if elapsed > stats.max:
+                stats.max = elapsed
+            stats.items_in += _size(value)
+            stats.items_out += _size(result)
+
+    def reset(self):
+        with self._lock:
+            self.stages.clear()
+
+    def report(self):
+        """ Returns a dict of stage name: measurements, ordered by cumulative time."""
+        with self._lock:
+            items = sorted(self.stages.items(), key = lambda kv: kv[1].total, reverse = True)
+            return {key: stats.as_dict() for key, stats in items}
+
+    def to_json(self, **kwargs):
+        import json
+        return json.dumps(self.report(), **kwargs)
+
+    def format_report(self):
+        """ A plain-text table of the report, suitable for logging."""
+        lines = [f"{'stage':<40} {'calls':>8} {'total(s)':>10} {'max(s)':>10} {'in':>10} {'out':>10}"]
+        for key, s in self.report().items():
+            lines.append(f"{key:<40} {s['calls']:>8} {s['total']:>10.6f} {s['max']:>10.6f} "
+                         f"{s['items_in']:>10} {s['items_out']:>10}")
+        return '\n'.join(lines)
+
+
+def _size(value):
+    try:
+        return len(value)
+    except Exception:
+        return 0
+
+
+def _stage_name(stage):
+    if isinstance(stage, Predicate):
+        return stage.name
+    func = stage.func
+    name = getattr(func, '__qualname__', None) or getattr(func, '__name__', None) or repr(func)
+    module = getattr(func, '__module__', None)
+    return f"{module}.{name}" if module else name
+
+
+recorder = Recorder()
+
+_originals = {}
+_depth = 0
+_switch_lock = Lock()
+
+
+def _instrumented(rrshift):
+    def __rrshift__(self, other):
+        start = perf_counter()
+        result = None
+        try:
+            result = rrshift(self, other)
+            return result
+        finally:
+            recorder.record(_stage_name(self), perf_counter() - start, other, result)
+    __rrshift__.__doc__ = rrshift.__doc__
+    return __rrshift__
+
+
+def enable():
+    """ Start recording pipe stages (a global switch, see also `instrumented`)."""
+    with _switch_lock:
+        for cls in (pipeable, fast_pipeable, apipeable, Predicate):
+            if cls not in _originals:
+                _originals[cls] = cls.__rrshift__
+                cls.__rrshift__ = _instrumented(cls.__rrshift__)
+
+
+def disable():
+    """ Stop recording pipe stages, restoring the uninstrumented dispatch."""
+    with _switch_lock:
+        for cls, rrshift in _originals.items():
+            cls.__rrshift__ = rrshift
+        _originals.clear()
+
+
+def is_enabled():
+    return bool(_originals)
+
+
+def reset():
+    """ Clear all recorded measurements."""
+    recorder.reset()
+
+
+def report():
+    """ Returns the recorded measurements, see `Recorder.report`."""
+    return recorder.report()
+
+
+@contextmanager
+def instrumented(*, reset_stats = True):
+    """ Context manager that records pipe stages in the body and yields the `recorder`.
+
+    Args.
+        - reset_stats: Clear previous measurements on entry. [default = True]
+
+    Nested blocks share the recorder, instrumentation is switched off when the
+    outermost block exits (unless it was enabled globally beforehand).
+    """
+    global _depth
+    with _switch_lock:
+        was_enabled = bool(_originals) and _depth == 0
+        _depth += 1
+    if reset_stats and _depth == 1:
+        recorder.reset()
+    enable()
+    try:
+        yield recorder
+    finally:
+        with _switch_lock:
+            _depth -= 1
+            done = _depth == 0
+        if done and not was_enabled:
+            disable()
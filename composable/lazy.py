@@ -0,0 +1,151 @@
+from __future__ import annotations
+from .pipeable import fast_pipeable
+from .object import as_function
+from ._typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Callable, Iterator, TypeVar
+
+    A = TypeVar('A')
+    B = TypeVar('B')
+
+
+
+def __getattr__(name):
+    # to_list/to_tuple are re-exported from composable.sequence, which is only
+    # imported when they are first used
+    if name in ('to_list', 'to_tuple'):
+        from . import sequence
+        value = globals()[name] = getattr(sequence, name)
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__builtin_map = map
+__builtin_filter = filter
+__builtin_zip = zip
+__builtin_enumerate = enumerate
+
+
+@fast_pipeable
+def map(f, L):
+    ''' lazily applies f to all elements of L, returning an iterator of the resulting values.
+
+    Equivalent to (f(x) for x in L)
+    Args:
+        f: A unary function
+        L: Any iterable, including single-pass generators
+
+    Returns:
+        An iterator over the results of f applied to each element of L.
+        Note that this is the lazy counterpart of composable.strict.map;
+        use composable.sequence.to_list to materialize the results.
+
+    >>> from composable.lazy import map, to_list
+    >>> range(3) >> map(lambda x: x + 5) >> to_list
+    [5, 6, 7]
+    '''
+    return __builtin_map(as_function(f), L)
+
+
+@fast_pipeable
+def star_map(f, L):
+    ''' lazily applies f after unpacking the elements of L as positional arguments.
+
+    Equivalent to (f(*args) for args in L)
+    Args:
+        f: A function taking one or more positional arguments
+        L: An iterable of tuples of values to be unpacked when calling f
+
+    Returns:
+        An iterator over the results of f applied to each element of L.
+
+    >>> from composable.lazy import star_map, to_list
+    >>> from operator import add
+    >>> zip(range(5), range(2, 7)) >> star_map(add) >> to_list
+    [2, 4, 6, 8, 10]
+    '''
+    return (f(*args) for args in L)
+
+
+@fast_pipeable
+def filter(p, L):
+    ''' Lazily filters the elements of L, yielding the elements that pass the predicate p.
+
+    Args:
+        p: a unary boolean function used to filter the sequence
+        L: Any iterable, including single-pass generators
+
+    Returns:
+        An iterator over the elements of L that satisfy p.
+
+    >>> from composable.lazy import filter, to_list
+    >>> range(6) >> filter(lambda x: x % 2 == 1) >> to_list
+    [1, 3, 5]
+    '''
+    return __builtin_filter(as_function(p), L)
+
+
+@fast_pipeable
+def zipWith(iter2, iter1):
+    ''' lazily zips the elements of iter1 and iter2 into tuples of the form (i1, i2)
+
+    args:
+        iter2: an iterable of values
+        iter1: an iterable of values
+
+    returns:
+        an iterator of tuples of the form (i1, i2).
+        note that the order is reversed for more natural piping,
+        that is iter1 >> zipWith(iter2) has the values of iter1 first, i.e. (i1, i2)
+    '''
+    return __builtin_zip(iter1, iter2)
+
+
+@fast_pipeable
+def zipOnto(iter1, iter2):
+    ''' lazily zips the elements of iter1 and iter2 into tuples of the form (i2, i1)
+
+    args:
+        iter1: an iterable of values
+        iter2: an iterable of values
+
+    returns:
+        an iterator of tuples of the form (i2, i1).
+        note that the order is the same as the built-in zip, meaning piping will reverse the order
+        that is iter1 >> zipOnto(iter2) has the values of iter1 first, i.e. (i2, i1)
+    '''
+    return __builtin_zip(iter1, iter2)
+
+
+@fast_pipeable
+def enumerate(iter):
+    ''' lazily pairs each value with its index, (index, value)
+
+    Args:
+        iter: Any iterable of values
+
+    Returns:
+        An iterator of tuples of the form (index, value).
+    '''
+    return __builtin_enumerate(iter)
+
+
+@fast_pipeable
+def split_by(funcs: list[Callable[[A], B]], obj:A) -> Iterator[B]:
+    '''Lazily apply each of a list of functions to an object, yielding the results.
+
+    Args:
+        - funcs: A list of functions.
+        - obj: Object to use as an argument.
+
+    Returns: An iterator of return values.
+
+    Example:
+
+    >>> from composable.lazy import split_by, to_list
+    >>> from toolz.curried.operator import add, mul
+    >>> 3 >> split_by([add(1), add(2), mul(3)]) >> to_list
+    [4, 5, 9]
+    '''
+    return (f(obj) for f in funcs)
@@ -7,28 +7,46 @@ class Nothing(object):
     """A class representing nuothing
 
     This class allows calling any attribute or calling like a function.
+
+    Nothing is a singleton, `Nothing()` always returns the same instance.
     """
-    def __init__(self):
-        pass
+    __slots__ = ()
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = object.__new__(cls)
+        return cls._instance
 
     def __getattr__(self, name):
-        return Nothing()
+        return _nothing
 
     def __call__(self, *args, **kwargs):
-        return Nothing()
+        return _nothing
 
     def __repr__(self):
         return "Nothing()"
 
+    def __reduce__(self):
+        return (Nothing, ())
+
+
+_nothing = Nothing()
+
 
 class Just(object):
     """A class representing a non-missing value
 
     Any attribute or call will be passed to the underlying object.
     """
+    __slots__ = ('just',)
+
     def __init__(self, just):
         self.just = just
 
+    def __reduce__(self):
+        return (Just, (self.just,))
+
     def __getattr__(self, name):
         return Just(getattr(self.just, name))
 
@@ -51,7 +69,7 @@ def maybe(value):
     
     Returns (Maybe): Just(value) or Nothing()
     """
-    return Nothing() if value is None else Just(value)
+    return _nothing if value is None else Just(value)
 
 @pipeable
 def unmaybe(value):
@@ -80,7 +98,7 @@ def map(func, value):
     Returns:
         Maybe[T]: Returns the result of applying `func` to the optional value, or Nothing()
     """
-    return Just(func(value.just)) if isinstance(value, Just) else Nothing()
+    return Just(func(value.just)) if isinstance(value, Just) else _nothing
 
 @pipeable
 def just_if(pred, value):
@@ -98,7 +116,7 @@ def just_if(pred, value):
     if isinstance(value, Just) and pred(value.just):
         return value
     else:
-        return Nothing()
+        return _nothing
 
 @pipeable
 def try_(func, value):
@@ -114,7 +132,7 @@ def try_(func, value):
     try:
         return Just(func(value.just))
     except:
-        return Nothing()
+        return _nothing
 
 @pipeable
 def is_just(value):
@@ -126,3 +144,42 @@ def is_nothing(value):
     """Determines if an optional wrapped value is missing."""
     return isinstance(value, Nothing)
 
+
+@pipeable
+def map_many(func, values):
+    """Maybe-maps a function over a sequence of optional wrapped values in a single loop.
+
+    Equivalent to `values >> strict.map(maybe.map(func))`, without dispatching through a pipeable for each item.
+
+    Args:
+        func (Callable[T, S]): A function that takes one argument of type T and returns an object of type S.
+        values (Iterable[Maybe[T]]): A sequence of optional values
+
+    Returns:
+        List[Maybe[S]]: Just(func(val)) for each Just(val) and Nothing() for each Nothing()
+    """
+    return [Just(func(v.just)) if isinstance(v, Just) else _nothing for v in values]
+
+@pipeable
+def filter_just(values):
+    """Keeps the values of a sequence of optional wrapped values that exist.
+
+    Args:
+        values (Iterable[Maybe[T]]): A sequence of optional values
+
+    Returns:
+        List[Just[T]]: The Just(val) items, in order, with every Nothing() removed
+    """
+    return [v for v in values if isinstance(v, Just)]
+
+@pipeable
+def unmaybe_many(values):
+    """Extracts the optional values from a sequence of objects of type Maybe in a single loop.
+
+    Args:
+        values (Iterable[Maybe[T]]): A sequence of optional values
+
+    Returns:
+        List[Optional[T]]: val for each Just(val) and None for each Nothing()
+    """
+    return [v.just if isinstance(v, Just) else None for v in values]
@@ -1,35 +1,136 @@
-from composable import pipeable
+from ._predicate import Predicate
+from functools import lru_cache
+from keyword import iskeyword
+from operator import attrgetter
+
+
+# Chain steps are ('attr', name), ('call', args, kwargs items) or ('fn', function)
+def _shape(steps):
+    ''' Splits a chain into its shape (names and argument counts) and the values it uses.'''
+    shape = []
+    values = []
+    for step in steps:
+        kind = step[0]
+        if kind == 'attr':
+            shape.append(step)
+        elif kind == 'call':
+            shape.append(('call', len(step[1]), tuple(k for k, _ in step[2])))
+            values.extend(step[1])
+            values.extend(v for _, v in step[2])
+        else:
+            shape.append(('fn',))
+            values.append(step[1])
+    return tuple(shape), values
+
+
+def _is_name(s):
+    return s.isidentifier() and not iskeyword(s)
+
+
+@lru_cache(maxsize=1024)
+def _template(shape):
+    ''' Generates (once per chain shape) a factory for a flat function running the chain.
+
+    For example the shape of `obj.strip().split(',')` gives
+    `def factory(v0): return lambda x: x.strip().split(v0)`, so the chain runs as fast as
+    the equivalent hand-written lambda.
+    '''
+    expr = 'x'
+    params = []
+    def param():
+        params.append(f'v{len(params)}')
+        return params[-1]
+    for step in shape:
+        kind = step[0]
+        if kind == 'attr':
+            name = step[1]
+            if _is_name(name):
+                expr = f'{expr}.{name}'
+            else:
+                expr = f'getattr({expr}, {name!r})'
+        elif kind == 'call':
+            args = [param() for _ in range(step[1])]
+            keys = step[2]
+            if all(_is_name(k) for k in keys):
+                args += [f'{k}={param()}' for k in keys]
+            else:
+                args += [f'**{{{", ".join(f"{k!r}: {param()}" for k in keys)}}}']
+            expr = f'{expr}({", ".join(args)})'
+        else:
+            expr = f'{param()}({expr})'
+    namespace = {}
+    exec(f'def factory({", ".join(params)}):\n    return lambda x: {expr}', namespace)
+    return namespace['factory']
+
+
+def compile_chain(steps):
+    ''' Returns a plain function running a chain of steps, generated once per chain shape.'''
+    shape, values = _shape(steps)
+    return _template(shape)(*values)
+
 
 class PipeableObject(object):
-    def __init__(self, function = lambda x: x, after_method_call = False):
-        self._function = function
+    ''' Records attribute access and method calls, e.g. `obj.strip().split(',')`, as a chain of steps.
+
+    The chain is compiled into a single generated function the first time it is applied,
+    with the code generated once per chain shape (see `_template`).
+    '''
+    __slots__ = ('_steps', '_after_method_call', '_compiled')
+
+    def __init__(self, function = None, after_method_call = False, *, steps = None):
+        if steps is None:
+            steps = () if function is None else (('fn', function),)
+        self._steps = steps
         self._after_method_call = after_method_call
+        self._compiled = None
+
+    @property
+    def _function(self):
+        compiled = self._compiled
+        if compiled is None:
+            compiled = self._compiled = compile_chain(self._steps)
+        return compiled
 
     def __getattr__(self, name):
-        return PipeableObject(lambda x: getattr(self._function(x), name), after_method_call = False)
+        return PipeableObject(steps = self._steps + (('attr', name),))
 
     def __call__(self, *args, **kwargs):
         if self._after_method_call:
-            return self._function(*args, **kwargs)
+            return (self._compiled or self._function)(*args, **kwargs)
         else:
-            return PipeableObject(lambda x: self._function(x)(*args, **kwargs),
+            return PipeableObject(steps = self._steps + (('call', args, tuple(kwargs.items())),),
                                   after_method_call = True)
 
     def __rrshift__(self, other):
-        return self._function(other)
+        return (self._compiled or self._function)(other)
 
 obj = PipeableObject()
 
+
+def as_function(f):
+    ''' Returns the compiled function of a method chain like `obj.strip().lower()` or a Predicate, otherwise f.
+
+    Used by map/filter to call the compiled function directly for each item.
+    '''
+    if type(f) is PipeableObject and f._after_method_call:
+        return f._function
+    if type(f) is Predicate:
+        return f.function
+    return f
+
+
 class PipeableAttribute(object):
     def __init__(self, function = lambda x: x):
         self.function = function
 
     def __getattr__(self, name):
-        return pipeable(lambda x: getattr(x, name))
-    
+        # Imported here so that strict/lazy (which use as_function) don't load toolz
+        from .pipeable import pipeable
+        return pipeable(attrgetter(name))
+
     def __rrshift__(self, other):
         return self.function(other)
-    
+
     def __call__(self, *args, **kwargs):
         return self.function(*args, **kwargs)
 
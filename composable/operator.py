@@ -1,16 +1,74 @@
-from .pipeable import pipeable
+from .pipeable import fast_pipeable, _func_property
+from ._numpy import vectorized
+from ._predicate import Predicate, _OPERATORS
 import operator as op
 
 
-is_lt = pipeable(lambda b, a: op.lt(a, b))
-is_le = pipeable(lambda b, a: op.le(a, b))
-is_eq = pipeable(lambda b, a: op.eq(a, b))
-is_ne = pipeable(lambda b, a: op.ne(a, b))
-is_ge = pipeable(lambda b, a: op.ge(a, b))
-is_gt = pipeable(lambda b, a: op.gt(a, b))
+def predicate(func):
+    ''' Wrap a unary boolean function as a Predicate, so it can be combined with `&`, `|` and `~`.
 
+    Comparisons like `is_gt(0)` are predicates too, and combined bounds are fused
+    into one comparison chain.
 
-not_ = pipeable(lambda obj:    op.not_(obj))
-truth = pipeable(lambda obj:   op.truth(obj))
-is_ = pipeable(lambda a, b:    op.is_(a, b))
-is_not = pipeable(lambda a, b: op.is_not(a, b))
+    >>> from composable.strict import filter
+    >>> range(12) >> filter(is_gt(0) & is_lt(10) & ~is_eq(5))
+    [1, 2, 3, 4, 6, 7, 8, 9]
+    >>> ['1', 'a', '22'] >> filter(predicate(str.isdigit) & ~predicate(lambda s: len(s) > 1))
+    ['1']
+    '''
+    return func if isinstance(func, Predicate) else Predicate(('fn', func))
+
+
+class _comparison(fast_pipeable):
+    __doc__ = _func_property('__doc__', ''' A comparison stage that gives a Predicate once only the tested value is missing.
+
+    `is_gt(b)` (or `is_gt(b = ...)`) is a Predicate, while `is_gt(b, a)`,
+    `is_gt(b)(a)` and `a >> is_gt(b)` give the result of `a > b`.
+    ''')
+    __slots__ = ()
+
+    def __call__(self, *args, **kwargs):
+        if not kwargs and len(args) >= self._need:
+            return self._partial(*args)
+        new = self._bind(args, kwargs)
+        if isinstance(new, _comparison) and new._need <= 0:
+            return new._partial()
+        return new
+
+    def _bind(self, args, kwargs):
+        new = super()._bind(args, kwargs)
+        if len(new.args) == 1 and not new.keywords:
+            return Predicate(('cmp', self.func.symbol, new.args[0]))
+        if not new.args and set(new.keywords) == {'b'}:
+            return Predicate(('cmp', self.func.symbol, new.keywords['b']))
+        return new
+
+    def __reduce__(self):
+        return (_restore_comparison, (self.func.__name__, self.args, self.keywords))
+
+
+def _make_comparison(name, symbol):
+    compare = _OPERATORS[symbol]
+    def is_op(b, a):
+        return compare(a, b)
+    is_op.__name__ = is_op.__qualname__ = name
+    is_op.__doc__ = f"""Tests a {symbol} b, where `{name}(b)` is a Predicate and `a >> {name}(b)` or `{name}(b, a)` is the result."""
+    is_op.symbol = symbol
+    return _comparison(vectorized(is_op))
+
+
+def _restore_comparison(name, args, kwargs):
+    return globals()[name](*args, **kwargs) if args or kwargs else globals()[name]
+
+
+is_lt = _make_comparison('is_lt', '<')
+is_le = _make_comparison('is_le', '<=')
+is_eq = _make_comparison('is_eq', '==')
+is_ne = _make_comparison('is_ne', '!=')
+is_ge = _make_comparison('is_ge', '>=')
+is_gt = _make_comparison('is_gt', '>')
+
+not_ = fast_pipeable(lambda obj:    op.not_(obj))
+truth = fast_pipeable(lambda obj:   op.truth(obj))
+is_ = fast_pipeable(lambda a, b:    op.is_(a, b))
+is_not = fast_pipeable(lambda a, b: op.is_not(a, b))
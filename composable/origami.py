@@ -33,7 +33,8 @@ def unfoldl(empty, func, state):
     out = []
     while not empty(state):
         new, state = func(state)
-        out = [new] + out
+        out.append(new)
+    out.reverse()
     return out
 
 
@@ -57,7 +58,7 @@ def unfoldr(empty, func, state):
     out = []
     while not empty(state):
         new, state = func(state)
-        out = out + [new]
+        out.append(new)
     return out
 
 @pipeable
@@ -89,7 +90,8 @@ def unfoldl_iter(func, state, seq):
     out = []
     for val in reversed(seq):
         new, state = func(state, val)
-        out = [new] + out
+        out.append(new)
+    out.reverse()
     return out
 
 
@@ -121,5 +123,78 @@ def unfoldr_iter(func, state, seq):
     out = []
     for val in seq:
         new, state = func(state, val)
-        out = out + [new]
-    return out
\ No newline at end of file
+        out.append(new)
+    return out
+
+
+@pipeable
+def iunfoldr(empty, func, state):
+    """ Lazily decompose a value into parts by unfolding the state to the right.
+
+    A generator version of `unfoldr`, which yields each component as soon as it
+    is computed.  Use it for large or unbounded unfolds (e.g., `empty` can be
+    `lambda s: False` when combined with `composable.sequence.head`).
+
+    Args.
+        - empty: A function that takes the current state as input 
+                 and returns True when state is empty and the process 
+                 should stop.
+        - func: A function that takes the current (non-empty) state
+                as input and returns (new, state); e.g., the next component
+                new and the updated state.
+        - state: The initial state to be decomposed.
+
+    Returns: An iterator over the decomposed parts of the original state,
+             in the same order as `unfoldr`.
+    """
+    while not empty(state):
+        new, state = func(state)
+        yield new
+
+
+@pipeable
+def iunfoldr_iter(func, state, seq):
+    """ Lazily decompose a sequence into a new sequence by iterating left to right 
+    using some updating state.
+
+    A generator version of `unfoldr_iter`, `seq` can be any iterable (including
+    single-pass and unbounded iterators).
+
+    Args.
+        - func: An arity 2 function that takes the current state
+                and next val of seq [in that order] 
+                and returns (new, state).
+        - state: The initial state.
+        - seq: An iterable of values.
+
+    Returns: An iterator over the new components, in the same order as `unfoldr_iter`.
+    """
+    for val in seq:
+        new, state = func(state, val)
+        yield new
+
+
+@pipeable
+def scan(update, init, seq):
+    """ Lazily yields the running results of folding a sequence.
+
+    Each value is the accumulator after combining the next element of `seq`, so
+    the last value is equal to `fold(update, init, seq)`.  The initial value is
+    not included.
+
+    Args.
+        - update: An arity 2 function taking (accumulator, value)
+        - init: The initial accumulator.
+        - seq: An iterable of values.
+
+    Returns: An iterator over the accumulated values.
+
+    Example
+    > from operator import add
+    > [1, 2, 3, 4] >> scan(add, 0) >> to_list
+    [1, 3, 6, 10]
+    """
+    acc = init
+    for val in seq:
+        acc = update(acc, val)
+        yield acc
\ No newline at end of file
@@ -0,0 +1,127 @@
+from .pipeable import fast_pipeable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import partial
+from itertools import chain, islice
+import os
+
+_EXECUTORS = {'process': ProcessPoolExecutor,
+              'thread': ThreadPoolExecutor,
+             }
+
+
+def _map_chunk(f, chunk):
+    return [f(x) for x in chunk]
+
+
+def _star_map_chunk(f, chunk):
+    return [f(*args) for args in chunk]
+
+
+def _filter_chunk(p, chunk):
+    return [x for x in chunk if p(x)]
+
+
+def _chunks(L, size):
+    it = iter(L)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
+
+def _run(chunk_func, f, L, *, workers, executor, chunksize, ordered, pool):
+    """ Split L into chunks, apply `chunk_func(f, chunk)` on a pool and flatten the results."""
+    if pool is None and executor not in _EXECUTORS:
+        raise ValueError(f"executor must be one of {list(_EXECUTORS)}, got {executor!r}")
+    items = L if isinstance(L, (list, tuple)) else list(L)
+    if not items:
+        return []
+    if chunksize is None:
+        # The size of a given pool isn't public, pass `workers` to match it
+        n_workers = workers or os.cpu_count() or 1
+        chunksize = max(1, -(-len(items) // (4 * n_workers)))
+    elif chunksize < 1:
+        raise ValueError("chunksize must be a positive integer")
+    work = partial(chunk_func, f)
+    owned = pool is None
+    if owned:
+        pool = _EXECUTORS[executor](max_workers=workers)
+    try:
+        if ordered:
+            results = pool.map(work, _chunks(items, chunksize))
+        else:
+            futures = [pool.submit(work, chunk) for chunk in _chunks(items, chunksize)]
+            results = (future.result() for future in as_completed(futures))
+        return list(chain.from_iterable(results))
+    finally:
+        if owned:
+            pool.shutdown()
+
+
+@fast_pipeable
+def map(f, L, *, workers = None, executor = 'process', chunksize = None, ordered = True, pool = None):
+    ''' applies f to all elements of L on a pool of workers, returning a list of the resulting values.
+
+    A parallel version of composable.strict.map.
+
+    Args:
+        f: A unary function.  Must be picklable (e.g. defined at module level) for process pools.
+        L: A finite iterable of values
+        workers: Number of workers for a new pool, and of the workers assumed when
+                 choosing the chunk size [default = os.cpu_count()]
+        executor: Either 'process' [default] or 'thread', ignored when `pool` is given.
+        chunksize: Number of items sent to a worker at a time.  By default the
+                   items are split into about four chunks per worker.
+        ordered: If False, the results are returned in completion order
+                 (chunk by chunk) rather than input order. [default = True]
+        pool: An existing `concurrent.futures.Executor` to reuse across calls.
+              The pool is left open, otherwise a pool is created and shut down for the call.
+
+    Returns:
+        A list of the results of f applied to each element of L.
+
+    >>> from composable.parallel import map
+    >>> range(5) >> map(abs, workers = 2, executor = 'thread')
+    [0, 1, 2, 3, 4]
+    '''
+    return _run(_map_chunk, f, L, workers=workers, executor=executor,
+                chunksize=chunksize, ordered=ordered, pool=pool)
+
+
+@fast_pipeable
+def star_map(f, L, *, workers = None, executor = 'process', chunksize = None, ordered = True, pool = None):
+    ''' applies f after unpacking the elements of L as positional arguments on a pool of workers.
+
+    A parallel version of composable.strict.star_map, see composable.parallel.map for
+    a description of the keyword arguments.
+
+    Args:
+        f: A function taking one or more positional arguments
+        L: A finite iterable of tuples of values to be unpacked when calling f
+
+    Returns:
+        A list of the results of f applied to each element of L.
+
+    >>> from composable.parallel import star_map
+    >>> from operator import add
+    >>> zip(range(3), range(2, 5)) >> star_map(add, executor = 'thread')
+    [2, 4, 6]
+    '''
+    return _run(_star_map_chunk, f, L, workers=workers, executor=executor,
+                chunksize=chunksize, ordered=ordered, pool=pool)
+
+
+@fast_pipeable
+def filter(p, L, *, workers = None, executor = 'process', chunksize = None, ordered = True, pool = None):
+    ''' Filters the elements of L on a pool of workers, returning a list of all elements that pass the predicate p.
+
+    A parallel version of composable.strict.filter, see composable.parallel.map for
+    a description of the keyword arguments.
+
+    Args:
+        p: a unary boolean function used to filter the list
+        L: A finite iterable of values
+
+    Returns:
+        A list of the elements of L that satisfy p.
+    '''
+    return _run(_filter_chunk, p, L, workers=workers, executor=executor,
+                chunksize=chunksize, ordered=ordered, pool=pool)
@@ -1,22 +1,140 @@
-from inspect import signature
-from functools import reduce
-from toolz import first, drop
-from toolz import curry
-from toolz.functoolz import Compose
+from importlib import import_module
+from functools import partial
+from types import FunctionType
 
+# `pipeable` (a toolz.curry) and `inspect` are only imported when first needed,
+# so that `import composable.strict` etc. stays cheap for short-lived processes.
 
-class pipeable(curry):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
 
+def __getattr__(name):
+    if name == 'pipeable':
+        global pipeable
+        from ._curry import pipeable
+        return pipeable
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+_MISSING_KEYWORD = float('inf')
+
+
+def _required_parameters(func):
+    """ Inspect `func` once and return (positional names, keyword-only names) for
+    the parameters without defaults, or `None` when no signature is available.
+    """
+    if type(func) is FunctionType and '__wrapped__' not in func.__dict__ and '__signature__' not in func.__dict__:
+        # Plain functions are read from their code object, without importing inspect
+        code = func.__code__
+        n_required = code.co_argcount - len(func.__defaults__ or ())
+        keyword_only = code.co_varnames[code.co_argcount:code.co_argcount + code.co_kwonlyargcount]
+        defaults = func.__kwdefaults__ or {}
+        return code.co_varnames[:n_required], tuple(name for name in keyword_only if name not in defaults)
+    from inspect import signature, Parameter
+    try:
+        params = signature(func).parameters.values()
+    except (TypeError, ValueError):
+        return None
+    positional = tuple(p.name for p in params
+                       if p.kind in (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD)
+                       and p.default is Parameter.empty)
+    keyword = tuple(p.name for p in params
+                    if p.kind == Parameter.KEYWORD_ONLY and p.default is Parameter.empty)
+    return positional, keyword
+
+
+class _func_property(object):
+    """ Read-only attribute that is forwarded to the wrapped function on instances."""
+    def __init__(self, name, class_value = None):
+        self.name = name
+        self.class_value = class_value
+
+    def __get__(self, instance, owner = None):
+        if instance is None:
+            return self.class_value
+        return getattr(instance.func, self.name)
+
+
+class fast_pipeable(object):
+    """ A low-overhead alternative to `pipeable` that does not go through `toolz.curry`.
+
+    The required parameters of the wrapped function are inspected once, when the
+    function is decorated.  Each partial application is a small slotted object
+    holding a C-level `functools.partial` and the number of positional arguments
+    still missing, so a call only compares that count with the number of new
+    arguments before either calling the function directly or returning a new
+    partial application.  Piping with `>>` behaves exactly as it does for `pipeable`.
+
+    >>> from composable.pipeable import fast_pipeable
+    >>> @fast_pipeable
+    ... def add(x, y):
+    ...     return x + y
+    >>> 2 >> add(3)
+    5
+    >>> add(3)(2)
+    5
+    """
+    # `__dict__` is only populated for decorated functions (see `__init__`), the
+    # partial applications built on each call keep all of their state in slots.
+    __slots__ = ('func', 'args', 'keywords', '_partial', '_positional', '_keyword', '_need', '__dict__')
+    # See pipeable: lets `arr >> f` reach __rrshift__ for NumPy arrays
+    __array_ufunc__ = None
+
+    def __init__(self, func, /, *args, **kwargs):
+        if not callable(func):
+            raise TypeError("Input must be callable")
+        if isinstance(func, fast_pipeable):
+            args = func.args + args
+            kwargs = func.keywords | kwargs
+            func = func.func
+        required = _required_parameters(func)
+        if required is None:
+            self._positional, self._keyword = None, ()
+        else:
+            self._positional, self._keyword = required
+        self._set_arguments(func, args, kwargs)
+        # Lets tools like doctest and autoapi attribute the wrapper to func's module
+        self.__module__ = getattr(func, '__module__', None)
+
+    def _set_arguments(self, func, args, kwargs):
+        self.func = func
+        self.args = args
+        self.keywords = kwargs
+        self._partial = partial(func, *args, **kwargs)
+        if self._positional is None:
+            self._need = 0
+        elif all(name in kwargs for name in self._keyword):
+            # Positional parameters are filled from the left, so any supplied by
+            # keyword are at the end of the list
+            self._need = sum(1 for name in self._positional[len(args):]
+                             if name not in kwargs)
+        else:
+            self._need = _MISSING_KEYWORD
+
+    def _bind(self, args, kwargs):
+        """ Build a partial application that reuses the arity computed at decoration."""
+        new = object.__new__(type(self))
+        new._positional = self._positional
+        new._keyword = self._keyword
+        new._set_arguments(self.func, self.args + args, self.keywords | kwargs)
+        return new
+
+    def __call__(self, *args, **kwargs):
+        if not kwargs:
+            if len(args) >= self._need:
+                return self._partial(*args)
+            return self._bind(args, kwargs)
+        new = self._bind(args, kwargs)
+        if new._need <= 0:
+            return new._partial()
+        return new
 
     def __rrshift__(self, other):
         """ Use rightshift to represent piping (i.e. `x >> f` is `f(x)`).
 
         Note that this form of piping assumes a unary function call.
         Use a curried/partial function to allow piping n-ary functions."""
-        return self.__call__(other)
-
+        if self._need <= 1:
+            return self._partial(other)
+        return self._bind((other,), {})
 
     def __rshift__(self, other):
         """ Use rightshift to represent piping (i.e. `x >> f` is `f(x)`).
@@ -24,4 +142,72 @@ class pipeable(curry):
         Note that this form of piping assumes a unary function call.
         Use a curried/partial function to allow piping n-ary functions."""
         assert callable(other), "All subsequent elements of a pipe must be callable"
-        return other.__call__(self)
\ No newline at end of file
+        return other.__call__(self)
+
+    __doc__ = _func_property('__doc__', __doc__)
+
+    def __getattr__(self, name):
+        # Forward the remaining function attributes (e.g. __name__, __qualname__)
+        if name in fast_pipeable.__slots__:
+            raise AttributeError(name)
+        return getattr(self.func, name)
+
+    @property
+    def __wrapped__(self):
+        return self.func
+
+    @property
+    def __signature__(self):
+        from inspect import signature
+        return signature(partial(self.func, *self.args, **self.keywords))
+
+    def __get__(self, instance, owner = None):
+        if instance is None:
+            return self
+        return type(self)(self, instance)
+
+    def __repr__(self):
+        name = getattr(self.func, '__qualname__', repr(self.func))
+        if not (self.args or self.keywords):
+            return f"<fast_pipeable {name}>"
+        bound = [repr(a) for a in self.args] + [f"{k}={v!r}" for k, v in self.keywords.items()]
+        return f"<fast_pipeable {name}({', '.join(bound)})>"
+
+    def __eq__(self, other):
+        return (isinstance(other, fast_pipeable)
+                and self.func == other.func
+                and self.args == other.args
+                and self.keywords == other.keywords)
+
+    def __hash__(self):
+        return hash((self.func, self.args, frozenset(self.keywords.items())))
+
+    def __reduce__(self):
+        func = self.func
+        modname = getattr(func, '__module__', None)
+        qualname = getattr(func, '__qualname__', None)
+        # Only restore by name when the name really leads back to func (a wrapper
+        # object may copy the name of the function it wraps)
+        if modname and qualname and '<' not in qualname and _resolve(modname, qualname) is func:
+            return (_restore_fast_pipeable, (modname, qualname, self.args, self.keywords))
+        return (_rebuild_fast_pipeable, (func, self.args, self.keywords))
+
+
+def _resolve(modname, qualname):
+    """ The function named modname.qualname (unwrapping a fast_pipeable), or None."""
+    try:
+        obj = import_module(modname)
+        for attr in qualname.split('.'):
+            obj = getattr(obj, attr)
+    except (ImportError, AttributeError):
+        return None
+    return obj.func if isinstance(obj, fast_pipeable) else obj
+
+
+def _restore_fast_pipeable(modname, qualname, args, kwargs):
+    """ Unpickle a `fast_pipeable` that decorates a module-level function."""
+    return fast_pipeable(_resolve(modname, qualname), *args, **kwargs)
+
+
+def _rebuild_fast_pipeable(func, args, kwargs):
+    return fast_pipeable(func, *args, **kwargs)
@@ -2,6 +2,15 @@ from composable import pipeable
 from types import SimpleNamespace
 from toolz import get as toolz_get
 from functools import reduce as base_reduce
+from array import array
+from operator import attrgetter, itemgetter
+from functools import lru_cache
+from keyword import iskeyword
+from collections import OrderedDict
+from threading import Lock
+from . import _numpy
+
+base_zip = zip
 
 class Record(SimpleNamespace):
     def __init__(self, /, *args, **kwargs):
@@ -16,14 +25,14 @@ class Record(SimpleNamespace):
         return self.__dict__[key]
 
     def __or__(self, other):
-        assert isinstance(other, dict) or isinstance(other, Record)
-        other_dict = other if isinstance(other, dict) else other.__dict__
+        assert isinstance(other, (dict, Record, SchemaRecord))
+        other_dict = other if isinstance(other, dict) else _as_dict(other)
         out_dict = self.__dict__ | other_dict
         return Record(**out_dict)
 
     def __ror__(self, other):
-        assert isinstance(other, dict) or isinstance(other, Record)
-        other_dict = other if isinstance(other, dict) else other.__dict__
+        assert isinstance(other, (dict, Record, SchemaRecord))
+        other_dict = other if isinstance(other, dict) else _as_dict(other)
         out_dict = other_dict | self.__dict__
         return Record(**out_dict)
         
@@ -36,7 +45,307 @@ class Record(SimpleNamespace):
     def items(self):
         return self.__dict__.items()
 
-_maybe_return_record = lambda input_val, out_dict: Record(**out_dict) if isinstance(input_val, Record) else out_dict   
+
+class SchemaRecord(object):
+    """ Base class for the slotted record classes created by `schema`.
+
+    Instances have the same interface as `Record` (attribute access, `keys`, `values`,
+    `items`, `__getitem__` and `|`), but store their fields in `__slots__`.  Like
+    `Record` and `dict` they are mutable and compare by value, so they are not
+    hashable; use `tuple(r.values())` as a key instead.
+    """
+    __slots__ = ()
+    _fields = ()
+    _get_values = staticmethod(lambda record: ())
+
+    @classmethod
+    def _make(cls, values):
+        """ Create an instance from an iterable of values in field order."""
+        rec = object.__new__(cls)
+        for name, val in base_zip(cls._fields, values):
+            object.__setattr__(rec, name, val)
+        return rec
+
+    def __repr__(self):
+        fields = ', '.join(f"{k}={v!r}" for k, v in self.items())
+        return f"record({fields})"
+
+    def __eq__(self, other):
+        if isinstance(other, (SchemaRecord, Record)):
+            return _as_dict(self) == _as_dict(other)
+        return NotImplemented
+
+    # Equal to a `Record` with the same fields, which is unhashable
+    __hash__ = None
+
+    def __getitem__(self, key):
+        if key in self._fields:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __or__(self, other):
+        assert isinstance(other, (dict, Record, SchemaRecord))
+        return _from_dict_like(self, _as_dict(self) | _as_dict(other))
+
+    def __ror__(self, other):
+        assert isinstance(other, (dict, Record, SchemaRecord))
+        return _from_dict_like(self, _as_dict(other) | _as_dict(self))
+
+    def __reduce__(self):
+        # Schema classes are created at runtime, so pickle the fields instead of the class
+        return (_restore_schema_record, (self._fields, self.values()))
+
+    def keys(self):
+        return self._fields
+
+    def values(self):
+        return self._get_values(self)
+
+    def items(self):
+        return tuple(base_zip(self._fields, self._get_values(self)))
+
+
+# Schema classes by their fields, the least recently used beyond MAX_SCHEMAS are
+# dropped (field sets can depend on the data, e.g. with records.update)
+MAX_SCHEMAS = 1024
+_schemas = OrderedDict()
+_schemas_lock = Lock()
+
+
+def schema(*fields):
+    """ Create (or fetch from a cache) a slotted record class with a fixed set of fields.
+
+    Args.
+        - fields: The field names, in order.  Must be identifiers that are not keywords,
+                  do not start with an underscore and are not `keys`, `values` or `items`.
+
+    Returns. A subclass of `SchemaRecord` whose instances are created with keyword
+             (or positional, in field order) arguments for every field.  Calling
+             `schema` again with the same fields returns the same class (unless
+             it was one of the least recently used, beyond `MAX_SCHEMAS` classes).
+
+    Notes.
+        - Instances use much less memory than `Record` and have faster attribute access.
+        - The `records` pipeables return an instance of the same class when the
+          fields are unchanged, and of the matching schema class otherwise.
+
+    > Point = records.schema('x', 'y')
+    > Point(x = 1, y = 2) >> records.update(z = lambda r: r.x + r.y)
+    record(x=1, y=2, z=3)
+    """
+    fields = tuple(fields)
+    cls = _schemas.get(fields)
+    if cls is not None:
+        try:
+            _schemas.move_to_end(fields)
+        except KeyError:
+            pass
+        return cls
+    assert all(name not in fields for name in ('keys', 'values', 'items')), "Record reserves the attributes: keys, values, and items"
+    if len(set(fields)) != len(fields):
+        raise ValueError(f"Duplicate field names in {fields}")
+    if not all(name.isidentifier() and not iskeyword(name) and not name.startswith('_') for name in fields):
+        raise ValueError(f"Field names must be identifiers that aren't keywords and don't start with an underscore: {fields}")
+    # Generate __init__ so that construction is a direct sequence of slot stores
+    args = ', '.join(fields)
+    body = ''.join(f"\n    self.{name} = {name}" for name in fields) or "\n    pass"
+    namespace = {}
+    exec(f"def __init__(self, {args}):{body}", namespace)
+    get_values = _tuple_getter(fields, attr = True)
+    cls = type(f"Schema_{'_'.join(fields)}",
+               (SchemaRecord,),
+               {'__slots__': fields, '_fields': fields, '__init__': namespace['__init__'],
+                '_get_values': staticmethod(get_values), '__module__': __name__})
+    with _schemas_lock:
+        cls = _schemas.setdefault(fields, cls)
+        _schemas.move_to_end(fields)
+        while len(_schemas) > MAX_SCHEMAS:
+            _schemas.popitem(last = False)
+    return cls
+
+
+def _restore_schema_record(fields, values):
+    return schema(*fields)._make(values)
+
+
+def _from_dict_like(record, out_dict):
+    """ Build a record of the same schema as `record` (or a matching one) from a dict."""
+    if isinstance(out_dict, SchemaRecord):
+        return out_dict
+    cls = type(record)
+    if cls._fields != tuple(out_dict):
+        cls = schema(*out_dict)
+    return cls(**out_dict)
+
+
+def _is_column(value):
+    return (not isinstance(value, (str, bytes, dict))
+            and hasattr(value, '__len__')
+            and hasattr(value, '__getitem__'))
+
+
+def _array_column(values):
+    """ Store ints/floats in a stdlib `array`, anything else stays a `list`."""
+    if all(type(v) is int for v in values):
+        try:
+            return array('q', values)
+        except OverflowError:
+            return values
+    if all(type(v) in (float, int) for v in values):
+        return array('d', values)
+    return values
+
+
+def _compact(values):
+    """ Convert a sequence of values into the most compact available column type."""
+    np = _numpy.np
+    if np is not None:
+        if isinstance(values, np.ndarray):
+            return values
+        try:
+            out = np.asarray(values)
+        except ValueError:
+            # Ragged nested sequences
+            return list(values)
+        # Only flat numeric/bool columns, nested lists must stay one value per row
+        return out if out.ndim == 1 and out.dtype.kind in 'biuf' else list(values)
+    if isinstance(values, array):
+        return values
+    return _array_column(list(values))
+
+
+def _take(column, indices):
+    """ Select the rows at `indices` from a column."""
+    if _numpy.is_array(column):
+        return column[_numpy.np.asarray(indices, dtype=_numpy.np.intp)]
+    if isinstance(column, array):
+        return array(column.typecode, [column[i] for i in indices])
+    return [column[i] for i in indices]
+
+
+def _to_list(column):
+    return column.tolist() if hasattr(column, 'tolist') else list(column)
+
+
+class Table(object):
+    """ A columnar collection of records that is itself a record of columns.
+
+    Each field is stored as one compact column: a NumPy array when numpy is installed,
+    otherwise a stdlib `array` for int/float fields, or a `list` for everything else.
+    Values that are not sequences (e.g., numbers or strings) are broadcast to the
+    length of the table.
+
+    Because a `Table` is a record of columns, the `records` pipeables act on it one
+    column at a time: `records.map(f)` and `records.apply(key = f)` call `f` with the
+    whole column, and `records.update` passes the table, so functions written with
+    NumPy expressions (e.g., `lambda t: t.a + t.b`) are vectorized.  `records.subset`,
+    `drop`, `get`, `heads` and `group_by` select columns or rows without building
+    per-row objects.
+
+    > t = records.Table(x = [1, 2, 3], y = [0.5, 1.5, 2.5])
+    > t >> records.update(z = lambda t: t.x * t.y) >> records.heads(2)
+    """
+    __slots__ = ('_columns', '_length')
+
+    def __init__(self, /, columns = None, **kwargs):
+        columns = dict(columns or {}, **kwargs)
+        assert all(name not in columns for name in ('keys', 'values', 'items')), "Table reserves the attributes: keys, values, and items"
+        lengths = {len(v) for v in columns.values() if _is_column(v)}
+        if len(lengths) > 1:
+            raise ValueError(f"All columns of a Table must have the same length, got {sorted(lengths)}")
+        n = lengths.pop() if lengths else 0
+        self._length = n
+        self._columns = {k: _compact(v if _is_column(v) else [v] * n)
+                         for k, v in columns.items()}
+
+    @classmethod
+    def from_records(cls, record_seq, *, default = None):
+        """ Build a table from an iterable of records (`dict` or `Record`) in one pass."""
+        return cls(_transpose_union(record_seq, default))
+
+    def to_records(self, *, use_record_class = True):
+        """ Returns a list with one record (`Record` or `dict`) per row."""
+        return list(self.rows(use_record_class = use_record_class))
+
+    def rows(self, *, use_record_class = True):
+        """ Lazily yields one record (`Record` or `dict`) per row."""
+        keys = tuple(self._columns)
+        columns = [_to_list(col) for col in self._columns.values()]
+        make = Record if use_record_class else dict
+        for vals in base_zip(*columns):
+            yield make(**dict(base_zip(keys, vals)))
+
+    def take(self, indices):
+        """ Returns a new table with the rows at `indices`."""
+        return Table({k: _take(col, indices) for k, col in self._columns.items()})
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, key):
+        return self._columns[key]
+
+    def __getattr__(self, name):
+        if name in Table.__slots__:
+            raise AttributeError(name)
+        try:
+            return self._columns[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __contains__(self, key):
+        return key in self._columns
+
+    def __eq__(self, other):
+        if not isinstance(other, Table):
+            return NotImplemented
+        return (list(self.keys()) == list(other.keys())
+                and all(_to_list(a) == _to_list(b)
+                        for a, b in base_zip(self.values(), other.values())))
+
+    def __or__(self, other):
+        assert isinstance(other, (dict, Record, Table))
+        return Table(self._columns | dict(other.items()))
+
+    def __ror__(self, other):
+        assert isinstance(other, (dict, Record, Table))
+        return Table(dict(other.items()) | self._columns)
+
+    def __repr__(self):
+        cols = ', '.join(f"{k}={type(v).__name__}" for k, v in self._columns.items())
+        return f"Table(rows={self._length}, {cols})"
+
+    def keys(self):
+        return self._columns.keys()
+
+    def values(self):
+        return self._columns.values()
+
+    def items(self):
+        return self._columns.items()
+
+
+def _maybe_return_record(input_val, out_dict):
+    if isinstance(input_val, Record):
+        return Record(**out_dict)
+    if isinstance(input_val, SchemaRecord):
+        return _from_dict_like(input_val, out_dict)
+    if isinstance(input_val, Table):
+        return Table(out_dict)
+    return out_dict
+
+@pipeable
+def to_table(record_seq, *, default = None):
+    """ Converts a sequence of records to a columnar `Table`.
+
+    Args.
+        - record_seq: Any iterable of records (`dict` or `Record`), traversed once.
+        - default: The default value used for any missing key. [default = `None`]
+
+    Returns: A `Table` with one column per key.
+    """
+    return Table.from_records(record_seq, default = default)
+
 
 @pipeable
 def create(val, *, use_record_class = True, **funcs):
@@ -69,6 +378,7 @@ def apply(record, **funcs):
           with the key.
         - key:func pairs will be ignored for any key that isn't in the original record.
         - See `records.update` for a function that gets the whole record as input.
+        - For a `Table`, each function receives the whole column.
 
     Returns.  A record of the same type as the argument
               with the values of each keyword updated the
@@ -85,7 +395,10 @@ def map(func, record):
 
     Args.
         - func: An arity 1 function
-        - record: A record (`dict` or `Record`)
+        - record: A record (`dict`, `Record` or `Table`)
+
+    Notes.
+        - For a `Table`, `func` is applied to each whole column.
 
     Returns.  A record of the same type as the argument
               with the value updated using `func`
@@ -95,8 +408,89 @@ def map(func, record):
     return _maybe_return_record(record, out_dict)
 
 
+_RESERVED = ('keys', 'values', 'items')
+
+
+class _Scratch(object):
+    """ A private, mutable attribute/item view over a dict used by transient updates."""
+    __slots__ = ('_data',)
+
+    def __init__(self, data):
+        self._data = data
+
+    def __getattr__(self, name):
+        try:
+            return self._data[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def keys(self):
+        return self._data.keys()
+
+    def values(self):
+        return self._data.values()
+
+    def items(self):
+        return self._data.items()
+
+
+def _transient_update(record, pairs):
+    """ Apply (key, func) pairs sequentially to one private scratch record that is
+    mutated in place and returned (or converted once) at the end.
+    """
+    if isinstance(record, Record):
+        scratch = Record.__new__(Record)
+        data = scratch.__dict__
+        data.update(record.__dict__)
+        for k, f in pairs:
+            data[k] = f(scratch)
+        return scratch
+    elif isinstance(record, dict):
+        data = dict(record)
+        for k, f in pairs:
+            data[k] = f(data)
+        return data
+    elif isinstance(record, SchemaRecord):
+        data = _as_dict(record)
+        scratch = _Scratch(data)
+        for k, f in pairs:
+            data[k] = f(scratch)
+        return _from_dict_like(record, data)
+    else:
+        return base_reduce(lambda acc, p: acc | {p[0]: p[1](acc)}, pairs, record)
+
+
+class UpdatePlan(object):
+    """ A precompiled sequential update that can be reused across many records.
+
+    The field names are checked once, when the plan is created, and each record is
+    then updated in transient mode (see `records.update`).  A plan can be passed to
+    `records.update(plan = ...)`, called directly or used as a pipe stage.
+
+    > plan = records.UpdatePlan(total = lambda r: r.a + r.b, double = lambda r: r.total * 2)
+    > recs >> strict.map(plan)
+    """
+    __slots__ = ('pairs',)
+
+    def __init__(self, **funcs):
+        assert all(name not in funcs for name in _RESERVED), "Record reserves the attributes: keys, values, and items"
+        self.pairs = tuple(funcs.items())
+
+    def __call__(self, record):
+        return _transient_update(record, self.pairs)
+
+    def __rrshift__(self, record):
+        return _transient_update(record, self.pairs)
+
+    def __repr__(self):
+        return f"UpdatePlan({', '.join(k for k, _ in self.pairs)})"
+
+
 @pipeable
-def update(record, *, sequential = False, **funcs):
+def update(record, *, sequential = False, transient = False, plan = None, **funcs):
     """ Updates the record by applying each function to the whole record
    and saving the resulting key/value pair.
 
@@ -106,18 +500,33 @@ def update(record, *, sequential = False, **funcs):
                       argument order, with each subsequent function getting the 
                       previous resulting value.  This means that value from the previous step
                       can reference the previous keys. [default = False]
+        - transient: If True, perform a sequential update by mutating a single
+                     private copy of the record, instead of building a new record
+                     for each function.  [default = False]
+        - plan: An `UpdatePlan` to apply (sequentially and in transient mode) in
+                place of `funcs`.
         - funcs: One or more functions assigned using keywords.
 
     Notes.
         - `records.update` gets the whole record as input.
         - Can be used to update existing or create new key:value pairs.
         - See `records.apply` for a function that only acts on the value of the given key.
+        - For a `Table`, each function receives the whole table (a record of columns)
+          and returns a column, or a scalar that is broadcast to every row.
+        - In transient mode, the functions of a `Record` update receive the scratch
+          `Record`, which is returned at the end, so they must not keep a reference to it.
         
     Returns.  Creates a record (`Record` or `dict`) by applying each 
               function to the entire incoming `record` and assigning the result to
               the corresponding key.
     """
-    if sequential and isinstance(record, dict):
+    if plan is not None:
+        assert not funcs, "Provide either a plan or keyword functions, not both"
+        return _transient_update(record, plan.pairs)
+    elif transient:
+        assert all(name not in funcs for name in _RESERVED), "Record reserves the attributes: keys, values, and items"
+        return _transient_update(record, funcs.items())
+    elif sequential and isinstance(record, dict):
         init = {}
         init.update(record)
         def update_record(acc, pair):
@@ -132,12 +541,143 @@ def update(record, *, sequential = False, **funcs):
         updates = {k:f(record) for k, f in funcs.items()}
         return _maybe_return_record(record, record | updates)
 
-@pipeable
+class KeySelector(object):
+    """ A key set compiled for fast selection by `records.get`, `subset` and `drop`.
+
+    Membership uses a `frozenset`, and for each record layout (the ordered keys of
+    a `dict`/`Record`, or a schema class) the selected keys and an `itemgetter` /
+    `attrgetter` are computed once and cached.  Selecting from a stream of records
+    with the same layout then only costs a key check and a getter call per record:
+    a schema record's plan is found by its class, and a `dict`/`Record` with the same
+    keys as the previous one reuses its plan.  The output keeps the key order of the
+    record (of the previous one, for a record with the same keys in another order).
+
+    Selectors are built (and cached) automatically from the key lists passed to the
+    pipeables, see `compile_keys`.
+    """
+    __slots__ = ('keys', 'key_set', '_plans', '_last')
+    max_layouts = 64
+
+    def __init__(self, keys):
+        self.keys = tuple(keys)
+        self.key_set = frozenset(self.keys)
+        self._plans = {True: {}, False: {}}
+        self._last = {True: None, False: None}
+
+    def _plan(self, layout, keep):
+        """ Returns (selected names, tuple getter[, schema class]) for a record layout."""
+        plans = self._plans[keep]
+        plan = plans.get(layout)
+        if plan is None:
+            is_schema = isinstance(layout, type)
+            fields = layout._fields if is_schema else layout
+            names = tuple(k for k in fields if (k in self.key_set) == keep)
+            plan = (names, _tuple_getter(names, attr = is_schema), schema(*names) if is_schema else None)
+            if len(plans) < self.max_layouts:
+                plans[layout] = plan
+        return plan
+
+    def select(self, record, keep = True):
+        """ Returns (names, values) for the selected (keep=True) or remaining keys."""
+        if isinstance(record, (dict, Record)):
+            d = record if isinstance(record, dict) else record.__dict__
+            # Rows of a stream usually have the same keys as the previous one, whose
+            # plan is reused without building the layout of the row
+            last = self._last[keep]
+            if last is not None and d.keys() == last[0]:
+                names, getter, _ = last[1]
+            else:
+                layout = tuple(d)
+                plan = self._plan(layout, keep)
+                self._last[keep] = (frozenset(layout), plan)
+                names, getter, _ = plan
+            return names, getter(d)
+        if isinstance(record, SchemaRecord):
+            names, getter, _ = self._plan(type(record), keep)
+            return names, getter(record)
+        pairs = [(k, v) for k, v in record.items() if (k in self.key_set) == keep]
+        return tuple(k for k, _ in pairs), tuple(v for _, v in pairs)
+
+    def values(self, record):
+        """ Returns a list of the values of the selected keys, in record order."""
+        return list(self.select(record)[1])
+
+    def subset(self, record, keep = True):
+        """ Returns a record of the same type with only the selected (or remaining) keys."""
+        if isinstance(record, SchemaRecord):
+            names, getter, cls = self._plan(type(record), keep)
+            return cls(*getter(record))
+        names, values = self.select(record, keep)
+        if isinstance(record, Record):
+            # The names come from a valid record, so the reserved-name check can be skipped
+            out = Record.__new__(Record)
+            out.__dict__.update(base_zip(names, values))
+            return out
+        return _maybe_return_record(record, dict(base_zip(names, values)))
+
+    def drop(self, record):
+        """ Returns a record of the same type without the selected keys."""
+        return self.subset(record, keep = False)
+
+    def __reduce__(self):
+        # The cached getters can't be pickled, they are rebuilt on first use
+        return (compile_keys, (self.keys,))
+
+    def __repr__(self):
+        return f"KeySelector({list(self.keys)!r})"
+
+
+def _tuple_getter(names, *, attr = False):
+    """ An item/attribute getter that always returns a tuple."""
+    make = attrgetter if attr else itemgetter
+    if len(names) > 1:
+        return make(*names)
+    elif names:
+        get = make(*names)
+        return lambda obj: (get(obj),)
+    return lambda obj: ()
+
+
+@lru_cache(maxsize = 1024)
+def _cached_selector(keys):
+    return KeySelector(keys)
+
+
+def compile_keys(keys):
+    """ Returns a (cached) `KeySelector` for a sequence of keys.
+
+    The pipeables call this once, when the stage is built (e.g. `records.subset(['a', 'b'])`),
+    so a stream of records shares one selector and repeated key lists share the cached one.
+    """
+    if isinstance(keys, KeySelector):
+        return keys
+    return _cached_selector(tuple(keys))
+
+
+class _key_pipeable(pipeable):
+    """ A pipeable that compiles its `keys` argument when it is partially applied.
+
+    A `str` is passed through unchanged, as the pipeables give it its own meaning.
+    """
+    def bind(self, *args, **kwargs):
+        if args and not self.args:
+            args = (_compile_stage_keys(args[0]),) + args[1:]
+        elif 'keys' in kwargs:
+            kwargs['keys'] = _compile_stage_keys(kwargs['keys'])
+        return super().bind(*args, **kwargs)
+
+
+def _compile_stage_keys(keys):
+    return keys if isinstance(keys, str) else compile_keys(keys)
+
+
+@_key_pipeable
 def get(keys, record):
     """ Extract the values for the corresponding keys from a record.
 
     Args.
-        - keys: Either a single key (string) or a sequence of keys (e.g., list(strings)).
+        - keys: Either a single key (string), a sequence of keys (e.g., list(strings))
+                or a `KeySelector`.
         - record: A record (`dict` or `Record`)
 
     Returns.  The value or list of values for the corresponding key or keys.
@@ -145,62 +685,121 @@ def get(keys, record):
     if isinstance(keys, str):
         return getattr(record, keys) if isinstance(record, Record) else record[keys]
     else:
-        return [val for k, val in record.items() if k in keys]
+        return compile_keys(keys).values(record)
 
-@pipeable
+@_key_pipeable
 def subset(keys, record):
     """ Create a new record for a subset of the existing keys.
 
     Args.
-        - keys: A sequence of keys (e.g., list(strings)).
+        - keys: A sequence of keys (e.g., list(strings)) or a `KeySelector`.
         - record: A record (`dict` or `Record`)
 
     Returns.  Creates a record (`Record` or `dict`) consisting of the
               key/value pairs for the provided `keys`
     """
-    out = {k:v for k, v in record.items() if k in keys}
-    return _maybe_return_record(record, out)
+    if isinstance(keys, str):
+        # A string is tested with `in`, i.e. its substrings are the keys
+        return _maybe_return_record(record, {k: v for k, v in record.items() if k in keys})
+    return compile_keys(keys).subset(record)
 
-@pipeable
+@_key_pipeable
 def drop(keys, record):
     """ Create a new record by dropping a subset of the existing keys.
 
     Args.
-        - keys: A sequence of keys to be dropped (e.g., list(strings)).
+        - keys: A sequence of keys to be dropped (e.g., list(strings)) or a `KeySelector`.
         - record: A record (`dict` or `Record`)
 
     Returns.  Creates a record (`Record` or `dict`) consisting of the
               key/value pairs for the provided `keys`
     """
-    out = {k:v for k, v in record.items() if k not in keys}
-    return _maybe_return_record(record, out)
+    if isinstance(keys, str):
+        return _maybe_return_record(record, {k: v for k, v in record.items() if k not in keys})
+    return compile_keys(keys).drop(record)
+
+def _as_dict(record):
+    """ A `dict` view of a record, without copying for `dict` and `Record` inputs."""
+    if isinstance(record, dict):
+        return record
+    if isinstance(record, Record):
+        return record.__dict__
+    if isinstance(record, SchemaRecord):
+        return dict(base_zip(record._fields, record._get_values(record)))
+    return dict(record.items())
+
+
+def _transpose_union(record_seq, default):
+    """ Transpose records into columns in one pass, backfilling `default` for new
+    keys and padding keys missing from a record.
+    """
+    columns = {}
+    for i, rec in enumerate(record_seq):
+        rec = _as_dict(rec)
+        for k, val in rec.items():
+            col = columns.get(k)
+            if col is None:
+                col = columns[k] = [default] * i
+            col.append(val)
+        # Every key of rec now has a column, so only pad when some column was skipped
+        if len(rec) < len(columns):
+            n = i + 1
+            for col in columns.values():
+                if len(col) < n:
+                    col.append(default)
+    return columns
+
+
+def _transpose_intersection(record_seq):
+    """ Transpose records into columns in one pass, keeping only the keys common to
+    all records.  Columns are discarded as soon as a record lacks their key.
+    """
+    it = iter(record_seq)
+    try:
+        first = _as_dict(next(it))
+    except StopIteration:
+        return {}
+    columns = {k: [val] for k, val in first.items()}
+    for rec in it:
+        rec = _as_dict(rec)
+        for k in [k for k in columns if k not in rec]:
+            del columns[k]
+        for k, col in columns.items():
+            col.append(rec[k])
+    return columns
+
+
+def _transpose_keys(keys, record_seq, default):
+    """ Transpose the values of a fixed list of keys into columns in one pass."""
+    columns = {k: [] for k in keys}
+    pairs = tuple(columns.items())
+    for rec in record_seq:
+        rec = _as_dict(rec)
+        for k, col in pairs:
+            col.append(rec.get(k, default))
+    return columns
+
 
 @pipeable
 def zip(record_seq, *, keys = "union", default = None):
     """ Converts a list of records to a record of list containing the original values.
 
     Args.
-        - record_seq: A ordered sequence of records.
+        - record_seq: A ordered sequence of records.  Any iterable, including
+                      single-pass generators, is traversed exactly once.
         - keys: How to combine the keys, either 
             - `"union"` [default] which uses all keys across all records,
             - `"intersection"` which only uses the keys common to all records, or
-            - a list of keys.  Note: The first two options require two passes through the record_seq,
-              use the option with record_seq is a single-pass generator/iterator.
+            - a list of keys.
         - default: The default value used as a value for any missing key. [default = `None`]
 
-    Returns: A single record of lists.
+    Returns: A single record of lists, with the keys in order of first appearance.
     """
-    if keys == "union":
-        init = set([])
-        update = lambda acc, r: acc.union(r.keys())
-        keys = base_reduce(update, record_seq, init)
-    elif keys == "intersection":
-        update = lambda acc, r: acc.intersection(r.keys())
-        keys = base_reduce(update, record_seq)
-    return {k:[toolz_get(k, rec, default = default)
-               for rec in record_seq]
-            for k in keys
-           }
+    if isinstance(keys, str) and keys == "union":
+        return _transpose_union(record_seq, default)
+    elif isinstance(keys, str) and keys == "intersection":
+        return _transpose_intersection(record_seq)
+    return _transpose_keys(keys, record_seq, default)
 
 @pipeable
 def zip_at(keys, record_seq, *, default = None):
@@ -208,14 +807,12 @@ def zip_at(keys, record_seq, *, default = None):
 
     Args.
         - keys: A list of keys to be zipped.
-        - record_seq: A list/tuple of records.
+        - record_seq: Any iterable of records, traversed exactly once.
         - default: Value used for any record with a missing key [Default: None]
 
     Returns. A single dict of key/lists pairs, with the lists containing the original record values.
     """
-    return { key: [toolz_get(key, rec, default) for rec in record_seq]
-             for key in keys
-           }
+    return _transpose_keys(keys, record_seq, default)
 
 @pipeable
 def heads(n, record):
@@ -238,6 +835,8 @@ def heads(n, record):
                  - Any list/tuple value replaced with the head.
                  - All other value left unchanged.
     """
+    if isinstance(record, Table):
+        return record.take(range(min(n, len(record))))
     out = {k: (val[:n]  if isinstance(val, list) or isinstance(val, tuple) else val)
             for k, val in record.items()}
     return _maybe_return_record(record, out)
@@ -251,16 +850,159 @@ def group_by(group_by, recs, *, default = None):
 
     Args.
         - group_by: A single key or a list of keys.
-        - recs: A list of records.
+        - recs: An iterable of records.
         - default: Key to use for any missing groups [default: None]
 
     Returns: A `dict` of records, with the keys being the unique groups (sting or tuples).
     """
-    @pipeable
-    def update(group, acc, rec):
-        out = acc | {(lbl := toolz_get(group, rec, default)): toolz_get(lbl, acc) + [rec] if lbl in acc else [rec]}
-        return out
-    return base_reduce(update(group_by), recs, {})
+    if isinstance(recs, Table):
+        return _group_table(group_by, recs, default)
+    out = {}
+    for rec in recs:
+        lbl = toolz_get(group_by, rec, default)
+        group = out.get(lbl)
+        if group is None:
+            out[lbl] = [rec]
+        else:
+            group.append(rec)
+    return out
+
+
+def _group_table(group_by, table, default):
+    """ Group the rows of a table by label, returning a sub-table per group."""
+    label_columns = lambda keys: [_to_list(table[k]) if k in table else [default] * len(table)
+                                  for k in keys]
+    if isinstance(group_by, list):
+        labels = base_zip(*label_columns(group_by))
+    else:
+        labels = label_columns([group_by])[0]
+    indices = {}
+    for i, lbl in enumerate(labels):
+        group = indices.get(lbl)
+        if group is None:
+            indices[lbl] = [i]
+        else:
+            group.append(i)
+    return {lbl: table.take(idx) for lbl, idx in indices.items()}
+
+
+class Aggregation(object):
+    """ A single-pass aggregation used by `group_agg`.
+
+    Args.
+        - init: A zero-argument function returning the initial state of a group.
+        - update: An arity 2 function taking (state, record) and returning the new state.
+        - finish: A function converting the final state into the reported value.
+    """
+    __slots__ = ('init', 'update', 'finish')
+
+    def __init__(self, init, update, finish = None):
+        self.init = init
+        self.update = update
+        self.finish = finish if finish is not None else (lambda state: state)
+
+
+def _value_getter(key):
+    return key if callable(key) else (lambda rec: rec[key])
+
+
+def agg_count():
+    """ Aggregation counting the records in each group."""
+    return Aggregation(lambda: 0, lambda n, rec: n + 1)
+
+
+def agg_sum(key):
+    """ Aggregation summing the value of `key` (a field name or function of the record)."""
+    value = _value_getter(key)
+    return Aggregation(lambda: 0, lambda total, rec: total + value(rec))
+
+
+def _mean_update(value):
+    def update(state, rec):
+        state[0] += value(rec)
+        state[1] += 1
+        return state
+    return update
+
+
+def agg_mean(key):
+    """ Aggregation computing the mean value of `key` (a field name or function of the record)."""
+    return Aggregation(lambda: [0, 0],
+                       _mean_update(_value_getter(key)),
+                       lambda state: state[0] / state[1])
+
+
+def agg_min(key):
+    """ Aggregation computing the minimum value of `key` (a field name or function of the record)."""
+    value = _value_getter(key)
+    def update(state, rec):
+        val = value(rec)
+        return val if state is None or val < state else state
+    return Aggregation(lambda: None, update)
+
+
+def agg_max(key):
+    """ Aggregation computing the maximum value of `key` (a field name or function of the record)."""
+    value = _value_getter(key)
+    def update(state, rec):
+        val = value(rec)
+        return val if state is None or val > state else state
+    return Aggregation(lambda: None, update)
+
+
+def agg_fold(update, init, key = None):
+    """ Aggregation folding each group with a custom update function.
+
+    Args.
+        - update: An arity 2 function taking (accumulator, value).
+        - init: The initial accumulator of every group (should be immutable).
+        - key: Optional field name or function used to extract the value
+               passed to `update`, by default `update` receives the whole record.
+    """
+    if key is None:
+        return Aggregation(lambda: init, update)
+    value = _value_getter(key)
+    return Aggregation(lambda: init, lambda acc, rec: update(acc, value(rec)))
+
+
+@pipeable
+def group_agg(group_by, recs, *, default = None, use_record_class = True, **aggs):
+    """ Groups records by one or more keys and aggregates each group in a single pass.
+
+    Unlike `group_by`, the records of a group are never collected, so memory use is
+    proportional to the number of groups rather than the number of records.
+
+    Args.
+        - group_by: A single key or a list of keys.
+        - recs: An iterable of records (`dict` or `Record`).
+        - default: Key to use for any missing groups [default: None]
+        - use_record_class: Whether each group's output should use the `Record` class
+                            [default = True]
+        - aggs: One or more `Aggregation`s assigned using keywords, e.g.
+                `agg_count()`, `agg_sum(key)`, `agg_mean(key)`, `agg_min(key)`,
+                `agg_max(key)` or `agg_fold(update, init, key)`.
+
+    Returns: A `dict` with the unique groups as keys and a record of the 
+             aggregated values for each group.
+
+    Example.
+        > recs >> group_agg('species', n = agg_count(), avg_len = agg_mean('length'))
+    """
+    names = tuple(aggs)
+    aggregations = tuple(aggs.values())
+    updates = tuple(enumerate(a.update for a in aggregations))
+    states = {}
+    for rec in recs:
+        lbl = toolz_get(group_by, rec, default)
+        state = states.get(lbl)
+        if state is None:
+            state = states[lbl] = [a.init() for a in aggregations]
+        for i, update in updates:
+            state[i] = update(state[i], rec)
+    out_type = Record if use_record_class else dict
+    return {lbl: out_type(**{name: a.finish(val) 
+                             for name, a, val in base_zip(names, aggregations, state)})
+            for lbl, state in states.items()}
 
 @pipeable
 def readable_output(record, *, num_keys = 3, max_len_seq = 3):
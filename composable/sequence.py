@@ -1,5 +1,7 @@
 from composable.pipeable import pipeable
-from itertools import islice
+from ._numpy import is_array
+from collections import deque
+from itertools import chain, islice
 from functools import reduce as _original_reduce
 
 @pipeable
@@ -134,4 +136,106 @@ def reduce(func, seq, init = None):
     if init is None:
         return _original_reduce(func, seq) # Uses first value as init
     else:
-        return _original_reduce(func, seq, init)
\ No newline at end of file
+        return _original_reduce(func, seq, init)
+
+
+def _check_positive(name, n):
+    if not isinstance(n, int) or n < 1:
+        raise ValueError(f"{name} must be a positive integer, got {n!r}")
+
+
+def _batched(n, seq):
+    if is_array(seq):
+        for start in range(0, len(seq), n):
+            yield seq[start:start + n]
+        return
+    it = iter(seq)
+    while batch := tuple(islice(it, n)):
+        yield batch
+
+
+@pipeable
+def batched(n, seq):
+    ''' Lazily groups seq into tuples of n items, the last batch may be shorter.
+
+    Use it to turn per-item work into bulk calls, e.g.
+    `records >> batched(10_000) >> strict.map(bulk_insert)`.
+    Only one batch is held in memory at a time.
+
+    Args:
+        n: the batch size, a positive integer
+        seq: any iterable, including single-pass iterators
+
+    Returns:
+        An iterator of tuples of (up to) n items, in order.
+        NumPy arrays are split into array slices (views) instead.
+
+    >>> from composable.sequence import batched, to_list
+    >>> range(7) >> batched(3) >> to_list
+    [(0, 1, 2), (3, 4, 5), (6,)]
+    '''
+    _check_positive('n', n)
+    return _batched(n, seq)
+
+
+def _windowed(n, step, seq):
+    it = iter(seq)
+    window = deque(islice(it, n), maxlen = n)
+    if len(window) < n:
+        return
+    yield tuple(window)
+    while True:
+        if step > n:
+            # Skip the items that fall between windows
+            if len(tuple(islice(it, step - n))) < step - n:
+                return
+            new = tuple(islice(it, n))
+        else:
+            new = tuple(islice(it, step))
+        if len(new) < min(step, n):
+            return
+        window.extend(new)
+        yield tuple(window)
+
+
+@pipeable
+def windowed(n, seq, *, step = 1):
+    ''' Lazily yields sliding windows of n consecutive items of seq, starting every step items.
+
+    Only the current window is kept (in a bounded deque), so this works on long streams.
+    Items left over after the last full window are not returned.
+
+    Args:
+        n: the window size, a positive integer
+        seq: any iterable, including single-pass iterators
+        step: the number of items between the starts of consecutive windows [default = 1]
+
+    Returns:
+        An iterator of tuples of n items.
+
+    >>> from composable.sequence import windowed, to_list
+    >>> range(5) >> windowed(3) >> to_list
+    [(0, 1, 2), (1, 2, 3), (2, 3, 4)]
+    >>> range(7) >> windowed(3, step = 2) >> to_list
+    [(0, 1, 2), (2, 3, 4), (4, 5, 6)]
+    '''
+    _check_positive('n', n)
+    _check_positive('step', step)
+    return _windowed(n, step, seq)
+
+
+@pipeable
+def unbatch(seq):
+    ''' Lazily flattens a sequence of batches back into a sequence of items, the inverse of batched.
+
+    Args:
+        seq: an iterable of iterables, e.g. the output of batched or of a bulk stage
+
+    Returns:
+        An iterator of the items of each batch, in order.
+
+    >>> from composable.sequence import batched, unbatch, to_list
+    >>> range(5) >> batched(2) >> unbatch >> to_list
+    [0, 1, 2, 3, 4]
+    '''
+    return chain.from_iterable(seq)
@@ -1,10 +1,16 @@
-from .pipeable import pipeable
-from typing import Callable, Optional, TypeVar
+from __future__ import annotations
+from .pipeable import fast_pipeable
+from ._numpy import is_array, is_vectorized, vectorized
+from .object import as_function
+from ._typing import TYPE_CHECKING
 
-A = TypeVar('A')
-B = TypeVar('B')
+if TYPE_CHECKING:
+    from typing import Callable, Optional, TypeVar
 
-@pipeable
+    A = TypeVar('A')
+    B = TypeVar('B')
+
+@fast_pipeable
 def map(f, L):
     ''' applies f to all elements of L, immediately returning a list of the resulting values.
 
@@ -17,16 +23,24 @@ def map(f, L):
         A list of the results of f applied to each element of L.
         Note that this is a strict version of the built-in map (which returns a generator).
 
+    Notes:
+        When L is a NumPy array and f is a ufunc (e.g. np.sqrt) or marked with
+        `composable.strict.vectorized`, f is called once on the whole array and
+        the resulting array is returned.
+
     >>> from composable.strict import map
     >>> range(3) >> map(lambda x: x + 5)
     [5, 6, 7]
     '''
+    if is_array(L) and is_vectorized(f):
+        return f(L)
+    f = as_function(f)
     return [f(x) for x in L]
 
 __builtin_sorted = sorted
 
 
-@pipeable
+@fast_pipeable
 def sorted(iterable, /, *, key=None, reverse=False):
     '''Return a new list containing all items from the iterable in ascending order.
 
@@ -48,7 +62,7 @@ def sorted(iterable, /, *, key=None, reverse=False):
     return __builtin_sorted(iterable, key=key, reverse=reverse) 
 
 
-@pipeable
+@fast_pipeable
 def star_map(f, L):
     ''' applies f after unpacking the elements of L as positional arguments, immediately returning a list of the resulting values.
 
@@ -72,7 +86,7 @@ def star_map(f, L):
     return [f(*args) for args in L]
 
 
-@pipeable
+@fast_pipeable
 def filter(p, L):
     ''' Filters the elements of L, returning a list of all elements that pass the predicate p.
 
@@ -83,11 +97,21 @@ def filter(p, L):
     Returns:
         A list of the elements of L that satisfy p.
         Note that this is a strict version of the built-in filter (which returns a generator).
+
+    Notes:
+        When L is a NumPy array and p is a ufunc or vectorized predicate (e.g.
+        composable.operator.is_gt(0)), the array is filtered with a single boolean
+        mask and an array is returned.
     '''
+    if is_array(L) and is_vectorized(p):
+        mask = p(L)
+        if is_array(mask) and mask.dtype == bool and mask.shape == L.shape:
+            return L[mask]
+    p = as_function(p)
     return [x for x in L if p(x)]
 
 
-@pipeable
+@fast_pipeable
 def zipWith(iter2, iter1):
     ''' zips the elements of iter1 and iter2 into a list of tuples of the form (i1, i2)
 
@@ -105,7 +129,7 @@ def zipWith(iter2, iter1):
     return [ (i1, i2) for i2, i1 in zip(iter2, iter1)]
 
 
-@pipeable
+@fast_pipeable
 def zipOnto(iter1, iter2):
     ''' zips the elements of iter1 and iter2 into a list of tuples of the form (i2, i1)
 
@@ -124,7 +148,7 @@ def zipOnto(iter1, iter2):
 
 enum = enumerate
 
-@pipeable
+@fast_pipeable
 def enumerate(iter):
     ''' generates a list of tuples, pairing each value with its index, (index, value)
 
@@ -139,7 +163,7 @@ def enumerate(iter):
     return list(enum(iter))
 
 
-@pipeable
+@fast_pipeable
 def split_by(funcs: list[Callable[[A], B]], obj:A) -> list[B]:
     '''Apply each of a list of functions to an object, returning the list of results.
     
@@ -1,6 +1,41 @@
 from .pipeable import pipeable
+from functools import lru_cache
 import re
 
+REGEX_CACHE_SIZE = 512
+
+# A bounded LRU cache of compiled patterns shared by all of the *_re functions
+_compile = lru_cache(maxsize = REGEX_CACHE_SIZE)(re.compile)
+
+
+def compile_re(pat, flags = 0):
+    ''' Returns the compiled regular expression for pat, using the shared LRU cache.
+
+    args:
+        pat: a regular expression pattern (str or bytes) or a compiled pattern.
+        flags: flags from the re module, e.g. re.IGNORECASE
+
+    return:
+        a compiled re.Pattern
+    '''
+    if isinstance(pat, re.Pattern):
+        return pat
+    return _compile(pat, flags)
+
+
+def regex_cache_info():
+    ''' Returns the hit/miss statistics of the compiled-pattern cache.
+
+    return:
+        a dict with the keys hits, misses, maxsize and currsize
+    '''
+    return _compile.cache_info()._asdict()
+
+
+def clear_regex_cache():
+    ''' Empties the compiled-pattern cache and resets its statistics.'''
+    _compile.cache_clear()
+
 
 @pipeable
 def split(sep, s):
@@ -37,7 +72,7 @@ def split_re(pat):
             Is curried and can be combined with curried functions (i.e. map)
             Example: list_of_str >> composable.strict.map(split_re("(,|\t)"))
     '''
-    r = re.compile(pat)
+    r = compile_re(pat)
     return pipeable(lambda s: r.split(s))
 
 @pipeable
@@ -97,3 +132,163 @@ def join(sep, seq):
     'ab.pq.rs'
     '''
     return sep.join(seq)
+
+
+@pipeable
+def sub_re(pat, repl, s, count = 0, *, flags = 0):
+    ''' Return a copy of s with the matches of the regular expression pat replaced by repl.
+    
+    args:
+        pat: a regular expression pattern
+        repl: a replacement string (may contain back references) or a function
+              taking a match object and returning the replacement string
+        s: the string being searched
+        count: Maximum number of replacements, 0 (the default) replaces all matches.
+        flags: flags from the re module, e.g. re.IGNORECASE
+
+    returns: a string
+
+    notes: 
+        pat is compiled once and kept in a shared cache, see regex_cache_info.
+
+    >>> from composable.string import sub_re
+    >>> 'a1b22c' >> sub_re('[0-9]+', '#')
+    'a#b#c'
+    '''
+    return compile_re(pat, flags).sub(repl, s, count)
+
+
+@pipeable
+def findall_re(pat, s, *, flags = 0):
+    ''' Return a list of all non-overlapping matches of the regular expression pat in s.
+    
+    args:
+        pat: a regular expression pattern
+        s: the string being searched
+        flags: flags from the re module, e.g. re.IGNORECASE
+
+    returns: a list of strings (or of tuples when pat has more than one group)
+
+    >>> from composable.string import findall_re
+    >>> 'a1b22c' >> findall_re('[0-9]+')
+    ['1', '22']
+    '''
+    return compile_re(pat, flags).findall(s)
+
+
+@pipeable
+def search_re(pat, s, *, flags = 0):
+    ''' Scan s for the first location matching the regular expression pat.
+    
+    args:
+        pat: a regular expression pattern
+        s: the string being searched
+        flags: flags from the re module, e.g. re.IGNORECASE
+
+    returns: a re.Match object, or None if no position in s matches
+    '''
+    return compile_re(pat, flags).search(s)
+
+
+@pipeable
+def match_re(pat, s, *, flags = 0):
+    ''' Try to match the regular expression pat at the start of s.
+    
+    args:
+        pat: a regular expression pattern
+        s: the string being matched
+        flags: flags from the re module, e.g. re.IGNORECASE
+
+    returns: a re.Match object, or None if the start of s doesn't match
+    '''
+    return compile_re(pat, flags).match(s)
+
+
+@pipeable
+def fullmatch_re(pat, s, *, flags = 0):
+    ''' Try to match the regular expression pat against all of s.
+    
+    args:
+        pat: a regular expression pattern
+        s: the string being matched
+        flags: flags from the re module, e.g. re.IGNORECASE
+
+    returns: a re.Match object, or None if s doesn't match as a whole
+    '''
+    return compile_re(pat, flags).fullmatch(s)
+
+
+@pipeable
+def split_re_many(pat, strings, *, flags = 0):
+    ''' Split every string in strings using the regular expression pat.
+
+    A batch version of split_re that compiles pat once and applies it in a single loop.
+
+    returns: a list with the list of substrings for each string
+    '''
+    split = compile_re(pat, flags).split
+    return [split(s) for s in strings]
+
+
+@pipeable
+def sub_re_many(pat, repl, strings, count = 0, *, flags = 0):
+    ''' Apply sub_re(pat, repl) to every string in strings.
+
+    A batch version of sub_re that compiles pat once and applies it in a single loop.
+
+    returns: a list of strings
+
+    >>> from composable.string import sub_re_many
+    >>> ['a1', 'b22'] >> sub_re_many('[0-9]', '#')
+    ['a#', 'b##']
+    '''
+    sub = compile_re(pat, flags).sub
+    return [sub(repl, s, count) for s in strings]
+
+
+@pipeable
+def findall_re_many(pat, strings, *, flags = 0):
+    ''' Apply findall_re(pat) to every string in strings.
+
+    A batch version of findall_re that compiles pat once and applies it in a single loop.
+
+    returns: a list with the list of matches for each string
+    '''
+    findall = compile_re(pat, flags).findall
+    return [findall(s) for s in strings]
+
+
+@pipeable
+def search_re_many(pat, strings, *, flags = 0):
+    ''' Apply search_re(pat) to every string in strings.
+
+    A batch version of search_re that compiles pat once and applies it in a single loop.
+
+    returns: a list of re.Match objects or None
+    '''
+    search = compile_re(pat, flags).search
+    return [search(s) for s in strings]
+
+
+@pipeable
+def match_re_many(pat, strings, *, flags = 0):
+    ''' Apply match_re(pat) to every string in strings.
+
+    A batch version of match_re that compiles pat once and applies it in a single loop.
+
+    returns: a list of re.Match objects or None
+    '''
+    match = compile_re(pat, flags).match
+    return [match(s) for s in strings]
+
+
+@pipeable
+def fullmatch_re_many(pat, strings, *, flags = 0):
+    ''' Apply fullmatch_re(pat) to every string in strings.
+
+    A batch version of fullmatch_re that compiles pat once and applies it in a single loop.
+
+    returns: a list of re.Match objects or None
+    '''
+    fullmatch = compile_re(pat, flags).fullmatch
+    return [fullmatch(s) for s in strings]
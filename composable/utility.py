@@ -1,6 +1,9 @@
 from composable import pipeable
 from toolz import get as toolz_get
 from inspect import getdoc
+import mmap
+
+DEFAULT_CHUNK_SIZE = 1 << 20
 
 base_dir = dir
 base_help = help
@@ -112,6 +115,127 @@ def with_open(body_func,
         return body_func(f)
     
 
+@pipeable
+def read_lines(file, *, mode='r', keepends=False, buffering=DEFAULT_CHUNK_SIZE, encoding=None, errors=None, newline=None):
+    """ Lazily read a file line by line through a large buffer.
+
+    Args.
+        - file: file path passed to `open`
+        - mode: 'r' [default] for str lines or 'rb' for bytes lines
+        - keepends: Whether to keep the trailing newline of each line [default = False]
+        - buffering: Size of the read buffer in bytes [default = 1MB]
+        - ... Additional arguments passed to open, see `help(open)` for more info.
+
+    Note.  This replaces `path >> with_open(lambda f: f.read()) >> string.split('\\n')`
+           without ever holding the whole file in memory.  The file is closed when the
+           iterator is exhausted or closed.
+
+    Returns. An iterator over the lines of the file.
+    """
+    with open(file, mode, buffering, encoding, errors, newline) as f:
+        if keepends:
+            yield from f
+        else:
+            nl = b'\n' if 'b' in mode else '\n'
+            for line in f:
+                yield line[:-1] if line.endswith(nl) else line
+
+
+@pipeable
+def read_records(sep, file, *, mode='r', chunk_size=DEFAULT_CHUNK_SIZE, encoding=None, errors=None, newline=None):
+    """ Lazily read the `sep`-separated records of a file in large chunks.
+
+    Args.
+        - sep: The record separator (`str` for mode 'r', `bytes` for mode 'rb')
+        - file: file path passed to `open`
+        - mode: 'r' [default] or 'rb'
+        - chunk_size: Number of characters/bytes read at a time [default = 1M]
+        - ... Additional arguments passed to open, see `help(open)` for more info.
+
+    Note.  Memory use is bounded by the chunk size plus the longest record.  A 
+           trailing separator does not produce a final empty record.
+
+    Returns. An iterator over the records (without the separators).
+    """
+    if not sep:
+        raise ValueError("read_records needs a non-empty separator")
+    empty = sep[:0]
+    k = len(sep) - 1
+    with open(file, mode, encoding=encoding, errors=errors, newline=newline) as f:
+        # tail holds the last len(sep) - 1 items of the pending chunks
+        pending, tail = [], empty
+        for chunk in iter(lambda: f.read(chunk_size), empty):
+            # The separator can also straddle the end of the pending chunks
+            if sep in chunk or (k and sep in tail + chunk[:k]):
+                pending.append(chunk)
+                parts = empty.join(pending).split(sep)
+                pending = [parts.pop()]
+                tail = pending[0][-k:] if k else empty
+                yield from parts
+            else:
+                pending.append(chunk)
+                tail = (tail + chunk)[-k:] if k else empty
+        rest = empty.join(pending)
+        if rest:
+            yield rest
+
+
+@pipeable
+def mmap_records(sep, file):
+    """ Lazily split a memory-mapped file into zero-copy `memoryview` records.
+
+    Args.
+        - sep: The record separator as `bytes`, e.g. `b'\\n'`
+        - file: file path of the file to map (read-only)
+
+    Note.  Each record is a `memoryview` slice of the mapped file, so nothing is
+           copied until it is converted (e.g., with `bytes` or `.tobytes()`).
+           The mapping stays open while any slice is referenced.
+
+    Returns. An iterator over `memoryview` records (without the separators).
+    """
+    if not sep:
+        raise ValueError("mmap_records needs a non-empty separator")
+    with open(file, 'rb') as f:
+        if not f.seek(0, 2):
+            return
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mm)
+    try:
+        start, n, step = 0, len(mm), len(sep)
+        while start < n:
+            end = mm.find(sep, start)
+            if end == -1:
+                yield view[start:]
+                break
+            yield view[start:end]
+            start = end + step
+    finally:
+        view.release()
+        try:
+            mm.close()
+        except BufferError:
+            pass  # Records are still referenced, the mapping is closed when they are freed
+
+
+@pipeable
+def with_mmap(body_func, file, *, access=mmap.ACCESS_READ):
+    """ Functional replacement for a with statement around a memory-mapped file.
+
+    Args.
+        - body_func: The single argument function executed in the body of the with block.
+                     Receives the `mmap` object, which supports random access
+                     (slicing, `find`, `memoryview(m)`) without reading the whole file.
+        - file: file path of the file to map
+        - access: mmap.ACCESS_READ [default], ACCESS_WRITE or ACCESS_COPY
+
+    Returns. The output of `body_func` executed on the mapped file.
+    """
+    mode = 'rb' if access == mmap.ACCESS_READ else 'r+b'
+    with open(file, mode) as f:
+        with mmap.mmap(f.fileno(), 0, access=access) as m:
+            return body_func(m)
+
 @pipeable
 def apply(func, value):
     """ Apply a function to a value, possibly by piping with `>>`
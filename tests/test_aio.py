@@ -0,0 +1,61 @@
+import asyncio
+import composable.aio as aio
+from composable.aio import apipeable
+from composable.strict import map as strict_map
+
+
+@apipeable
+async def add(x, y):
+    await asyncio.sleep(0)
+    return x + y
+
+
+async def double(x):
+    await asyncio.sleep(0)
+    return 2 * x
+
+
+def test_apipeable_chain():
+    async def main():
+        return await (1 >> add(2) >> double >> str)
+    assert asyncio.run(main()) == '6'
+
+
+def test_apipeable_call():
+    assert asyncio.run(add(1, 2)) == 3
+    assert asyncio.run(add(1)(2)) == 3
+
+
+def test_sync_prefix_then_async():
+    async def main():
+        return await ([1, 2] >> strict_map(lambda x: x + 1) >> aio.map(double))
+    assert asyncio.run(main()) == [4, 6]
+
+
+def test_map_limit():
+    running = 0
+    peak = 0
+
+    async def track(x):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+        return x
+
+    async def main():
+        return await (range(20) >> aio.map(track, limit=5))
+    assert asyncio.run(main()) == list(range(20))
+    assert peak == 5
+
+
+def test_filter_and_star_map():
+    async def is_odd(x):
+        return x % 2 == 1
+
+    async def main():
+        odd = await (range(6) >> aio.filter(is_odd, limit=2))
+        sums = await (zip(odd, odd) >> aio.star_map(add))
+        return odd, sums
+    assert asyncio.run(main()) == ([1, 3, 5], [2, 6, 10])
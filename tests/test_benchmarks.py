@@ -0,0 +1,40 @@
+import json
+from benchmarks import import_time, load_all
+from benchmarks.harness import BENCHMARKS, run, to_json, compare
+from benchmarks.__main__ import main
+from benchmarks.import_time import loaded_modules
+
+
+def test_every_benchmark_runs():
+    load_all()
+    results = run([10], repeat = 1)
+    assert {r.name for r in results} == set(BENCHMARKS)
+    assert json.loads(json.dumps(to_json(results)))['results']
+
+
+def test_compare_flags_regressions(tmp_path):
+    out = tmp_path / 'results.json'
+    assert main(['--sizes', '10', '--repeat', '1', '--filter', 'strict.map', '--quiet', '--output', str(out)]) == 0
+    baseline = json.loads(out.read_text())
+    for r in baseline['results']:
+        r['best'] = r['best'] / 1000
+    load_all()
+    results = run([10], pattern = 'strict.map', repeat = 1)
+    assert [name for name, _, _ in compare(results, baseline)] == ['strict.map']
+
+
+def test_import_time_budget(tmp_path):
+    out = tmp_path / 'imports.json'
+    assert import_time.main(['composable', '--repeat', '1', '--quiet', '--output', str(out),
+                             '--budget', 'composable=1000']) == 0
+    baseline = json.loads(out.read_text())
+    baseline['results']['composable'] /= 1000
+    out.write_text(json.dumps(baseline))
+    assert import_time.main(['composable', '--repeat', '1', '--quiet', '--compare', str(out),
+                             '--budget', 'composable=1000']) == 1
+
+
+def test_import_is_lazy():
+    loaded = loaded_modules('composable')
+    assert not {'toolz', 'numpy', 'inspect', 'typing', 'composable.strict'} & loaded
+    assert not {'toolz', 'numpy'} & loaded_modules('composable.strict')
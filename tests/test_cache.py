@@ -0,0 +1,78 @@
+from composable import pipeable, fast_pipeable, strict
+from composable.cache import Cache, memoize, cached, cache_info, cache_clear
+from functools import wraps
+import pytest
+import time
+
+
+def counting(func):
+    calls = []
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        calls.append(args)
+        return func(*args, **kwargs)
+    return wrapper, calls
+
+
+def test_memoize_pipeable():
+    inner, calls = counting(lambda factor, x: factor * x)
+    scale = memoize(pipeable(inner))
+    assert [1, 2, 1, 2, 1] >> strict.map(scale(10)) == [10, 20, 10, 20, 10]
+    assert calls == [(10, 1), (10, 2)]
+    assert 3 >> scale(2) == 6
+    stats = cache_info(scale)
+    assert (stats['hits'], stats['misses'], stats['currsize']) == (3, 3, 3)
+    cache_clear(scale)
+    assert cache_info(scale)['currsize'] == 0
+
+
+def test_memoize_fast_pipeable_and_decorator():
+    @memoize(maxsize = 2)
+    @fast_pipeable
+    def add(x, y):
+        return x + y
+    assert isinstance(add, fast_pipeable)
+    assert [1, 2, 3, 1] >> strict.map(add(1)) == [2, 3, 4, 2]
+    assert cache_info(add)['evictions'] == 2
+    assert cache_info(add)['hits'] == 0
+
+
+def test_ttl_and_key():
+    inner, calls = counting(lambda d: sorted(d))
+    f = memoize(inner, ttl = 0.05, key = lambda d: tuple(sorted(d.items())))
+    assert {'b': 1, 'a': 2} >> f == ['a', 'b']
+    assert {'a': 2, 'b': 1} >> f == ['a', 'b']
+    assert len(calls) == 1
+    time.sleep(0.06)
+    assert {'a': 2, 'b': 1} >> f == ['a', 'b']
+    assert len(calls) == 2 and cache_info(f)['expirations'] == 1
+    # Unhashable arguments without a key function are computed every time
+    g = memoize(len)
+    assert [[1], [1]] >> strict.map(g) == [1, 1]
+    assert cache_info(g)['currsize'] == 0
+
+
+def test_key_errors_propagate():
+    f = memoize(len, key = lambda d: d.missing_attribute + 1)
+    with pytest.raises(AttributeError):
+        [1] >> f
+    f = memoize(len, key = lambda d: d + 1)
+    with pytest.raises(TypeError):
+        [1] >> f
+
+
+def test_cached_shares_stages():
+    assert cached(len) is cached(len)
+    assert cached(len) is not cached(len, maxsize = 10)
+    for _ in range(3):
+        ['a', 'bb'] >> strict.map(cached(len, maxsize = 10))
+    assert cache_info(cached(len, maxsize = 10))['hits'] == 4
+
+
+def test_cache_stats():
+    c = Cache(maxsize = 1)
+    c.put('a', 1)
+    assert c.get('a') == 1 and c.get('b') is None
+    c.put('b', 2)
+    assert c.stats() | {'ttl': None} == {'hits': 1, 'misses': 1, 'evictions': 1, 'expirations': 0,
+                                         'hit_rate': 0.5, 'currsize': 1, 'maxsize': 1, 'ttl': None}
@@ -1,5 +1,12 @@
-from composable import __version__
+import composable
+from composable import __version__, pipeable
 
 
 def test_version():
     assert __version__ == '0.1.0'
+
+
+def test_lazy_attributes():
+    assert isinstance(pipeable, type) and callable(pipeable(abs))
+    assert composable.strict.map(abs)([-1]) == [1]
+    assert 'records' in dir(composable)
@@ -0,0 +1,118 @@
+from composable import strict, parallel
+from composable.diskcache import DiskCache, disk_memoize, file_digest, _code_version, EVICT_BATCH
+import pickle
+import pytest
+import subprocess
+import sys
+import threading
+
+
+def slow_square(x):
+    return x * x
+
+
+def test_results_persist(tmp_path):
+    square = disk_memoize(slow_square, tmp_path)
+    assert [1, 2, 1] >> strict.map(square) == [1, 4, 1]
+    assert square.func.cache.stats()['hits'] == 1
+    # A new stage over the same directory (e.g. the next run) reuses the results
+    again = disk_memoize(slow_square, tmp_path)
+    assert [1, 2, 3] >> strict.map(again) == [1, 4, 9]
+    stats = again.func.cache.stats()
+    assert (stats['hits'], stats['misses'], stats['currsize']) == (2, 1, 3)
+
+
+def test_version_and_identity(tmp_path):
+    calls = []
+    def stage(x):
+        calls.append(x)
+        return x
+    assert 1 >> disk_memoize(stage, tmp_path, version = '1') == 1
+    assert 1 >> disk_memoize(stage, tmp_path, version = '1') == 1
+    assert 1 >> disk_memoize(stage, tmp_path, version = '2') == 1
+    assert calls == [1, 1]
+    # Different stages don't share results
+    assert 1 >> disk_memoize(slow_square, tmp_path, version = '1') == 1
+    assert 3 >> disk_memoize(slow_square, tmp_path, version = '1') == 9
+
+
+def test_code_version_is_stable_and_tracks_edits():
+    script = ("from composable.diskcache import _code_version\n"
+              "def f(s): return [int(p) for p in s.split('.')]\n"
+              "print(_code_version(f))")
+    runs = [subprocess.run([sys.executable, '-c', script], capture_output = True, text = True, check = True).stdout
+            for _ in range(2)]
+    assert runs[0] == runs[1] and runs[0].strip()
+    # Calling a different method is a different version
+    assert _code_version(lambda x: x.upper()) != _code_version(lambda x: x.lower())
+
+
+def test_captured_state_is_part_of_the_version(tmp_path):
+    def scaler(k):
+        return disk_memoize(lambda x: x * k, tmp_path)
+    assert 5 >> scaler(2) == 10
+    assert 5 >> scaler(3) == 15
+    def f(x, k = 2):
+        return x * k
+    assert 5 >> disk_memoize(f, tmp_path) == 10
+    f.__defaults__ = (3,)
+    assert 5 >> disk_memoize(f, tmp_path) == 15
+    # Closures that can't be pickled need an explicit version
+    lock = threading.Lock()
+    def locked(x):
+        with lock:
+            return x
+    with pytest.raises(TypeError):
+        disk_memoize(locked, tmp_path)
+    assert 1 >> disk_memoize(locked, tmp_path, version = '1') == 1
+
+
+def test_file_digest_key(tmp_path):
+    path = tmp_path / 'data.txt'
+    path.write_text('abc')
+    read = disk_memoize(lambda p: open(p).read(), tmp_path / 'cache', key = file_digest)
+    assert path >> read == 'abc'
+    path.write_text('abcd')
+    assert path >> read == 'abcd'
+    assert read.func.cache.stats()['misses'] == 2
+
+
+def test_key_errors_propagate(tmp_path):
+    stage = disk_memoize(slow_square, tmp_path, key = lambda x: x.digest())
+    with pytest.raises(AttributeError):
+        3 >> stage
+    # Unpicklable inputs without a key function are computed without the cache
+    size = disk_memoize(len, tmp_path)
+    assert [lambda: 1] >> size == 1 and len(size.func.cache) == 0
+
+
+def test_size_cap_evicts_least_recently_used(tmp_path):
+    cache = DiskCache(tmp_path, max_bytes = 1000)
+    for i in range(10):
+        cache.put(str(i), b'x' * 200)
+    stats = cache.stats()
+    assert stats['bytes'] <= 1000 and stats['evictions'] > 0
+    assert cache.get('9') == b'x' * 200 and cache.get('0') is None
+
+
+def test_eviction_spanning_several_batches(tmp_path):
+    cache = DiskCache(tmp_path, max_bytes = 20000)
+    for i in range(3 * EVICT_BATCH):
+        cache.put(str(i), b'x')
+    cache.put('big', b'x' * 19000)
+    stats = cache.stats()
+    assert stats['bytes'] <= 20000 and stats['evictions'] > EVICT_BATCH
+    assert cache.get('big') is not None and cache.get(str(3 * EVICT_BATCH - 1)) is not None
+
+
+def test_shared_between_processes(tmp_path):
+    square = disk_memoize(slow_square, tmp_path)
+    assert pickle.loads(pickle.dumps(square))(3) == 9
+    # The workers are forked while this process has the database open
+    assert square(4) == 16
+    L = list(range(20))
+    assert L >> parallel.map(square, workers = 2) == L >> strict.map(slow_square)
+    assert L >> parallel.map(square, workers = 2) == L >> strict.map(slow_square)
+    assert len(square.func.cache) == 20
+    assert L >> strict.map(square) == L >> strict.map(slow_square)
+    assert square.func.cache.stats()['hits'] == 20
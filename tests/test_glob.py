@@ -1,5 +1,6 @@
-from composable.glob import glob
+from composable.glob import glob, iglob, iglob_info, FileInfo, cached_glob, GlobCache
 import glob as g
+import os
 
 
 def test_glob():
@@ -11,4 +12,69 @@ def test_glob():
     recursive_test = lambda s: (s >> glob(recursive = True)) == g.glob(s, recursive=True)
     assert recursive_test('./for_glob/*')
     assert recursive_test('./for_glob/a*')
-    assert recursive_test('./for_glob/*_1.py')
\ No newline at end of file
+    assert recursive_test('./for_glob/*_1.py')
+
+
+HERE = os.path.join(os.path.dirname(__file__), 'for_glob')
+PATTERNS = ['*', 'a*', '*_1.py', '*/', '*/*', '**', '**/', '**/a_1.py', 'sub_folder', 'nothing*']
+
+
+def test_iglob():
+    for p in PATTERNS:
+        s = os.path.join(HERE, p)
+        for recursive in (False, True):
+            assert list(s >> iglob(recursive = recursive)) == g.glob(s, recursive = recursive)
+            assert sorted(s >> iglob(recursive = recursive, workers = 4)) == sorted(g.glob(s, recursive = recursive))
+    assert list(os.path.join(HERE, 'missing', '*') >> iglob()) == []
+
+
+def test_iglob_info():
+    s = os.path.join(HERE, '**')
+    infos = list(s >> iglob_info(recursive = True))
+    assert [i.path for i in infos] == g.glob(s, recursive = True)
+    for info in infos:
+        assert isinstance(info, FileInfo)
+        st = os.stat(info.path)
+        assert info.size == st.st_size
+        assert info.mtime == st.st_mtime
+        assert info.is_dir == os.path.isdir(info.path)
+
+
+def test_cached_glob(tmp_path):
+    cache = GlobCache(maxsize = 2)
+    (tmp_path / 'sub').mkdir()
+    (tmp_path / 'a.py').write_text('')
+    (tmp_path / 'sub' / 'b.py').write_text('')
+    pattern = str(tmp_path / '**' / '*.py')
+    expected = g.glob(pattern, recursive = True)
+    assert (pattern >> cached_glob(recursive = True, cache = cache)) == expected
+    assert (pattern >> cached_glob(recursive = True, cache = cache)) == expected
+    assert cache.info()['hits'] == 1 and cache.info()['misses'] == 1
+
+    # A new file in a listed directory changes its mtime and forces a rescan (the
+    # mtime is set explicitly, as filesystems can have a coarse mtime resolution)
+    before = os.stat(tmp_path / 'sub').st_mtime_ns
+    (tmp_path / 'sub' / 'c.py').write_text('')
+    os.utime(tmp_path / 'sub', ns = (before + 10**9, before + 10**9))
+    assert sorted(pattern >> cached_glob(recursive = True, cache = cache)) == sorted(g.glob(pattern, recursive = True))
+    assert cache.info()['misses'] == 2
+
+    # A missing base directory is revalidated too
+    missing = str(tmp_path / 'later' / '*.py')
+    assert (missing >> cached_glob(cache = cache)) == []
+    (tmp_path / 'later').mkdir()
+    (tmp_path / 'later' / 'd.py').write_text('')
+    assert (missing >> cached_glob(cache = cache)) == [str(tmp_path / 'later' / 'd.py')]
+
+    # Bounded size, explicit invalidation
+    assert cache.info()['currsize'] == 2
+    cache.invalidate(missing)
+    assert cache.info()['currsize'] == 1
+    cache.invalidate()
+    assert cache.info()['currsize'] == 0
+
+    # A ttl of zero always rescans
+    cache = GlobCache(ttl = 0)
+    cached_glob(pattern, recursive = True, cache = cache)
+    cached_glob(pattern, recursive = True, cache = cache)
+    assert cache.info()['hits'] == 0
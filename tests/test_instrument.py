@@ -0,0 +1,51 @@
+import asyncio
+import json
+from composable import aio, instrument, strict, sequence
+from composable.aio import apipeable
+from composable.pipeable import pipeable, fast_pipeable
+
+
+def test_disabled_path_is_untouched():
+    before = (pipeable.__rrshift__, fast_pipeable.__rrshift__)
+    with instrument.instrumented():
+        assert fast_pipeable.__rrshift__ is not before[1]
+    assert (pipeable.__rrshift__, fast_pipeable.__rrshift__) == before
+    assert not instrument.is_enabled()
+
+
+def test_records_stages():
+    with instrument.instrumented() as stats:
+        out = range(10) >> strict.map(abs) >> strict.filter(lambda x: x > 4) >> sequence.to_tuple
+        _ = [1, 2] >> strict.map(abs)
+    assert out == (5, 6, 7, 8, 9)
+    report = stats.report()
+    assert report['composable.strict.map']['calls'] == 2
+    assert report['composable.strict.map']['items_in'] == 12
+    assert report['composable.strict.filter']['items_out'] == 5
+    assert report['composable.sequence.to_tuple']['calls'] == 1
+    assert report['composable.strict.map']['max'] <= report['composable.strict.map']['total']
+    assert json.loads(stats.to_json()) == report
+    assert 'composable.strict.filter' in stats.format_report()
+
+
+def test_global_switch():
+    instrument.reset()
+    instrument.enable()
+    try:
+        _ = [1] >> strict.map(abs)
+    finally:
+        instrument.disable()
+    _ = [1] >> strict.map(abs)
+    assert instrument.report()['composable.strict.map']['calls'] == 1
+
+
+def test_records_async_stages():
+    before = apipeable.__rrshift__
+    async def double(x):
+        return 2 * x
+    async def main():
+        return await ([1, 2] >> aio.map(double) >> aio.map(double))
+    with instrument.instrumented() as stats:
+        assert asyncio.run(main()) == [4, 8]
+    assert stats.report()['composable.aio.map']['calls'] == 2
+    assert apipeable.__rrshift__ is before
@@ -0,0 +1,53 @@
+import composable.lazy as lazy
+import composable.strict as strict
+from toolz.curried.operator import add, mul
+
+
+def test_map():
+    f = lambda x: x**2
+    l = [1, 2, 3]
+    assert lazy.map(f, []) >> lazy.to_list == []
+    assert l >> lazy.map(f) >> lazy.to_list == [1, 4, 9]
+    assert (x for x in l) >> lazy.map(f) >> lazy.to_tuple == (1, 4, 9)
+
+
+def test_map_is_lazy():
+    seen = []
+    out = range(3) >> lazy.map(seen.append)
+    assert seen == []
+    next(out)
+    assert seen == [0]
+
+
+def test_filter():
+    p = lambda x: x % 2 == 1
+    assert [1, 2, 3] >> lazy.filter(p) >> lazy.to_list == [1, 3]
+    assert [] >> lazy.filter(p) >> lazy.to_list == []
+
+
+def test_star_map():
+    vals = [(0, 2), (1, 3), (2, 4)]
+    assert vals >> lazy.star_map(add) >> lazy.to_list == vals >> strict.star_map(add)
+
+
+def test_zips_and_enumerate():
+    l = [1, 2, 3, 4]
+    m = [5, 6, 7]
+    assert m >> lazy.zipWith(l) >> lazy.to_list == m >> strict.zipWith(l)
+    assert m >> lazy.zipOnto(l) >> lazy.to_list == m >> strict.zipOnto(l)
+    assert iter(m) >> lazy.enumerate >> lazy.to_list == strict.enumerate(m)
+
+
+def test_split_by():
+    assert 3 >> lazy.split_by([add(1), mul(3)]) >> lazy.to_list == [4, 9]
+
+
+def test_pipeline_on_generator():
+    lines = (str(i) for i in range(10))
+    out = (lines
+           >> lazy.map(int)
+           >> lazy.filter(lambda x: x > 5)
+           >> lazy.enumerate
+           >> lazy.star_map(lambda i, x: i * x)
+           >> lazy.to_list)
+    assert out == [0, 7, 16, 27]
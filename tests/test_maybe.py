@@ -1,6 +1,8 @@
 from composable import maybe
+from composable.maybe import Nothing, Just
 from toolz.curried.operator import add
 from composable.strict import map
+import pickle
 
 
 def test_with_default():
@@ -11,4 +13,21 @@ def test_with_default():
 def test_map():
     assert None >> maybe.map(add(2)) is None
     assert 3 >> maybe.map(add(2)) == 5
-    assert [1,2,None,4] >> map(maybe.map(add(2))) == [3, 4, None, 6]
\ No newline at end of file
+    assert [1,2,None,4] >> map(maybe.map(add(2))) == [3, 4, None, 6]
+
+def test_nothing_is_a_singleton():
+    assert Nothing() is Nothing()
+    assert Nothing().anything(1, 2).more is Nothing()
+    assert None >> maybe.maybe is Nothing()
+    assert pickle.loads(pickle.dumps(Nothing())) is Nothing()
+    assert pickle.loads(pickle.dumps(Just(3))).just == 3
+    assert not hasattr(Just(3), '__dict__')
+    assert Just('a').upper().just == 'A'
+
+
+def test_batch_operations():
+    values = [1, None, 3] >> map(maybe.maybe)
+    assert values >> maybe.map_many(add(2)) >> maybe.unmaybe_many == [3, None, 5]
+    assert values >> maybe.map_many(add(2)) >> maybe.unmaybe_many == values >> map(maybe.map(add(2))) >> map(maybe.unmaybe)
+    assert values >> maybe.filter_just >> maybe.unmaybe_many == [1, 3]
+    assert [Nothing()] >> maybe.unmaybe_many == [None]
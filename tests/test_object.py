@@ -0,0 +1,27 @@
+from composable.object import obj, attr, as_function, compile_chain
+from composable.strict import map, filter
+from composable import lazy
+
+
+def test_obj_method_chains():
+    assert '  A,b ' >> obj.strip().lower().split(',') == ['a', 'b']
+    assert ['  A,b ', 'C'] >> map(obj.strip().lower()) == ['a,b', 'c']
+    assert ['a', 'B', 'c'] >> filter(obj.islower()) == ['a', 'c']
+    assert ['a', 'B'] >> lazy.map(obj.upper()) >> lazy.to_list == ['A', 'B']
+    assert 'a b c' >> obj.split(maxsplit = 1) == ['a', 'b c']
+    assert 3 >> obj.real.imag == 0
+    assert (lambda: 2) >> obj() == 2
+
+
+def test_compiled_chains_are_plain_functions():
+    f = as_function(obj.strip().split(','))
+    assert f(' a,b ') == ['a', 'b']
+    assert as_function(abs) is abs
+    # Chains with the same shape share the generated code, but not the arguments
+    g = as_function(obj.strip().split(';'))
+    assert g.__code__ is f.__code__ and g(' a;b ') == ['a', 'b']
+    assert compile_chain((('attr', 'not-a-name'),))(type('T', (), {'not-a-name': 1})) == 1
+
+
+def test_attr():
+    assert 3 >> attr.real == 3
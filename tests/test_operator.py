@@ -1,7 +1,98 @@
-from composable import operator
+from composable import operator, instrument
+from composable.pipeable import fast_pipeable
+from composable.operator import is_lt, is_le, is_eq, is_ne, is_ge, is_gt, predicate, Predicate
+from composable.strict import filter, map
+import pickle
+import pytest
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
 
 add = operator.add
 
 # def test_add():
 #     assert 2 >> add(3) == 5
-#     assert "a" >> add("b") == "ba"
\ No newline at end of file
+#     assert "a" >> add("b") == "ba"
+
+
+def test_comparisons():
+    assert 3 >> is_gt(2) and not 2 >> is_gt(2)
+    assert 2 >> is_ge(2) and 1 >> is_lt(2) and 2 >> is_le(2)
+    assert 2 >> is_eq(2) and 3 >> is_ne(2)
+    assert is_gt(2, 3) is True
+    assert is_gt(2)(3) is True
+    # They are fast_pipeable stages, with a Predicate once only the tested value is missing
+    assert isinstance(is_gt, fast_pipeable) and isinstance(is_gt(b = 2), Predicate)
+    assert is_gt(a = 3)(2) is True and 3 >> is_gt(a = 1) is False
+    assert pickle.loads(pickle.dumps(is_gt)) is is_gt
+
+
+def test_comparisons_are_instrumented():
+    with instrument.instrumented() as stats:
+        assert 3 >> is_gt(2)
+    assert stats.report()['Predicate(lambda x: (x > 2))']['calls'] == 1
+    # Functions are named without their address, so the keys are the same in every run
+    p = is_gt(0) & predicate(abs)
+    with instrument.instrumented() as stats:
+        assert 3 >> p
+    assert list(stats.report()) == ['Predicate(lambda x: ((x > 0) and builtins.abs(x)))']
+
+
+def test_predicate_algebra():
+    in_range = is_gt(0) & is_lt(10)
+    assert isinstance(in_range, Predicate)
+    assert range(-2, 13) >> filter(in_range) == list(range(1, 10))
+    assert range(-2, 13) >> filter(~in_range) == [-2, -1, 0, 10, 11, 12]
+    assert range(-2, 13) >> filter(in_range & ~is_eq(5) | is_eq(12)) == [1, 2, 3, 4, 6, 7, 8, 9, 12]
+    assert range(5) >> filter(is_ge(1) & is_le(3) & (lambda x: x % 2 == 1)) == [1, 3]
+    assert ['1', 'a', '22'] >> filter(predicate(str.isdigit) & ~predicate(lambda s: len(s) > 1)) == ['1']
+    assert ~~in_range is not in_range and (~~in_range).node == in_range.node
+    # The bounds are fused into one comparison chain
+    assert '0 < x < 10' in repr(in_range)
+
+
+def test_predicate_keeps_evaluation_order():
+    calls = []
+    def record(x):
+        calls.append(x)
+        return True
+    # The function between the bounds only sees values that passed the first bound
+    p = is_lt(10) & record & is_gt(0)
+    assert range(-2, 13) >> filter(p) == list(range(1, 10))
+    assert calls == list(range(-2, 10))
+    # Only a lower bound directly followed by an upper bound is fused
+    assert '((x > 0) and (x == 5) and (x < 10))' in repr(is_gt(0) & is_eq(5) & is_lt(10))
+    assert '((x < 10) and (x > 0))' in repr(is_lt(10) & is_gt(0))
+
+
+def test_predicate_short_circuits():
+    calls = []
+    def record(x):
+        calls.append(x)
+        return True
+    assert range(5) >> filter(is_gt(2) & record) == [3, 4]
+    assert calls == [3, 4]
+
+
+@pytest.mark.skipif(np is None, reason = 'numpy is not installed')
+def test_predicate_numpy_mask():
+    arr = np.arange(-5, 15)
+    p = (is_gt(0) & is_lt(10)) | is_eq(12)
+    out = arr >> filter(p)
+    assert isinstance(out, np.ndarray) and out.tolist() == [1, 2, 3, 4, 5, 6, 7, 8, 9, 12]
+    mask = arr >> p
+    assert isinstance(mask, np.ndarray) and mask.dtype == bool and mask.sum() == 10
+    assert (arr >> is_gt(0)).dtype == bool
+    assert (arr >> filter(~p)).tolist() == [-5, -4, -3, -2, -1, 0, 10, 11, 13, 14]
+    assert (arr >> map(p)).tolist() == (arr >> map(lambda x: bool(p(x))))
+    # Non-vectorized parts fall back to testing each element
+    assert arr >> filter(p & (lambda x: x % 2 == 0)) == [2, 4, 6, 8, 12]
+
+
+def test_predicate_pickles_after_use():
+    p = is_gt(1) & is_lt(5)
+    assert p(3) and 4 >> p
+    q = pickle.loads(pickle.dumps(p))
+    assert q.node == p.node and range(7) >> filter(q) == [2, 3, 4]
@@ -0,0 +1,39 @@
+from composable import origami
+from composable.sequence import to_list
+from itertools import islice
+from operator import add
+
+_empty = lambda s: s == 0
+_step = lambda s: (s, s - 1)
+_cumsum = lambda acc, x: (acc + x, acc + x)
+
+
+def test_unfolds():
+    assert 4 >> origami.unfoldr(_empty, _step) == [4, 3, 2, 1]
+    assert 4 >> origami.unfoldl(_empty, _step) == [1, 2, 3, 4]
+    assert 0 >> origami.unfoldr(_empty, _step) == []
+    assert 0 >> origami.unfoldl(_empty, _step) == []
+
+
+def test_unfold_iters():
+    assert [0, 1, 2, 3, 4] >> origami.unfoldr_iter(_cumsum, 0) == [0, 1, 3, 6, 10]
+    assert [0, 1, 2, 3, 4] >> origami.unfoldl_iter(_cumsum, 0) == [10, 10, 9, 7, 4]
+
+
+def test_unfolds_are_linear():
+    n = 200_000
+    assert len(n >> origami.unfoldr(_empty, _step)) == n
+    assert len(range(n) >> origami.unfoldl_iter(_cumsum, 0)) == n
+
+
+def test_lazy_unfolds():
+    assert 4 >> origami.iunfoldr(_empty, _step) >> to_list == [4, 3, 2, 1]
+    naturals = 0 >> origami.iunfoldr(lambda s: False, lambda s: (s, s + 1))
+    assert list(islice(naturals, 3)) == [0, 1, 2]
+    assert iter([0, 1, 2, 3, 4]) >> origami.iunfoldr_iter(_cumsum, 0) >> to_list == [0, 1, 3, 6, 10]
+
+
+def test_scan():
+    assert [1, 2, 3, 4] >> origami.scan(add, 0) >> to_list == [1, 3, 6, 10]
+    assert [] >> origami.scan(add, 0) >> to_list == []
+    assert list([1, 2, 3] >> origami.scan(add, 0))[-1] == [1, 2, 3] >> origami.fold(add, 0)
@@ -0,0 +1,41 @@
+import composable.parallel as parallel
+import composable.strict as strict
+from concurrent.futures import ThreadPoolExecutor
+from operator import add, neg
+import pytest
+
+
+def is_odd(x):
+    return x % 2 == 1
+
+
+def test_map():
+    L = list(range(100))
+    assert L >> parallel.map(neg, workers=2) == L >> strict.map(neg)
+    assert L >> parallel.map(neg, executor='thread', chunksize=7) == L >> strict.map(neg)
+    assert [] >> parallel.map(neg) == []
+
+
+def test_unordered():
+    L = list(range(100))
+    out = L >> parallel.map(neg, executor='thread', chunksize=3, ordered=False)
+    assert sorted(out) == sorted(L >> strict.map(neg))
+
+
+def test_star_map_and_filter():
+    vals = list(zip(range(20), range(2, 22)))
+    assert vals >> parallel.star_map(add, workers=2) == vals >> strict.star_map(add)
+    assert range(20) >> parallel.filter(is_odd, workers=2) == range(20) >> strict.filter(is_odd)
+
+
+def test_reused_pool():
+    with ThreadPoolExecutor(2) as pool:
+        assert range(5) >> parallel.map(lambda x: x * 2, pool=pool) == [0, 2, 4, 6, 8]
+        assert range(5) >> parallel.filter(is_odd, pool=pool) == [1, 3]
+
+
+def test_bad_arguments():
+    with pytest.raises(ValueError):
+        range(5) >> parallel.map(neg, executor='gpu')
+    with pytest.raises(ValueError):
+        range(5) >> parallel.map(neg, chunksize=0)
@@ -1,4 +1,7 @@
-from composable.pipeable import pipeable
+from composable import strict
+from composable.pipeable import pipeable, fast_pipeable
+from functools import update_wrapper
+import pickle
 
 def test_pipeable_lambda():
     my_pow = pipeable(lambda x, y: x**y)
@@ -14,4 +17,49 @@ def test_pipeable_decorator():
         return x**y
     assert callable(my_pow(3))
     assert (2 >> my_pow(3)) == my_pow(3, 2)
-    assert my_pow(3)(2) == my_pow(3, 2)
\ No newline at end of file
+    assert my_pow(3)(2) == my_pow(3, 2)
+
+def test_fast_pipeable_matches_pipeable():
+    my_pow = fast_pipeable(lambda x, y: x**y)
+    assert callable(my_pow(3))
+    assert (2 >> my_pow(3)) == my_pow(3, 2)
+    assert my_pow(3)(2) == my_pow(3, 2)
+    assert my_pow()(3)(2) == 9
+
+
+def test_fast_pipeable_keywords():
+    @fast_pipeable
+    def f(a, b, c = 0, *, d):
+        return (a, b, c, d)
+
+    assert (2 >> f(1, d=3)) == (1, 2, 0, 3)
+    assert f(1)(2, d=3) == (1, 2, 0, 3)
+    assert (2 >> f(1, c=5)(d=4)) == (1, 2, 5, 4)
+    assert f(1, 2, d=3) == (1, 2, 0, 3)
+
+
+def test_fast_pipeable_metadata_and_pickle():
+    assert strict.map.__name__ == 'map'
+    assert 'strict version' in strict.map.__doc__
+    stage = pickle.loads(pickle.dumps(strict.map(abs)))
+    assert ([-1, 2] >> stage) == [1, 2]
+
+
+def _double(x):
+    return 2 * x
+
+
+class _Wrapper(object):
+    def __init__(self, func):
+        self.func = func
+        update_wrapper(self, func)
+
+    def __call__(self, x):
+        return self.func(x) + 1
+
+
+def test_fast_pipeable_pickles_name_copying_wrappers_by_value():
+    # The wrapper copies _double's name, which must not restore the bare function
+    stage = pickle.loads(pickle.dumps(fast_pipeable(_Wrapper(_double))))
+    assert isinstance(stage.func, _Wrapper) and 3 >> stage == 7
+    assert pickle.loads(pickle.dumps(fast_pipeable(_double))).func is _double
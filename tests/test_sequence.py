@@ -1,6 +1,9 @@
+from composable import strict
 from composable.pipeable import pipeable
 import composable.sequence as l
+from itertools import count
 from operator import add
+import pytest
 
 def test_to_list():
     assert isinstance(l.to_list(range(5)), list) 
@@ -42,4 +45,29 @@ def test_reduce():
     assert l.reduce(add, s2, 0) == 0
     assert (s2 >> l.reduce(add, init=0)) == 0
 
-    
\ No newline at end of file
+    
+
+def test_batched():
+    assert range(7) >> l.batched(3) >> l.to_list == [(0, 1, 2), (3, 4, 5), (6,)]
+    assert [] >> l.batched(3) >> l.to_list == []
+    assert iter(range(4)) >> l.batched(2) >> strict.map(sum) == [1, 5]
+    assert range(7) >> l.batched(3) >> l.unbatch >> l.to_list == list(range(7))
+    with pytest.raises(ValueError):
+        l.batched(0, [1])
+
+
+def test_batched_is_lazy():
+    batches = count() >> l.batched(2)
+    assert next(batches) == (0, 1)
+    assert next(batches) == (2, 3)
+
+
+def test_windowed():
+    assert range(5) >> l.windowed(3) >> l.to_list == [(0, 1, 2), (1, 2, 3), (2, 3, 4)]
+    assert range(2) >> l.windowed(3) >> l.to_list == []
+    for step in (1, 2, 3, 5):
+        for n in range(10):
+            expected = [tuple(range(i, i + 3)) for i in range(0, n - 2, step)]
+            assert iter(range(n)) >> l.windowed(3, step = step) >> l.to_list == expected
+    with pytest.raises(ValueError):
+        l.windowed(2, [1], step = 0)
@@ -1,6 +1,13 @@
 import composable.strict as strict
+from composable.operator import is_gt
 from operator import add
 from toolz.curried.operator import add, mul
+import pytest
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
 
 def test_map():
     f = lambda x: x**2
@@ -65,4 +72,20 @@ def test_sorted():
 
 
 def test_split_by():
-    assert 3 >> strict.split_by([add(1), add(2), mul(3)]) == [4, 5, 9]
\ No newline at end of file
+    assert 3 >> strict.split_by([add(1), add(2), mul(3)]) == [4, 5, 9]
+
+@pytest.mark.skipif(np is None, reason = 'numpy is not installed')
+def test_numpy_vectorized():
+    arr = np.array([-1.0, 4.0, 9.0])
+    out = arr >> strict.map(np.abs)
+    assert isinstance(out, np.ndarray) and out.tolist() == [1.0, 4.0, 9.0]
+    out = arr >> strict.filter(is_gt(0))
+    assert isinstance(out, np.ndarray) and out.tolist() == [4.0, 9.0]
+    out = arr >> strict.map(strict.vectorized(lambda x: 2 * x))
+    assert isinstance(out, np.ndarray) and out.tolist() == [-2.0, 8.0, 18.0]
+    # Builtins don't take the marker attribute and are wrapped instead
+    out = arr >> strict.map(strict.vectorized(abs))
+    assert isinstance(out, np.ndarray) and out.tolist() == [1.0, 4.0, 9.0]
+    # Unmarked functions are still applied elementwise
+    assert arr >> strict.map(lambda x: x > 0) == [False, True, True]
+    assert [1, -2] >> strict.filter(is_gt(0)) == [1]
@@ -1,5 +1,6 @@
 import composable.string as s
 import pytest
+import re
 
 def test_split():
     start = ', '.join(map(str, range(5)))
@@ -67,3 +68,32 @@ def test_join():
     #         self.fail('join() ate exception message')
     # else:
     #     self.fail('exception not raised')
+
+
+def test_regex_family():
+    assert 'a1b22c' >> s.sub_re('[0-9]+', '#') == 'a#b#c'
+    assert 'a1b22c' >> s.sub_re('[0-9]', '#', count = 2) == 'a#b#2c'
+    assert 'a1b22c' >> s.findall_re('[0-9]+') == ['1', '22']
+    assert ('a1b22c' >> s.search_re('[0-9]+')).group() == '1'
+    assert 'a1b22c' >> s.match_re('[0-9]+') is None
+    assert 'ABC' >> s.fullmatch_re('abc', flags = re.IGNORECASE)
+    assert 'abcd' >> s.fullmatch_re('abc') is None
+
+
+def test_regex_batch():
+    L = ['a1', 'b22', 'c']
+    assert L >> s.sub_re_many('[0-9]', '#') == ['a#', 'b##', 'c']
+    assert L >> s.findall_re_many('[0-9]') == [['1'], ['2', '2'], []]
+    assert L >> s.split_re_many('[0-9]+') == [['a', ''], ['b', ''], ['c']]
+    assert [m is not None for m in L >> s.search_re_many('[0-9]')] == [True, True, False]
+    assert [m is not None for m in L >> s.match_re_many('[a-b]')] == [True, True, False]
+    assert [m is not None for m in L >> s.fullmatch_re_many('[a-z]')] == [False, False, True]
+
+
+def test_regex_cache_stats():
+    s.clear_regex_cache()
+    for _ in range(3):
+        'x' >> s.findall_re('cache-test-[0-9]')
+    info = s.regex_cache_info()
+    assert (info['hits'], info['misses'], info['currsize']) == (2, 1, 1)
+    assert info['maxsize'] == s.REGEX_CACHE_SIZE
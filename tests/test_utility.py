@@ -0,0 +1,47 @@
+from composable import utility
+from composable.sequence import to_list
+
+
+def test_read_lines(tmp_path):
+    path = tmp_path / 'lines.txt'
+    path.write_text('a\nbb\n\nccc')
+    assert path >> utility.read_lines >> to_list == ['a', 'bb', '', 'ccc']
+    assert path >> utility.read_lines(keepends=True) >> to_list == ['a\n', 'bb\n', '\n', 'ccc']
+    assert path >> utility.read_lines(mode='rb') >> to_list == [b'a', b'bb', b'', b'ccc']
+
+
+def test_read_records(tmp_path):
+    path = tmp_path / 'records.txt'
+    records = ['r%d' % i * (i % 5 + 1) for i in range(50)]
+    path.write_text('||'.join(records) + '||')
+    for chunk_size in (1, 2, 3, 7, 1 << 20):
+        assert path >> utility.read_records('||', chunk_size=chunk_size) >> to_list == records
+    assert path >> utility.read_records(b'||', mode='rb', chunk_size=4) >> to_list == [r.encode() for r in records]
+    path.write_text('')
+    assert path >> utility.read_records('\n') >> to_list == []
+
+
+def test_read_records_separator_across_chunks(tmp_path):
+    path = tmp_path / 'records.txt'
+    path.write_text('a|||b|||c')
+    # Each separator spans three chunks of size 1
+    for chunk_size in (1, 2):
+        assert path >> utility.read_records('|||', chunk_size=chunk_size) >> to_list == ['a', 'b', 'c']
+    path.write_bytes(b'ab<sep>cd<sep>')
+    assert path >> utility.read_records(b'<sep>', mode='rb', chunk_size=2) >> to_list == [b'ab', b'cd']
+
+
+def test_mmap_records(tmp_path):
+    path = tmp_path / 'records.bin'
+    path.write_bytes(b'a\nbb\n\nccc\n')
+    out = path >> utility.mmap_records(b'\n') >> to_list
+    assert all(isinstance(r, memoryview) for r in out)
+    assert [bytes(r) for r in out] == [b'a', b'bb', b'', b'ccc']
+    path.write_bytes(b'')
+    assert path >> utility.mmap_records(b'\n') >> to_list == []
+
+
+def test_with_mmap(tmp_path):
+    path = tmp_path / 'data.bin'
+    path.write_bytes(b'0123456789')
+    assert path >> utility.with_mmap(lambda m: m[3:6]) == b'345'